@@ -0,0 +1,1033 @@
+# -*- encoding: utf-8 -*-
+
+
+"""Benchmarks for the binding generator and the generated bindings.
+
+Usage:
+
+    python benchmark.py [name ...] [--save FILE] [--baseline FILE]
+
+Runs every benchmark when no name is given. `--save` writes the results
+and `--baseline` compares to saved ones, to track regressions across
+generator changes (see `main`).
+"""
+
+
+import os
+import sys
+import ctypes
+import ctypes.util
+import timeit
+import tracemalloc
+import array
+import tempfile
+import shutil
+import subprocess
+import importlib
+import importlib.util
+import functools
+import contextlib
+import io
+import json
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+import rlctbg
+
+
+__all__ = ['main']
+
+# region HELPERS
+
+
+# the time per operation (us) of each reported title in this run and in the
+# baseline run it is compared to (see `main`)
+RESULTS: Dict[str, float] = {}
+BASELINE: Dict[str, float] = {}
+REGRESSION_THRESHOLD: float = 0.10
+
+
+def report(title: str, seconds: float, number: int = 1):
+    per_op: float = seconds / number * 1e6
+    RESULTS[title] = per_op
+    line: str = f"    {title:<48} {per_op:>12.2f} us"
+    if title in BASELINE:
+        change: float = per_op / BASELINE[title] - 1
+        line += f" {change:>+8.1%}{'  REGRESSION' if change > REGRESSION_THRESHOLD else ''}"
+    print(line)
+
+
+def measure(stmt: str, number: int = 100000, repeat: int = 5, **names) -> float:
+    """Returns the best total time of `repeat` runs of `stmt` executed `number` times."""
+    return min(timeit.repeat(stmt, globals=names, number=number, repeat=repeat))
+
+
+def build_library(folder: str, source: str, name: str = 'bench') -> Optional[str]:
+    """Compiles a C source into a shared library with the local C compiler."""
+    c_file: str = os.path.join(folder, f"{name}.c")
+    lib_file: str = os.path.join(folder, f"lib{name}.so")
+    with open(c_file, 'w') as output:
+        output.write(source)
+    try:
+        subprocess.run([os.environ.get('CC', 'cc'), '-shared', '-fPIC', '-O2', '-o', lib_file, c_file],
+                       check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as error:
+        print(f"    skipped: unable to build {lib_file} ({error})")
+        return None
+    return lib_file
+
+
+def synthetic_header(folder: str, lines: int) -> str:
+    """Writes a header of at least `lines` lines made of copies of raylib.h."""
+    with open(os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h"), 'r') as src:
+        source: List[str] = src.readlines()
+    location: str = os.path.join(folder, f"synthetic_{lines}.h")
+    with open(location, 'w') as output:
+        for _ in range(-(-lines // len(source))):
+            output.writelines(source)
+    return location
+
+
+def generated_structs() -> Dict:
+    """Runs the generated structures and runtime helpers against ctypes alone (no library needed)."""
+    header: rlctbg.HeaderData = rlctbg.load_header(
+        os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h"))
+    lines: List[str] = ["import sys", "import os", "import ctypes", "from ctypes import *", "from struct import Struct, error as StructError",
+                        "from itertools import chain, repeat, starmap", "from collections import deque",
+                        "from numbers import Real", "from contextlib import contextmanager",
+                        "from functools import lru_cache as _lru_cache", "from time import perf_counter as _perf_counter"]
+    # no native shim next to the benchmark: `_native` is None until a caller sets it
+    lines.extend(rlctbg.FRAME_SRC + rlctbg.TELEMETRY_SRC + rlctbg.NUMPY_SRC + rlctbg.NATIVE_SRC + rlctbg.DISPLAY_LISTS_SRC
+                 + rlctbg.CALL_LOGS_SRC)
+    structs: List = [d for d in header.declarations if d.kind in ('struct', 'typedef')]
+    for declaration in structs:
+        declaration.convert(lines, [])
+    lines.append("_dtype_fields = {")
+    for declaration in structs:
+        if declaration.kind == 'struct':
+            declaration.convert_dtype(lines)
+    lines.append("}")
+    namespace: Dict = {'__file__': os.path.join(tempfile.gettempdir(), 'generated.py')}
+    exec('\n'.join(lines), namespace)
+    return namespace
+
+
+# representative raylib signatures: scalars, by-value structs, struct returns and strings
+SIGNATURES_CDEF = """
+typedef struct Vector2 { float x; float y; } Vector2;
+typedef struct Rectangle { float x; float y; float width; float height; } Rectangle;
+typedef struct Color { unsigned char r; unsigned char g; unsigned char b; unsigned char a; } Color;
+int GetRandomValue(int min, int max);
+void DrawRectangleRec(Rectangle rec, Color color);
+void DrawLineV(Vector2 startPos, Vector2 endPos, Color color);
+Color Fade(Color color, float alpha);
+int MeasureText(const char *text, int fontSize);
+"""
+
+SIGNATURES_SRC = SIGNATURES_CDEF + """
+int GetRandomValue(int min, int max) { return min; }
+void DrawRectangleRec(Rectangle rec, Color color) { }
+void DrawLineV(Vector2 startPos, Vector2 endPos, Color color) { }
+Color Fade(Color color, float alpha) { color.a = (unsigned char)(color.a * alpha); return color; }
+int MeasureText(const char *text, int fontSize) { return fontSize; }
+"""
+
+# endregion (helpers)
+# ---------------------------------------------------------
+# region BENCHMARKS
+
+
+def bench_wrap_header():
+    """Cold-start cost of `wrap_header()`: full generation vs manifest hit."""
+    header: str = os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h")
+    folder: str = tempfile.mkdtemp()
+    try:
+        output: str = os.path.join(folder, "raylib.py")
+        number: int = 10
+
+        seconds: float = timeit.timeit(lambda: rlctbg.wrap_header(header, output, force=True), number=number)
+        report("wrap_header (regenerate)", seconds, number)
+
+        seconds = timeit.timeit(lambda: rlctbg.wrap_header(header, output), number=number)
+        report("wrap_header (up to date)", seconds, number)
+
+        with open(output, 'r') as src:
+            source: str = src.read()
+        seconds = timeit.timeit(lambda: compile(source, output, 'exec'), number=number)
+        report("bytecode compile of output (saved by a hit)", seconds, number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_import():
+    """Cold import of the generated binding (a fresh interpreter with the
+    bytecode cached, `-X importtime` cumulative time) and the memory it
+    allocates (`tracemalloc` peak), eager vs `lazy`, `split` and both."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            # the bytecode is written and read, as it is by applications
+            environment: Dict = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+            for title, options in (("eager", {}), ("lazy", {'lazy': True}), ("split", {'split': True}),
+                                   ("lazy + split", {'lazy': True, 'split': True})):
+                name: str = f"import_{title.replace(' + ', '_')}"
+                rlctbg.wrap_header(path_to_output=os.path.join(folder, name if options.get('split') else f"{name}.py"),
+                                   force=True, **options)
+                run: Callable = functools.partial(subprocess.run, capture_output=True, text=True, check=True,
+                                                  cwd=folder, env=environment)
+                run([sys.executable, '-c', f"import {name}"])  # caches the bytecode
+                totals: List[int] = []
+                owns: List[int] = []
+                for _ in range(10):
+                    trace: List[List[str]] = [line.split('|') for line in run(
+                        [sys.executable, '-X', 'importtime', '-c', f"import {name}"]).stderr.splitlines()[1:]]
+                    totals.extend(int(row[1]) for row in trace if row[2].strip() == name)
+                    # the binding modules alone, without the standard modules they import
+                    owns.append(sum(int(row[0].split(':')[1]) for row in trace
+                                    if row[2].strip() == name or row[2].strip().startswith(f"{name}.")))
+                report(f"import ({title})", min(totals) * 1e-6)
+                report(f"import ({title}), binding modules alone", min(owns) * 1e-6)
+                peak: str = run([sys.executable, '-c', "import tracemalloc; tracemalloc.start(); "
+                                 f"import {name}; print(tracemalloc.get_traced_memory()[1])"]).stdout
+                print(f"    {f'import ({title}) peak memory':<48} {int(peak.split()[-1]) / 1024:>12.1f} KiB")
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_generation():
+    """Parse and generation time over synthetic headers of 10k to 100k lines."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        for lines in (10000, 25000, 50000, 100000):
+            header: str = synthetic_header(folder, lines)
+            output: str = os.path.join(folder, "raylib.py")
+            number: int = 3
+
+            seconds: float = measure("rlctbg.parse_header(header)", 1, number, rlctbg=rlctbg, header=header)
+            report(f"parse_header ({lines} lines)", seconds)
+
+            parsed: rlctbg.HeaderData = rlctbg.parse_header(header)
+            seconds = measure("rlctbg.generate(parsed, output)", 1, number, rlctbg=rlctbg, parsed=parsed, output=output)
+            report(f"generate ({lines} lines)", seconds)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_parse_headers():
+    """Parsing four 25k lines headers in process vs in parallel worker processes."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        headers: List[str] = []
+        for i in range(4):
+            os.makedirs(os.path.join(folder, str(i)))
+            headers.append(shutil.move(synthetic_header(folder, 25000), os.path.join(folder, str(i), "header.h")))
+
+        def parse(workers: int):
+            for header in headers:
+                if os.path.exists(rlctbg.ir_cache_path(header)):
+                    os.remove(rlctbg.ir_cache_path(header))
+            rlctbg.parse_headers(headers, workers)
+
+        report("parse_headers (4 x 25000 lines, 1 worker)", measure("parse(1)", 1, 3, parse=parse))
+        # the workers are capped to the usable CPUs
+        print(f"    {'usable CPUs':<48} {rlctbg.usable_cpus():>12}")
+        report("parse_headers (4 x 25000 lines, 4 workers)", measure("parse(4)", 1, 3, parse=parse))
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_struct_memory():
+    """Per-instance footprint of the structures of `rlctbg.raylib` with their
+    `__slots__` and without (a subclass, which gets a `__dict__`)."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            with contextlib.redirect_stdout(io.StringIO()):
+                rl = importlib.import_module('rlctbg.raylib')
+            number: int = 100000
+            for name in ('Vector2', 'Vector3', 'Color', 'Rectangle', 'Camera3D'):
+                for slots in (False, True):
+                    cls: type = getattr(rl, name)
+                    if not slots:
+                        cls = type(name, (cls,), {})
+
+                    tracemalloc.start()
+                    instances: List = [cls() for _ in range(number)]
+                    size, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    del instances
+                    title: str = f"{name} ({'__slots__' if slots else '__dict__'})"
+                    print(f"    {title:<48} {size / number:>12.1f} bytes")
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_struct_construction():
+    """Time and memory per construction of the hot structures: constructor vs
+    `make`, `set` and `scratch` (a frame of 1000 instances, then `end_drawing`)."""
+    namespace: Dict = generated_structs()
+
+    def end_drawing():
+        for hook in namespace['_frame_hooks']:
+            hook()
+
+    number: int = 1000
+    for name, args in (('Vector2', "1.0, 2.0"), ('Rectangle', "1.0, 2.0, 3.0, 4.0"), ('Color', "1, 2, 3, 4")):
+        names: Dict = {'cls': namespace[name], 'obj': namespace[name](), 'end_drawing': end_drawing}
+        for title, stmt in ((f"{name}({args})", f"cls({args})"),
+                            (f"{name}.make({args})", f"cls.make({args})"),
+                            (f"{name}().set({args})", f"obj.set({args})"),
+                            (f"{name}.scratch({args})", f"cls.scratch({args})")):
+            frame: str = f"frame = [{stmt} for _ in range({number})]; end_drawing()"
+            seconds: float = measure(frame, 100, **names)
+
+            exec(frame, names)  # warms the scratch pools up
+            tracemalloc.start()
+            exec(f"frame = [{stmt} for _ in range({number})]", names)
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            end_drawing()
+            print(f"    {title:<40} {seconds / (100 * number) * 1e6:>8.2f} us {size / number:>8.1f} bytes")
+
+
+def bench_numpy_views():
+    """Updating 100k Vector2 positions: per-element ctypes vs NumPy on a zero-copy view."""
+    try:
+        import numpy
+    except ImportError:
+        print("    skipped: numpy is not installed")
+        return
+
+    namespace: Dict = generated_structs()
+    vector2: type = namespace['Vector2']
+    count: int = 100000
+    positions = (vector2 * count)()
+    velocities = numpy.ones((count, 2), numpy.float32)
+
+    def update_ctypes():
+        for position, (dx, dy) in zip(positions, velocities.tolist()):
+            position.x += dx
+            position.y += dy
+
+    view = namespace['as_array'](positions)
+
+    def update_numpy():
+        view['x'] += velocities[:, 0]
+        view['y'] += velocities[:, 1]
+
+    points = numpy.zeros((count, 2), numpy.float32)
+
+    def update_and_hand_over():
+        numpy.add(points, velocities, out=points)
+        return namespace['as_ctypes'](points, vector2)
+
+    report(f"per element ({count} Vector2)", measure("update()", 1, 3, update=update_ctypes))
+    report(f"as_array view ({count} Vector2)", measure("update()", 10, 3, update=update_numpy), 10)
+    report(f"ndarray + as_ctypes ({count} Vector2)", measure("update()", 10, 3, update=update_and_hand_over), 10)
+
+
+def bench_buffer_args():
+    """Drawing a 10k points polyline from Python data: (Vector2 * n) built per
+    point vs contiguous buffers passed through (`draw_line_strip`)."""
+    try:
+        import numpy
+    except ImportError:
+        print("    skipped: numpy is not installed")
+        return
+
+    folder: str = tempfile.mkdtemp()
+    try:
+        source: str = SIGNATURES_CDEF + "void DrawLineStrip(Vector2 *points, int numPoints, Color color) { }\n"
+        lib_file: Optional[str] = build_library(folder, source)
+        if lib_file is None:
+            return
+
+        namespace: Dict = generated_structs()
+        namespace['_rl'] = ctypes.CDLL(lib_file)
+        header: rlctbg.HeaderData = rlctbg.load_header(
+            os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h"))
+        lines: List[str] = []
+        next(f for f in header.functions if f.name == 'DrawLineStrip').convert(lines, [])
+        exec('\n'.join(lines), namespace)
+
+        count: int = 10000
+        vector2: type = namespace['Vector2']
+        points = numpy.random.rand(count, 2).astype(numpy.float32)
+        pairs: List = points.tolist()
+        names: Dict = {
+            'draw_line_strip': namespace['draw_line_strip'], 'color': namespace['Color'](), 'count': count,
+            'Vector2': vector2, 'pairs': pairs, 'points': points, 'floats': array.array('f', points.ravel()),
+        }
+        report(f"(Vector2 * n) per point ({count} points)",
+               measure("draw_line_strip((Vector2 * count)(*[Vector2(x, y) for x, y in pairs]), count, color)",
+                       10, 3, **names), 10)
+        report(f"float32 ndarray ({count} points)", measure("draw_line_strip(points, count, color)", 1000, 3, **names), 1000)
+        report(f"array('f') ({count} points)", measure("draw_line_strip(floats, count, color)", 1000, 3, **names), 1000)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_batches():
+    """Drawing N rectangles, circles and lines: one wrapper call per item vs
+    one batched call (`draw_rectangles`, `draw_circles`, `draw_lines`),
+    looping in Python (no shim, on arrays and on lists of structures) and in
+    the compiled native shim."""
+    try:
+        import numpy
+    except ImportError:
+        print("    skipped: numpy is not installed")
+        return
+
+    folder: str = tempfile.mkdtemp()
+    try:
+        source: str = SIGNATURES_CDEF + "void DrawCircleV(Vector2 center, float radius, Color color) { }\n"
+        lib_file: Optional[str] = build_library(folder, SIGNATURES_SRC.replace(SIGNATURES_CDEF, source))
+        if lib_file is None:
+            return
+
+        namespace: Dict = generated_structs()
+        namespace['_rl'] = ctypes.CDLL(lib_file)
+        header: rlctbg.HeaderData = rlctbg.load_header(
+            os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h"))
+        functions: List = [f for f in header.functions if f.name in ('DrawRectangleRec', 'DrawCircleV', 'DrawLineV')]
+        lines: List[str] = []
+        batches: List = rlctbg.batch_functions(functions)
+        for func in functions + batches:
+            func.convert(lines, [])
+        exec('\n'.join(lines), namespace)
+
+        c_file: str = rlctbg.write_native(header.declarations, batches, [], os.path.join(folder, "native"))[0]
+        with open(c_file, 'r') as src:
+            native_file: Optional[str] = build_library(folder, src.read(), 'native')
+        if native_file is None:
+            return
+
+        for count in (100, 1000, 10000, 100000):
+            rng = numpy.random.default_rng(0)
+            names: Dict = {name: namespace[name] for name in
+                           ('draw_rectangle_rec', 'draw_circle_v', 'draw_line_v', 'draw_rectangles', 'draw_circles',
+                            'draw_lines')}
+            names.update({
+                'recs_list': [namespace['Rectangle'](*r) for r in rng.random((count, 4)).tolist()],
+                'colors_list': [namespace['Color'](1, 2, 3, 4) for _ in range(count)],
+                'recs': rng.random((count, 4)).astype(numpy.float32),
+                'centers': rng.random((count, 2)).astype(numpy.float32),
+                'radii': rng.random(count).astype(numpy.float32),
+                'colors': rng.integers(0, 255, (count, 4)).astype(numpy.uint8),
+                'color': namespace['Color'](1, 2, 3, 4),
+            })
+            names['centers_list'] = [namespace['Vector2'](*c) for c in names['centers'].tolist()]
+            names['radii_list'] = names['radii'].tolist()
+            number: int = max(1, 10000 // count)
+            report(f"draw_rectangle_rec per item (N={count})",
+                   measure("for rec, c in zip(recs_list, colors_list): draw_rectangle_rec(rec, c)", number, 3, **names),
+                   number)
+            report(f"draw_circle_v per item (N={count})",
+                   measure("for c, r in zip(centers_list, radii_list): draw_circle_v(c, r, color)", number, 3, **names),
+                   number)
+            report(f"draw_line_v per item (N={count})",
+                   measure("for s, c in zip(centers_list, colors_list): draw_line_v(s, s, c)", number, 3, **names),
+                   number)
+            for loop, native in (("python loop", None), ("native loop", ctypes.CDLL(native_file))):
+                namespace['_native'] = native
+                namespace['_native_loops'].clear()
+                report(f"draw_rectangles, {loop} (N={count})",
+                       measure("draw_rectangles(recs, colors)", number, 3, **names), number)
+                report(f"draw_rectangles(lists), {loop} (N={count})",
+                       measure("draw_rectangles(recs_list, colors_list)", number, 3, **names), number)
+                report(f"draw_circles, {loop} (N={count})",
+                       measure("draw_circles(centers, radii, color)", number, 3, **names), number)
+                report(f"draw_lines, {loop} (N={count})",
+                       measure("draw_lines(centers, centers, colors)", number, 3, **names), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_commands():
+    """A frame of N draw calls: one wrapper call per draw vs recording them in
+    a `CommandBuffer` run by one foreign call (recorded every frame, or once
+    and submitted again)."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        lib_file: Optional[str] = build_library(folder, SIGNATURES_SRC)
+        if lib_file is None:
+            return
+
+        namespace: Dict = generated_structs()
+        namespace['_rl'] = ctypes.CDLL(lib_file)
+        header: rlctbg.HeaderData = rlctbg.load_header(
+            os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h"))
+        functions: List = [f for f in header.functions if f.name in ('DrawRectangleRec', 'DrawLineV')]
+        commands: List = rlctbg.command_functions(functions)
+        lines: List[str] = []
+        for func in functions:
+            func.convert(lines, [])
+        lines.extend(rlctbg.COMMANDS_SRC)
+        for opcode, func in enumerate(commands):
+            func.convert_command(lines, opcode)
+        lines.append(f"_command_names = {dict((func.name, func.py_name) for func in commands)!r}")
+        exec('\n'.join(lines), namespace)
+
+        c_file: str = rlctbg.write_native(header.declarations, [], commands, os.path.join(folder, "native"))[0]
+        with open(c_file, 'r') as src:
+            native_file: Optional[str] = build_library(folder, src.read(), 'native')
+        if native_file is None:
+            return
+        namespace['_native'] = ctypes.CDLL(native_file)
+
+        Rectangle, Color, Vector2 = namespace['Rectangle'], namespace['Color'], namespace['Vector2']
+        for count in (1000, 20000):
+            recs: List = [Rectangle(i, i, 10, 10) for i in range(count)]
+            color = Color(1, 2, 3, 4)
+            recorded = namespace['CommandBuffer']()
+            for rec in recs:
+                recorded.draw_rectangle_rec(rec, color)
+            names: Dict = {'recs': recs, 'color': color, 'commands': namespace['CommandBuffer'](),
+                           'recorded': recorded, 'draw_rectangle_rec': namespace['draw_rectangle_rec']}
+            number: int = max(1, 20000 // count)
+            report(f"draw_rectangle_rec per call (N={count})",
+                   measure("for rec in recs: draw_rectangle_rec(rec, color)", number, 3, **names), number)
+            report(f"CommandBuffer record + submit (N={count})",
+                   measure("for rec in recs: commands.draw_rectangle_rec(rec, color)\ncommands.submit()",
+                           number, 3, **names), number)
+            report(f"CommandBuffer submit again (N={count})",
+                   measure("recorded.submit(clear=False)", number, 3, **names), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_display_lists():
+    """A static scene of N rectangles drawn every frame: one wrapper call per
+    rectangle vs replaying a display list recorded once, from Python (no
+    shim) and as a packed command buffer."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        source: str = SIGNATURES_CDEF + "void DrawRectangle(int x, int y, int width, int height, Color color) { }\n"
+        lib_file: Optional[str] = build_library(folder, SIGNATURES_SRC.replace(SIGNATURES_CDEF, source))
+        if lib_file is None:
+            return
+
+        namespace: Dict = generated_structs()
+        namespace['_rl'] = ctypes.CDLL(lib_file)
+        header: rlctbg.HeaderData = rlctbg.load_header(
+            os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h"))
+        functions: List = [f for f in header.functions if f.name in ('DrawRectangle', 'DrawRectangleRec')]
+        commands: List = rlctbg.command_functions(functions)
+        lines: List[str] = []
+        for func in functions:
+            func.convert(lines, [])
+        lines.extend(rlctbg.COMMANDS_SRC)
+        for opcode, func in enumerate(commands):
+            func.convert_command(lines, opcode)
+        lines.append(f"_command_names = {dict((func.name, func.py_name) for func in commands)!r}")
+        lines.append(f"_recorded_names = {frozenset(func.name for func in rlctbg.recorded_functions(functions))!r}")
+        exec('\n'.join(lines), namespace)
+
+        c_file: str = rlctbg.write_native(header.declarations, [], commands, os.path.join(folder, "native"))[0]
+        with open(c_file, 'r') as src:
+            native_file: Optional[str] = build_library(folder, src.read(), 'native')
+        if native_file is None:
+            return
+
+        color = namespace['Color'](1, 2, 3, 4)
+        for count in (100, 1000, 10000):
+            names: Dict = {'rects': [(i, i, 10, 10) for i in range(count)], 'color': color,
+                           'draw_rectangle': namespace['draw_rectangle']}
+            number: int = max(1, 10000 // count)
+            report(f"draw_rectangle per call (N={count})",
+                   measure("for x, y, w, h in rects: draw_rectangle(x, y, w, h, color)", number, 3, **names), number)
+            for replay, native in (("python", None), ("packed", ctypes.CDLL(native_file))):
+                namespace['_native'] = native
+                with namespace['record']() as scene:
+                    for x, y, w, h in names['rects']:
+                        names['draw_rectangle'](x, y, w, h, color)
+                report(f"display list replay, {replay} (N={count})",
+                       measure("scene.replay()", number, 3, scene=scene), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+# (signature class and function, statement) measured by `bench_calls`
+CALLS: List[Tuple[str, str]] = [
+    # int (int, int), void (int)
+    ("scalars get_random_value", "rl.get_random_value(1, 10)"),
+    ("scalars set_target_fps", "rl.set_target_fps(60)"),
+    # void (Rectangle, Color), void (Texture2D, Rectangle, Rectangle, Vector2, float, Color)
+    ("structs draw_rectangle_rec", "rl.draw_rectangle_rec(rec, color)"),
+    ("structs draw_texture_pro", "rl.draw_texture_pro(texture, rec, rec, origin, 0.0, color)"),
+    # void (Camera *), void (Vector2 *, int, Color)
+    ("pointers update_camera", "rl.update_camera(camera_ref)"),
+    ("pointers draw_line_strip", "rl.draw_line_strip(points, 16, color)"),
+    # void (const char *, int, int, int, Color), const char *(const char *)
+    ("strings draw_text", "rl.draw_text(b'Hello', 10, 10, 20, color)"),
+    ("strings text_to_upper", "rl.text_to_upper(b'hello')"),
+    # Vector2 (void), Color (Color, float)
+    ("returns get_mouse_position", "rl.get_mouse_position()"),
+    ("returns fade", "rl.fade(color, 0.5)"),
+]
+
+
+@contextlib.contextmanager
+def stub_library(folder: str):
+    """Points `RLCTBG_LIBRARY` to the stand-in library (see `rlctbg.build_stub`)
+    built in `folder` for the duration of the block; yields False if it can
+    not be built."""
+    library: Optional[str] = os.environ.get('RLCTBG_LIBRARY')
+    try:
+        extension: str = {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+        os.environ['RLCTBG_LIBRARY'] = rlctbg.build_stub(
+            path_to_library=os.path.join(folder, "libraylib_stub" + extension))
+    except Exception as error:
+        print(f"    skipped: unable to build the stand-in library ({error})")
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        if library is None:
+            os.environ.pop('RLCTBG_LIBRARY', None)
+        else:
+            os.environ['RLCTBG_LIBRARY'] = library
+
+
+def stub_binding(folder: str, name: str, **options):
+    """Generates the binding module `name` in `folder` and imports it."""
+    location: str = os.path.join(folder, f"{name}.py")
+    rlctbg.wrap_header(path_to_output=location, force=True, **options)
+    spec = importlib.util.spec_from_file_location(name, location)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def signature_names(rl) -> Dict:
+    """The names the `CALLS` statements use."""
+    camera = rl.Camera3D(rl.Vector3(0, 10, 10), rl.Vector3(0, 0, 0), rl.Vector3(0, 1, 0), 45.0, 0)
+    return {
+        'rl': rl,
+        'rec': rl.Rectangle(1, 2, 3, 4),
+        'color': rl.Color(1, 2, 3, 4),
+        'texture': rl.Texture2D(),
+        'origin': rl.Vector2(0, 0),
+        'camera_ref': ctypes.byref(camera),
+        'points': (rl.Vector2 * 16)(),
+    }
+
+
+def bench_calls():
+    """Per-call cost of the generated binding for each signature class, with
+    wrappers and with `direct=True`, run headless against the stand-in
+    library built by `rlctbg.build_stub`."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            for mode in ('wrapper', 'direct'):
+                names: Dict = signature_names(stub_binding(folder, f"calls_{mode}", direct=mode == 'direct'))
+                number: int = 100000
+                for title, stmt in CALLS:
+                    report(f"{mode}: {title}", measure(stmt, number, **names), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_call_logs():
+    """A frame of the `calls` signatures (10 calls of each) with and without
+    `log_calls`, and the same frame replayed from the log by `CallLog`."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            names: Dict = signature_names(stub_binding(folder, "call_logs"))
+            rl = names['rl']
+            frame: str = '\n'.join(["rl.begin_drawing()"] + [stmt for _, stmt in CALLS] * 10 + ["rl.end_drawing()"])
+            number: int = 1000
+            report("frame", measure(frame, number, **names), number)
+            path: str = os.path.join(folder, "frames.log")
+            with rl.log_calls(path):
+                report("frame, logged", measure(frame, number, **names), number)
+            # measure runs the frame 5 times `number` times
+            print(f"    {'log size per frame':<48} {os.path.getsize(path) / (5 * number):>12.0f} bytes")
+            log = rl.CallLog(path)
+            report("frame, replayed", min(sum(log.replay()) for _ in range(5)), 5 * number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_input_snapshot():
+    """50 input queries per frame (10 times `is_key_down` of KEY_RIGHT and
+    KEY_LEFT, `is_key_pressed` of KEY_A, `is_mouse_button_down` and
+    `get_mouse_position`): one foreign call each vs an `InputSnapshot`
+    captured once per frame, without and with the native loops shim."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            rl = stub_binding(folder, "input_snapshot", native=True)
+            with open(os.path.join(folder, "input_snapshot_native.c"), 'r') as src:
+                native_file: Optional[str] = build_library(folder, src.read(), 'input_snapshot_native')
+            if native_file is None:
+                return
+            snapshot = rl.InputSnapshot(keys=(rl.KEY_RIGHT, rl.KEY_LEFT, rl.KEY_A, rl.KEY_S, rl.KEY_R),
+                                        mouse_buttons=(rl.MOUSE_LEFT_BUTTON,), auto=False)
+            queries: List[str] = ["{0}.is_key_down(rl.KEY_RIGHT)", "{0}.is_key_down(rl.KEY_LEFT)",
+                                  "{0}.is_key_pressed(rl.KEY_A)", "{0}.is_mouse_button_down(rl.MOUSE_LEFT_BUTTON)",
+                                  "{0}.get_mouse_position()"]
+            number: int = 1000
+            frame: str = '\n'.join([query.format("rl") for query in queries] * 10)
+            report("50 queries per frame, per call", measure(frame, number, rl=rl), number)
+            frame = '\n'.join(["snapshot.capture()"] + [query.format("snapshot") for query in queries] * 10)
+            for title, native in (("python", None), ("native", ctypes.CDLL(native_file))):
+                rl._native = native
+                report(f"50 queries per frame, snapshot ({title})", measure(frame, number, rl=rl, snapshot=snapshot),
+                       number)
+                report(f"InputSnapshot.capture (5 keys, 1 button, {title})",
+                       measure("snapshot.capture()", number, snapshot=snapshot), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+# connected gamepads with a few buttons down, standing in for the stub's functions
+GAMEPADS_SRC = """
+#include <stdbool.h>
+bool IsGamepadAvailable(int gamepad) { return true; }
+bool IsGamepadButtonDown(int gamepad, int button) { return (gamepad + button) % 5 == 0; }
+float GetGamepadAxisMovement(int gamepad, int axis) { return 0.25f * axis; }
+"""
+
+
+def bench_gamepads():
+    """The state of 4 connected gamepads per frame (down, pressed and
+    released of every button, every axis): one wrapper call each vs a
+    `GamepadSnapshot`, without and with the native loops shim."""
+    try:
+        import numpy  # noqa: F401 (GamepadSnapshot imports it)
+    except ImportError:
+        print("    skipped: numpy is not installed")
+        return
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            rl = stub_binding(folder, "gamepads", native=True)
+            lib_file: Optional[str] = build_library(folder, GAMEPADS_SRC, 'gamepads_bench')
+            with open(os.path.join(folder, "gamepads_native.c"), 'r') as src:
+                native_file: Optional[str] = build_library(folder, src.read(), 'gamepads_native')
+            if lib_file is None or native_file is None:
+                return
+            pads = ctypes.CDLL(lib_file)
+            for name in rl._gamepad_functions:
+                func = getattr(pads, name)
+                func.argtypes, func.restype = getattr(rl._rl, name).argtypes, getattr(rl._rl, name).restype
+                setattr(rl._rl, name, func)
+
+            buttons, axes = list(rl.GamepadButton), list(rl.GamepadAxis)
+            frame: str = '\n'.join([
+                "for pad in range(4):",
+                "    rl.is_gamepad_available(pad)",
+                "    for button in buttons:",
+                "        rl.is_gamepad_button_down(pad, button)",
+                "        rl.is_gamepad_button_pressed(pad, button)",
+                "        rl.is_gamepad_button_released(pad, button)",
+                "    for axis in axes:",
+                "        rl.get_gamepad_axis_movement(pad, axis)",
+            ])
+            number: int = 1000
+            report("4 gamepads, per call", measure(frame, number, 3, rl=rl, buttons=buttons, axes=axes), number)
+            snapshot = rl.GamepadSnapshot(pads=4, auto=False)
+            for title, native in (("python", None), ("native", ctypes.CDLL(native_file))):
+                rl._native = native
+                report(f"4 gamepads, GamepadSnapshot ({title})", measure("snapshot.capture()", number, 3,
+                                                                         snapshot=snapshot), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_frame_cache():
+    """40 frame-stable queries per frame (10 times `get_screen_width`,
+    `get_frame_time`, `get_mouse_position` and `get_camera_matrix2_d`): one
+    foreign call each vs a `frame_cache` binding."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            number: int = 1000
+            for title, frame_cache in (("per call", False), ("frame cache", True)):
+                rl = stub_binding(folder, f"frame_cache_{frame_cache:d}", frame_cache=frame_cache)
+                camera = rl.Camera2D(rl.Vector2(400, 225), rl.Vector2(0, 0), 0.0, 1.0)
+                frame: str = '\n'.join(["rl.begin_drawing()"] + [
+                    "rl.get_screen_width()",
+                    "rl.get_frame_time()",
+                    "rl.get_mouse_position()",
+                    "rl.get_camera_matrix2_d(camera)",
+                ] * 10 + ["rl.end_drawing()"])
+                report(f"40 queries per frame, {title}", measure(frame, number, rl=rl, camera=camera), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_memoized():
+    """The pure functions called every frame with the same arguments (as
+    `fade(SKYBLUE, 0.5)` in the camera example): the wrappers vs their
+    memoized `*_cached` variants."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            rl = stub_binding(folder, "memoized")
+            names: Dict = {'rl': rl, 'color': rl.SKYBLUE, 'rec1': rl.Rectangle(0, 0, 10, 10),
+                           'rec2': rl.Rectangle(5, 5, 10, 10)}
+            number: int = 100000
+            for call in ("fade(color, 0.5)", "color_to_int(color)", "get_color(0x66bfffff)",
+                         "get_collision_rec(rec1, rec2)", "measure_text(b'Congrats!', 20)"):
+                name, _, args = call.partition('(')
+                report(f"{name:<17} wrapper", measure(f"rl.{call}", number, **names), number)
+                report(f"{name:<17} cached", measure(f"rl.{name}_cached({args}", number, **names), number)
+            hits, misses, _, _ = rl.memo_info()['fade_cached']
+            print(f"    fade_cached: {hits} hits, {misses} misses")
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_strings():
+    """`draw_text` and `measure_text` with bytes and with str: the wrappers
+    as generated before they accepted str, the current ones, and the str
+    encoded by the application on every call."""
+    folder: str = tempfile.mkdtemp()
+    try:
+        with stub_library(folder) as built:
+            if not built:
+                return
+            rl = stub_binding(folder, "strings")
+            names: Dict = {'rl': rl, 'color': rl.LIGHTGRAY, 'text': "Congrats! You created your first window!"}
+            names['data'] = names['text'].encode()
+            # the wrappers as generated before they accepted str
+            exec("def draw_text(text, pos_x, pos_y, font_size, color):\n"
+                 "    _rl.DrawText(text, pos_x, pos_y, font_size, color)\n"
+                 "def measure_text(text, font_size):\n"
+                 "    return _rl.MeasureText(text, font_size)\n", {'_rl': rl._rl}, names)
+            number: int = 100000
+            for title, statement in (("draw_text, bytes only wrapper", "draw_text(data, 190, 200, 20, color)"),
+                                     ("draw_text(bytes)", "rl.draw_text(data, 190, 200, 20, color)"),
+                                     ("draw_text(str)", "rl.draw_text(text, 190, 200, 20, color)"),
+                                     ("draw_text(str.encode())", "rl.draw_text(text.encode(), 190, 200, 20, color)"),
+                                     ("measure_text, bytes only wrapper", "measure_text(data, 20)"),
+                                     ("measure_text(bytes)", "rl.measure_text(data, 20)"),
+                                     ("measure_text(str)", "rl.measure_text(text, 20)"),
+                                     ("measure_text_cached(str)", "rl.measure_text_cached(text, 20)")):
+                report(title, measure(statement, number, 15, **names), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_telemetry():
+    """Per-frame cost of `FrameTelemetry` (the hooks around `end_drawing`),
+    against a 60 FPS frame budget, and of writing its metrics file."""
+    namespace: Dict = generated_structs()
+
+    def end_drawing():
+        for hook in namespace['_swap_hooks']:
+            hook()
+        for hook in namespace['_frame_hooks']:
+            hook()
+
+    number: int = 100000
+    idle: float = measure("end_drawing()", number, end_drawing=end_drawing)
+    report("end_drawing hooks", idle, number)
+    folder: str = tempfile.mkdtemp()
+    try:
+        # an interval of an hour: the loop measures the per-frame bookkeeping only
+        telemetry = namespace['FrameTelemetry'](path=os.path.join(folder, "frames.prom"), interval=3600.0).start()
+        seconds: float = measure("end_drawing()", number, end_drawing=end_drawing)
+        report("end_drawing hooks + FrameTelemetry", seconds, number)
+        print(f"    {'overhead at 60 FPS':<48} {(seconds - idle) / number * 60:>12.4%}")
+        # a full window of frames to summarize
+        for name in ("frames.prom", "frames.jsonl"):
+            path: str = os.path.join(folder, name)
+            report(f"FrameTelemetry.write ({name})", measure("telemetry.write(path)", 100, telemetry=telemetry, path=path), 100)
+        telemetry.stop()
+    finally:
+        shutil.rmtree(folder)
+
+
+def bench_direct_call():
+    """Per-call cost of a generated wrapper vs the bare foreign function (`direct=True`)."""
+    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'msvcrt')
+
+    class DivT(ctypes.Structure):
+        _fields_ = [('quot', ctypes.c_int), ('rem', ctypes.c_int)]
+
+    libc.abs.argtypes = [ctypes.c_int]
+    libc.abs.restype = ctypes.c_int
+    libc.div.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.div.restype = DivT
+
+    # the same shape as the code emitted by FunctionData.convert
+    def wrapped_abs(x: int) -> int:
+        return libc.abs(x)
+
+    def wrapped_div(numer: int, denom: int) -> DivT:
+        return libc.div(numer, denom)
+
+    direct_abs = libc.abs
+    direct_div = libc.div
+    number: int = 200000
+
+    report("wrapper  abs(int) -> int", measure("f(-1)", number, f=wrapped_abs), number)
+    report("direct   abs(int) -> int", measure("f(-1)", number, f=direct_abs), number)
+    report("wrapper  div(int, int) -> struct", measure("f(7, 2)", number, f=wrapped_div), number)
+    report("direct   div(int, int) -> struct", measure("f(7, 2)", number, f=direct_div), number)
+
+
+def bench_backends():
+    """Per-call cost of the ctypes and cffi (ABI and API mode) backends on raylib signatures."""
+    try:
+        import cffi
+    except ImportError:
+        print("    skipped: cffi is not installed")
+        return
+
+    folder: str = tempfile.mkdtemp()
+    try:
+        lib_file: Optional[str] = build_library(folder, SIGNATURES_SRC)
+        if lib_file is None:
+            return
+
+        class Vector2(ctypes.Structure):
+            _fields_ = [('x', ctypes.c_float), ('y', ctypes.c_float)]
+
+        class Rectangle(ctypes.Structure):
+            _fields_ = [('x', ctypes.c_float), ('y', ctypes.c_float),
+                        ('width', ctypes.c_float), ('height', ctypes.c_float)]
+
+        class Color(ctypes.Structure):
+            _fields_ = [('r', ctypes.c_ubyte), ('g', ctypes.c_ubyte), ('b', ctypes.c_ubyte), ('a', ctypes.c_ubyte)]
+
+        rl = ctypes.CDLL(lib_file)
+        rl.GetRandomValue.argtypes = [ctypes.c_int, ctypes.c_int]
+        rl.GetRandomValue.restype = ctypes.c_int
+        rl.DrawRectangleRec.argtypes = [Rectangle, Color]
+        rl.DrawRectangleRec.restype = None
+        rl.DrawLineV.argtypes = [Vector2, Vector2, Color]
+        rl.DrawLineV.restype = None
+        rl.Fade.argtypes = [Color, ctypes.c_float]
+        rl.Fade.restype = Color
+        rl.MeasureText.argtypes = [ctypes.c_char_p, ctypes.c_int]
+        rl.MeasureText.restype = ctypes.c_int
+
+        abi = cffi.FFI()
+        abi.cdef(SIGNATURES_CDEF)
+        abi_lib = abi.dlopen(lib_file)
+
+        api_lib = None
+        builder = cffi.FFI()
+        builder.cdef(SIGNATURES_CDEF)
+        builder.set_source('_bench_backends_cffi', SIGNATURES_SRC)
+        try:
+            builder.compile(tmpdir=folder)
+            sys.path.insert(0, folder)
+            api_lib = importlib.import_module('_bench_backends_cffi').lib
+        except Exception as error:
+            print(f"    API mode skipped: {error}")
+        finally:
+            if folder in sys.path:
+                sys.path.remove(folder)
+
+        backends: List = [
+            ('ctypes', rl, Vector2(1, 2), Rectangle(1, 2, 3, 4), Color(1, 2, 3, 4)),
+            ('cffi ABI', abi_lib, abi.new('Vector2 *', (1, 2))[0], abi.new('Rectangle *', (1, 2, 3, 4))[0],
+             abi.new('Color *', (1, 2, 3, 4))[0]),
+        ]
+        if api_lib is not None:
+            api = importlib.import_module('_bench_backends_cffi').ffi
+            backends.append(('cffi API', api_lib, api.new('Vector2 *', (1, 2))[0],
+                             api.new('Rectangle *', (1, 2, 3, 4))[0], api.new('Color *', (1, 2, 3, 4))[0]))
+
+        number: int = 100000
+        for name, lib, vec, rec, color in backends:
+            names: Dict = {'lib': lib, 'vec': vec, 'rec': rec, 'color': color}
+            report(f"{name:<9} GetRandomValue(int, int)", measure("lib.GetRandomValue(1, 2)", number, **names), number)
+            report(f"{name:<9} DrawRectangleRec(Rectangle, Color)", measure("lib.DrawRectangleRec(rec, color)", number, **names), number)
+            report(f"{name:<9} DrawLineV(Vector2, Vector2, Color)", measure("lib.DrawLineV(vec, vec, color)", number, **names), number)
+            report(f"{name:<9} Fade(Color, float) -> Color", measure("lib.Fade(color, 0.5)", number, **names), number)
+            report(f"{name:<9} MeasureText(char *, int)", measure("lib.MeasureText(b'text', 10)", number, **names), number)
+    finally:
+        shutil.rmtree(folder)
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'wrap_header': bench_wrap_header,
+    'generation': bench_generation,
+    'import': bench_import,
+    'parse_headers': bench_parse_headers,
+    'struct_memory': bench_struct_memory,
+    'struct_construction': bench_struct_construction,
+    'numpy_views': bench_numpy_views,
+    'buffer_args': bench_buffer_args,
+    'batches': bench_batches,
+    'commands': bench_commands,
+    'display_lists': bench_display_lists,
+    'calls': bench_calls,
+    'call_logs': bench_call_logs,
+    'input_snapshot': bench_input_snapshot,
+    'gamepads': bench_gamepads,
+    'frame_cache': bench_frame_cache,
+    'memoized': bench_memoized,
+    'strings': bench_strings,
+    'telemetry': bench_telemetry,
+    'direct_call': bench_direct_call,
+    'backends': bench_backends,
+}
+
+# endregion (benchmarks)
+# ---------------------------------------------------------
+# region MAIN
+
+
+def main(args: List[str]):
+    global REGRESSION_THRESHOLD
+    parser = argparse.ArgumentParser(description="Runs the benchmarks (all of them when no name is given).")
+    parser.add_argument('names', nargs='*', metavar='name', help=f"one of {', '.join(BENCHMARKS)}")
+    parser.add_argument('--save', metavar='FILE', help="write the results to FILE (JSON)")
+    parser.add_argument('--baseline', metavar='FILE',
+                        help="compare to the results saved in FILE; exit with 1 on a regression")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, metavar='RATIO',
+                        help=f"slowdown counted as a regression (default: {REGRESSION_THRESHOLD})")
+    options = parser.parse_args(args)
+    unknown: List[str] = [name for name in options.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    REGRESSION_THRESHOLD = options.threshold
+    if options.baseline:
+        with open(options.baseline, 'r') as baseline:
+            BASELINE.update(json.load(baseline))
+    for name in (options.names or BENCHMARKS):
+        print(f"{name}:")
+        BENCHMARKS[name]()
+    if options.save:
+        with open(options.save, 'w') as output:
+            json.dump(RESULTS, output, indent=4)
+
+    regressions: List[str] = [title for title, per_op in RESULTS.items()
+                              if title in BASELINE and per_op > BASELINE[title] * (1 + REGRESSION_THRESHOLD)]
+    return 1 if regressions else 0
+
+
+# endregion (main)
+# ---------------------------------------------------------
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
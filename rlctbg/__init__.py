@@ -1,16 +1,30 @@
 import os
 import re
-from typing import Optional, List, Dict, Pattern, Match, NamedTuple, Union
+import sys
+import ast
+import json
+import hashlib
+import functools
+import importlib
+import keyword
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Dict, Pattern, Match, NamedTuple, Union, Tuple, Callable
 from types import ModuleType
 
 __all__ = [
     'wrap_header',
+    'wrap_headers',
+    'is_up_to_date',
+    'parse_header',
+    'load_header',
+    'build_stub',
+    'HeaderData',
 ]
 
 # ---------------------------------------------------------
 # region CONSTANTS & ENUMS
 
-LOADER_SRC = '''# -*- encoding: utf-8 -*-
+HEADER_SRC = '''# -*- encoding: utf-8 -*-
 
 # ============================================================================ #
 #                                   WARNING                                    #
@@ -24,9 +38,16 @@ LOADER_SRC = '''# -*- encoding: utf-8 -*-
 
 import sys
 import os
-import platform
 import ctypes
 from enum import IntEnum, auto
+from struct import Struct, error as StructError
+from itertools import chain, repeat, starmap
+from collections import deque
+from numbers import Real
+from typing import Union
+from contextlib import contextmanager
+from functools import lru_cache as _lru_cache
+from time import perf_counter as _perf_counter
 from ctypes import (
     c_bool,
     c_char_p,
@@ -47,12 +68,12 @@ from ctypes import (
     CFUNCTYPE,
     POINTER,
     CDLL,
-    WinDLL,
     Structure,
     byref,
 )
+'''.split('\n')
 
-# region LIBRARY LOADER
+LOADER_SRC = '''# region LIBRARY LOADER
 
 _lib_fname = {
     'win32': 'raylib.dll',
@@ -63,11 +84,15 @@ _lib_fname = {
 _lib_platform = sys.platform
 
 if _lib_platform == 'win32':
+    import platform
+
     _bitness = platform.architecture()[0]
 else:
     _bitness = '64bit' if sys.maxsize > 2 ** 32 else '32bit'
 
 _lib_fname_abspath = os.path.join(os.path.dirname(os.path.abspath(__file__)), _lib_fname[_lib_platform])
+# e.g. a stand-in library built by `rlctbg.build_stub` to run headless
+_lib_fname_abspath = os.environ.get('RLCTBG_LIBRARY', _lib_fname_abspath)
 _lib_fname_abspath = os.path.normcase(os.path.normpath(_lib_fname_abspath))
 
 print(
@@ -128,7 +153,7 @@ if _lib_platform == 'win32':
                                          use_errno, use_last_error)
 
 
-    class WinDLLEx(WinDLL):
+    class WinDLLEx(ctypes.WinDLL):
         def __init__(self, name, mode=0, handle=None,
                      use_errno=False, use_last_error=True):
             if handle is None:
@@ -143,15 +168,1501 @@ if _lib_platform == 'win32':
         print("Unable to load raylib 2.5.0 dll.")
         _rl = None
 else:
-    _rl = CDLL(_lib_fname_abspath)
+    try:
+        _rl = CDLL(_lib_fname_abspath)
+    except OSError:
+        _rl = None
 
 if _rl is None:
-    print("Failed to load shared library.")
-    exit()
+    raise ImportError(f"Failed to load shared library: {_lib_fname_abspath} "
+                      f"(set RLCTBG_LIBRARY to the path of the raylib binary)")
 
 # endregion (library loader)
 '''.split('\n')
 
+FRAME_SRC = '''# region FRAME HOOKS
+
+_frame_hooks = []
+# run just before the `end_drawing` foreign call (buffer swap, frame rate wait)
+_swap_hooks = []
+
+
+def add_frame_hook(hook):
+    """Registers a callable run, without arguments, after every `end_drawing`."""
+    _frame_hooks.append(hook)
+    return hook
+
+
+def remove_frame_hook(hook):
+    _frame_hooks.remove(hook)
+
+
+class _ScratchPool:
+    """Structure instances handed out by `scratch` and recycled after each frame."""
+    __slots__ = ('free', 'used')
+
+    def __init__(self):
+        self.free = []
+        self.used = []
+        _frame_hooks.append(self.reset)
+
+    def reset(self):
+        self.free.extend(self.used)
+        self.used.clear()
+
+# endregion (frame hooks)
+'''.split('\n')
+
+TELEMETRY_SRC = '''# region FRAME TELEMETRY
+
+class FrameTelemetry:
+    """Rolling frame time statistics over the last `window` frames, taken
+    by the frame hooks between `start` and `stop` (or in a `with` block).
+
+    A frame runs from one `end_drawing` to the next. Its time is split into
+    the time spent in Python (update logic, draw calls) and the time spent
+    in `end_drawing` (buffer swap, vsync or target FPS wait); frames longer
+    than `budget` seconds are hitches. With `path`, the statistics are
+    written every `interval` seconds, in the Prometheus text format (e.g.
+    for the node exporter textfile collector) or, for a `.jsonl` path,
+    appended as a JSON line.
+    """
+    SERIES = ('frame', 'python', 'end_drawing')
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, budget=1 / 60, window=3600, path=None, interval=10.0):
+        self.budget = budget
+        self.path = path
+        self.interval = interval
+        self.frames = deque(maxlen=window)
+        self.count = 0
+        self.hitches = 0
+        self.sums = [0.0, 0.0, 0.0]
+        self._swap = 0.0
+        self._end = None
+        self._next_write = None
+
+    def start(self):
+        """Starts measuring from the next `end_drawing`."""
+        if self._on_frame not in _frame_hooks:
+            _swap_hooks.append(self._on_swap)
+            _frame_hooks.append(self._on_frame)
+        return self
+
+    def stop(self):
+        """Stops measuring, writing the statistics a last time with `path`."""
+        if self._on_frame in _frame_hooks:
+            _swap_hooks.remove(self._on_swap)
+            _frame_hooks.remove(self._on_frame)
+            if self.path is not None and self._end is not None:
+                self.write()
+        self._end = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _on_swap(self):
+        self._swap = _perf_counter()
+
+    def _on_frame(self):
+        now = _perf_counter()
+        end, self._end = self._end, now
+        if end is None:
+            # the first frame measured starts here
+            self._next_write = now + self.interval if self.path is not None else None
+            return
+        frame = now - end
+        swap = now - self._swap
+        self.frames.append((frame, frame - swap, swap))
+        self.count += 1
+        sums = self.sums
+        sums[0] += frame
+        sums[1] += frame - swap
+        sums[2] += swap
+        if frame > self.budget:
+            self.hitches += 1
+        if self._next_write is not None and now >= self._next_write:
+            self._next_write = now + self.interval
+            self.write()
+
+    def quantiles(self):
+        """Returns, for each series ('frame', 'python', 'end_drawing'), a
+        dict mapping 0.5, 0.95 and 0.99 to the frame time quantiles of the
+        window, in seconds."""
+        result = {}
+        for i, series in enumerate(self.SERIES):
+            values = sorted(frame[i] for frame in self.frames) or [0.0]
+            result[series] = {q: values[min(len(values) - 1, int(q * len(values)))] for q in self.QUANTILES}
+        return result
+
+    def stats(self):
+        """Returns the quantiles (see `quantiles`), the number of frames
+        measured, their total time per series and the hitch counts, since
+        `start` and over the window."""
+        return {
+            'frames': self.count,
+            'quantiles': self.quantiles(),
+            'sums': dict(zip(self.SERIES, self.sums)),
+            'hitches': self.hitches,
+            'window_frames': len(self.frames),
+            'window_hitches': sum(1 for frame in self.frames if frame[0] > self.budget),
+            'budget': self.budget,
+        }
+
+    def write(self, path=None):
+        """Writes the statistics to `path` (by default the one of the telemetry)."""
+        path = self.path if path is None else path
+        stats = self.stats()
+        if path.endswith('.jsonl'):
+            import json
+            import time
+            stats['time'] = time.time()
+            with open(path, 'a') as output:
+                output.write(json.dumps(stats) + '\\n')
+            return
+        lines = []
+        for series, description in zip(self.SERIES, ("Frame time", "Time spent in Python per frame",
+                                                      "Time spent in end_drawing per frame")):
+            metric = f"raylib_{series}_seconds"
+            lines.append(f"# HELP {metric} {description}, quantiles over the last {stats['window_frames']} frames.")
+            lines.append(f"# TYPE {metric} summary")
+            for q, value in stats['quantiles'][series].items():
+                lines.append(f'{metric}{{quantile="{q}"}} {value!r}')
+            lines.append(f"{metric}_sum {stats['sums'][series]!r}")
+            lines.append(f"{metric}_count {stats['frames']}")
+        lines.append("# HELP raylib_frame_hitches_total Frames longer than the budget.")
+        lines.append("# TYPE raylib_frame_hitches_total counter")
+        lines.append(f"raylib_frame_hitches_total {stats['hitches']}")
+        lines.append("# HELP raylib_frame_budget_seconds Frame time budget.")
+        lines.append("# TYPE raylib_frame_budget_seconds gauge")
+        lines.append(f"raylib_frame_budget_seconds {stats['budget']!r}")
+        # replaced at once, so a collector never reads a partial file
+        with open(path + '.tmp', 'w') as output:
+            output.write('\\n'.join(lines) + '\\n')
+        os.replace(path + '.tmp', path)
+
+# endregion (frame telemetry)
+'''.split('\n')
+
+INPUT_SRC = '''# region INPUT SNAPSHOTS
+
+_input_funcs = None
+
+
+class InputSnapshot:
+    """The state of the registered keys and mouse buttons, the mouse and the
+    keys pressed (drained from `get_key_pressed`), captured with one call
+    per key and query by `capture` (a single foreign call with the native
+    loops shim compiled, for up to 64 keys and 64 buttons): the queries of
+    the frame then stay in Python. By default it captures after every
+    `end_drawing`, where raylib polls the input events, until `close`.
+
+    The queries mirror the functions; a key or button that is not
+    registered raises KeyError.
+    """
+    __slots__ = ('_keys', '_buttons', '_key_state', '_button_state', 'mouse_position', 'mouse_wheel_move',
+                 'keys_pressed', '_codes', '_bits', '_wheel', '_pressed', '__weakref__')
+
+    def __init__(self, keys=(), mouse_buttons=(), auto=True):
+        # one bit per registered key (button) in the down, pressed and released bitsets
+        self._keys = {key: 1 << i for i, key in enumerate(dict.fromkeys(keys))}
+        self._buttons = {button: 1 << i for i, button in enumerate(dict.fromkeys(mouse_buttons))}
+        self._key_state = (0, 0, 0)
+        self._button_state = (0, 0, 0)
+        self.mouse_position = Vector2()
+        self.mouse_wheel_move = 0
+        self.keys_pressed = []
+        # the arguments and results of the native capture
+        self._codes = (c_int * (len(self._keys) + len(self._buttons)))(*self._keys, *self._buttons)
+        self._bits = (ctypes.c_ulonglong * 6)()
+        self._wheel = c_int()
+        self._pressed = (c_int * 64)()
+        # typed now: the lazy functions can not be bound by the frame hook
+        for name, py_name in _input_functions.items():
+            _bound(name, py_name)
+        if auto:
+            _frame_hooks.append(self.capture)
+
+    def close(self):
+        """Stops capturing after each `end_drawing`."""
+        if self.capture in _frame_hooks:
+            _frame_hooks.remove(self.capture)
+
+    @staticmethod
+    def _capture(codes, is_down, is_pressed, is_released):
+        down = pressed = released = 0
+        for code, bit in codes.items():
+            if is_down(code):
+                down |= bit
+            if is_pressed(code):
+                pressed |= bit
+            if is_released(code):
+                released |= bit
+        return down, pressed, released
+
+    def capture(self):
+        """Captures the input state the queries answer from."""
+        global _input_funcs
+        funcs = tuple(map(getattr, repeat(_rl), _input_functions))
+        # the functions are checked again only when they change (e.g. a stand-in is set or removed)
+        if ((_input_funcs is None or funcs != _input_funcs[0]) and _native is not None
+                and hasattr(_native, 'CaptureInput') and all(isinstance(func, ctypes._CFuncPtr) for func in funcs)):
+            _input_funcs = funcs, (c_void_p * len(funcs))(*(ctypes.cast(func, c_void_p).value for func in funcs))
+        if (_input_funcs is not None and funcs == _input_funcs[0] and _native is not None
+                and len(self._keys) <= 64 and len(self._buttons) <= 64):
+            mouse_position = Vector2()
+            count = _native.CaptureInput(_input_funcs[1], self._codes, len(self._keys), len(self._buttons),
+                                         self._bits, byref(mouse_position), byref(self._wheel), self._pressed)
+            bits = self._bits[:]
+            self._key_state = tuple(bits[:3])
+            self._button_state = tuple(bits[3:])
+            self.mouse_position = mouse_position
+            self.mouse_wheel_move = self._wheel.value
+            self.keys_pressed = self._pressed[:count]
+            return
+        # a stand-in (e.g. while logging calls) or no shim: one call per key and query
+        self._key_state = self._capture(self._keys, _rl.IsKeyDown, _rl.IsKeyPressed, _rl.IsKeyReleased)
+        self._button_state = self._capture(self._buttons, _rl.IsMouseButtonDown, _rl.IsMouseButtonPressed,
+                                           _rl.IsMouseButtonReleased)
+        self.mouse_position = _rl.GetMousePosition()
+        self.mouse_wheel_move = _rl.GetMouseWheelMove()
+        keys_pressed = []
+        get_key_pressed = _rl.GetKeyPressed
+        # the queue holds at most a few keys per frame, bounded against a misbehaving library
+        for _ in range(64):
+            key = get_key_pressed()
+            if key <= 0:
+                break
+            keys_pressed.append(key)
+        self.keys_pressed = keys_pressed
+
+    def is_key_down(self, key) -> bool:
+        return self._key_state[0] & self._keys[key] != 0
+
+    def is_key_pressed(self, key) -> bool:
+        return self._key_state[1] & self._keys[key] != 0
+
+    def is_key_released(self, key) -> bool:
+        return self._key_state[2] & self._keys[key] != 0
+
+    def is_key_up(self, key) -> bool:
+        return self._key_state[0] & self._keys[key] == 0
+
+    def is_mouse_button_down(self, button) -> bool:
+        return self._button_state[0] & self._buttons[button] != 0
+
+    def is_mouse_button_pressed(self, button) -> bool:
+        return self._button_state[1] & self._buttons[button] != 0
+
+    def is_mouse_button_released(self, button) -> bool:
+        return self._button_state[2] & self._buttons[button] != 0
+
+    def is_mouse_button_up(self, button) -> bool:
+        return self._button_state[0] & self._buttons[button] == 0
+
+    def get_mouse_position(self):
+        return self.mouse_position
+
+    def get_mouse_wheel_move(self) -> int:
+        return self.mouse_wheel_move
+
+# endregion (input snapshots)
+'''.split('\n')
+
+GAMEPADS_SRC = '''# region GAMEPAD SNAPSHOTS
+
+_gamepad_funcs = None
+
+
+class GamepadSnapshot:
+    """The state of every button and axis of `pads` gamepads, captured by
+    `capture` into NumPy arrays (numpy is imported by the constructor), by
+    default after every `end_drawing` until `close`. With the native loops
+    shim compiled, a capture is a single foreign call.
+
+    `available` (pads), `down`, `pressed`, `released` (pads x buttons) and
+    `axes` (pads x axes, float32) are indexed by the gamepad number and the
+    `GamepadButton` and `GamepadAxis` values. The edges compare two
+    consecutive captures, as raylib compares two consecutive input polls.
+    The methods answer like the functions from the arrays.
+    """
+
+    def __init__(self, pads=len(GamepadNumber), auto=True):
+        import numpy
+        self._numpy = numpy
+        buttons = max(GamepadButton) + 1
+        self.available = numpy.zeros(pads, numpy.bool_)
+        self.down = numpy.zeros((pads, buttons), numpy.bool_)
+        self.pressed = numpy.zeros((pads, buttons), numpy.bool_)
+        self.released = numpy.zeros((pads, buttons), numpy.bool_)
+        self.axes = numpy.zeros((pads, max(GamepadAxis) + 1), numpy.float32)
+        self._previous = numpy.zeros((pads, buttons), numpy.bool_)
+        for name, py_name in _gamepad_functions.items():
+            _bound(name, py_name)
+        if auto:
+            _frame_hooks.append(self.capture)
+
+    def close(self):
+        """Stops capturing after each `end_drawing`."""
+        if self.capture in _frame_hooks:
+            _frame_hooks.remove(self.capture)
+
+    def capture(self):
+        """Captures the state of the gamepads and the edges since the previous capture."""
+        global _gamepad_funcs
+        numpy = self._numpy
+        self._previous, self.down = self.down, self._previous
+        funcs = [getattr(_rl, name) for name in _gamepad_functions]
+        native = _native is not None and hasattr(_native, 'CaptureGamepads')
+        if native and all(isinstance(func, ctypes._CFuncPtr) for func in funcs):
+            if _gamepad_funcs is None:
+                _native.CaptureGamepads.argtypes = [POINTER(c_void_p), c_int, c_int, c_int, c_void_p, c_void_p, c_void_p]
+                _native.CaptureGamepads.restype = None
+                _gamepad_funcs = (c_void_p * len(funcs))(*(ctypes.cast(func, c_void_p).value for func in funcs))
+            _native.CaptureGamepads(_gamepad_funcs, *self.down.shape, self.axes.shape[1],
+                                    self.available.ctypes.data, self.down.ctypes.data, self.axes.ctypes.data)
+        else:
+            # a stand-in (e.g. while logging calls) or no shim: one call per button and axis
+            is_available, is_down, movement = funcs
+            for pad in range(len(self.available)):
+                available = self.available[pad] = is_available(pad)
+                self.down[pad] = [available and is_down(pad, button) for button in range(self.down.shape[1])]
+                self.axes[pad] = [movement(pad, axis) if available else 0.0 for axis in range(self.axes.shape[1])]
+        numpy.greater(self.down, self._previous, out=self.pressed)
+        numpy.less(self.down, self._previous, out=self.released)
+
+    def is_gamepad_available(self, gamepad) -> bool:
+        return bool(self.available[gamepad])
+
+    def is_gamepad_button_down(self, gamepad, button) -> bool:
+        return bool(self.down[gamepad, button])
+
+    def is_gamepad_button_pressed(self, gamepad, button) -> bool:
+        return bool(self.pressed[gamepad, button])
+
+    def is_gamepad_button_released(self, gamepad, button) -> bool:
+        return bool(self.released[gamepad, button])
+
+    def is_gamepad_button_up(self, gamepad, button) -> bool:
+        return not self.down[gamepad, button]
+
+    def get_gamepad_axis_movement(self, gamepad, axis) -> float:
+        return float(self.axes[gamepad, axis])
+
+# endregion (gamepad snapshots)
+'''.split('\n')
+
+NUMPY_SRC = '''# region NUMPY VIEWS
+
+_dtypes = {}
+
+
+def _struct_fields(struct_type):
+    # the table of the module defining the structure: with several headers,
+    # a shared one is only listed by the module of the first header
+    return getattr(sys.modules.get(struct_type.__module__), '_dtype_fields', _dtype_fields)[struct_type]
+
+
+def struct_dtype(struct_type):
+    """Returns the NumPy dtype with the memory layout of a structure (numpy is
+    only imported by the first call)."""
+    dtype = _dtypes.get(struct_type)
+    if dtype is None:
+        import numpy
+        names, formats, offsets = [], [], []
+        for name, ftype, count in _struct_fields(struct_type):
+            ftype = numpy.dtype(ftype) if isinstance(ftype, str) else struct_dtype(ftype)
+            names.append(name)
+            formats.append((ftype, count) if count > 0 else ftype)
+            offsets.append(getattr(struct_type, name).offset)
+        dtype = _dtypes[struct_type] = numpy.dtype({
+            'names': names,
+            'formats': formats,
+            'offsets': offsets,
+            'itemsize': ctypes.sizeof(struct_type),
+        })
+    return dtype
+
+
+def as_array(data, count=None):
+    """Views a ctypes array, or a pointer to `count` items, as a NumPy array
+    sharing its memory."""
+    import numpy
+    item_type = data._type_
+    if count is not None:
+        data = (item_type * count).from_address(ctypes.addressof(data.contents))
+    if issubclass(item_type, Structure):
+        return numpy.frombuffer(data, struct_dtype(item_type))
+    return numpy.ctypeslib.as_array(data)
+
+
+def as_ctypes(array, struct_type):
+    """Views a C contiguous NumPy array as a ctypes array of `struct_type`, to
+    pass it to raylib without copying.
+
+    The array either has the dtype of `struct_type` (see `struct_dtype`) or,
+    when all the fields share a type, that type: e.g. `float32` with a last
+    dimension of 2 for `Vector2`.
+    """
+    dtype = struct_dtype(struct_type)
+    if array.dtype != dtype and {field[0].base for field in dtype.fields.values()} != {array.dtype}:
+        raise TypeError(f"expected an array of {dtype} for {struct_type.__name__}, got {array.dtype}")
+    if array.nbytes % dtype.itemsize:
+        raise ValueError(f"the array size is not a multiple of sizeof({struct_type.__name__})")
+    return (struct_type * (array.nbytes // dtype.itemsize)).from_buffer(array)
+
+# endregion (numpy views)
+
+# region BUFFER ARGUMENTS
+
+_item_layouts = {}
+_CArgObject = type(byref(c_int()))
+_native_order = '<' if sys.byteorder == 'little' else '>'
+_kind_names = {'f': 'float', 'i': 'int', 'u': 'uint', '?': 'bool', 'S': 'bytes'}
+
+
+def _format_code(code):
+    """The kind and size of a buffer or dtype format code (e.g. '<f', 'L',
+    '&<f', 's', 'S32'), or None for a non-native byte order or an unknown code."""
+    if code[0] in '@=^':
+        code = code[1:]
+    elif code[0] in '<>!':
+        if code[0].replace('!', '>') != _native_order:
+            return None
+        code = code[1:]
+    if code[0] == '&' or code == 'P':
+        return 'u', ctypes.sizeof(c_void_p)
+    if code[0] == 'S' or code in 'sc':
+        return 'S', int(code[1:] or 1)
+    try:
+        size = Struct(code).size
+    except StructError:
+        return None
+    return ('f' if code in 'efd' else '?' if code == '?' else 'i' if code.islower() else 'u'), size
+
+
+@_lru_cache(maxsize=None)
+def _format_fields(buffer_format):
+    """The (kind, size) of the scalar fields of a buffer format (e.g. '<f', or
+    'T{<f:x:<f:y:}' for a structured one), nested structures flattened and
+    bytes folded, or None if a field has a non-native byte order or the format
+    can not be read."""
+    import re
+    token = re.compile(r"\\s*(?:(\\d*)x|(?:\\((\\d+(?:,\\d+)*)\\))?(\\d*)(T\\{|[@=<>!^]?&?[@=<>!^]?[a-zA-Z?])|\\})(?::\\w*:)?")
+    fields, position, depth = [], 0, 0
+    while position < len(buffer_format):
+        match = token.match(buffer_format, position)
+        if match is None:
+            return None
+        position = match.end()
+        padding, shape, repeat, code = match.groups()
+        if padding is not None:
+            continue
+        if code is None:
+            depth -= 1
+            if depth < 0:
+                return None
+            continue
+        count = int(repeat or 1)
+        for dimension in (shape.split(',') if shape else ()):
+            count *= int(dimension)
+        if code == 'T{':
+            # arrays of nested structures do not occur in raylib
+            if count != 1:
+                return None
+            depth += 1
+            continue
+        field = _format_code(code)
+        if field is None:
+            return None
+        if field[0] == 'S':
+            fields.append(('S', field[1] * count))
+        else:
+            fields.extend([field] * count)
+    return tuple(fields) if depth == 0 else None
+
+
+def _struct_layout(struct_type):
+    """The scalar fields of `struct_type` (see `_format_fields`) and the one
+    they all are, when they fill it without padding."""
+    layout = _item_layouts.get(struct_type)
+    if layout is None:
+        fields = []
+        if issubclass(struct_type, Structure):
+            for _, ftype, count in _struct_fields(struct_type):
+                if isinstance(ftype, str):
+                    field = _format_code(ftype)
+                    fields.extend([field] * max(count, 1) if field[0] != 'S' else [('S', field[1] * max(count, 1))])
+                else:
+                    fields.extend(_struct_layout(ftype)[0])
+        else:
+            fields.append(_format_code(struct_type._type_))
+        item = fields[0] if len(set(fields)) == 1 and sum(size for _, size in fields) == ctypes.sizeof(struct_type) else None
+        layout = _item_layouts[struct_type] = tuple(fields), item
+    return layout
+
+
+def _struct_array(data, struct_type, count=None):
+    """Passes a contiguous buffer of at least `count` structures (a NumPy
+    array, an `array.array`, a memoryview...) to a `struct_type *` parameter
+    without copying it; ctypes arrays and pointers go through untouched,
+    `byref()` is cast and lists or tuples of structures are copied.
+
+    The buffer holds either structures with the same fields (e.g. a
+    structured NumPy array) or the type shared by all their fields (e.g.
+    `float32` for `Vector2`), its last dimensions then making up whole
+    structures (e.g. a shape of `(n, 2)`, or a flat buffer of `2 * n` floats).
+    `struct_type` may also be a scalar type (e.g. `c_float`).
+    Read-only buffers are copied. Without `count` the whole buffer is used.
+    """
+    if data is None or isinstance(data, (ctypes.Array, ctypes._Pointer)):
+        return data
+    if isinstance(data, _CArgObject):
+        # ctypes only accepts byref() of a single struct_type
+        return data if isinstance(data._obj, struct_type) else ctypes.cast(data, ctypes.POINTER(struct_type))
+    if isinstance(data, (list, tuple)):
+        if count is not None and len(data) < count:
+            raise ValueError(f"the sequence holds less than {count} {struct_type.__name__}")
+        return (struct_type * len(data))(*data)
+    view = memoryview(data)
+    fields, item = _struct_layout(struct_type)
+    size = ctypes.sizeof(struct_type)
+    buffer_fields = _format_fields(view.format)
+    if view.format.startswith('T{'):
+        if buffer_fields != fields or view.itemsize != size:
+            raise TypeError(f"expected a buffer of {struct_type.__name__}, got '{view.format}'")
+    elif buffer_fields is None or len(buffer_fields) != 1 or buffer_fields[0] != item:
+        expected = f" or of {_kind_names[item[0]]}{item[1] * 8}" if item is not None else ""
+        raise TypeError(f"expected a buffer of {struct_type.__name__}{expected}, got '{view.format}'")
+    elif len(fields) > 1:
+        shape = view.shape or (1,)
+        if len(shape) == 1:
+            whole = shape[0] % len(fields) == 0
+        else:
+            # e.g. (n, 2) for Vector2, (n, 4, 4) or (n, 16) for Matrix
+            items = 1
+            for dimension in reversed(shape[1:]):
+                items *= dimension
+                if items >= len(fields):
+                    break
+            whole = items == len(fields)
+        if not whole:
+            raise ValueError(f"the buffer of shape {tuple(shape)} does not hold whole {struct_type.__name__} "
+                             f"({len(fields)} values each)")
+    if not view.c_contiguous:
+        raise ValueError("the buffer must be C contiguous")
+    if count is None:
+        count = view.nbytes // size
+    elif view.nbytes < count * size:
+        raise ValueError(f"the buffer holds less than {count} {struct_type.__name__}")
+    array_type = struct_type * count
+    return array_type.from_buffer_copy(view) if view.readonly else array_type.from_buffer(view)
+
+# endregion (buffer arguments)
+'''.split('\n')
+
+NATIVE_SRC = '''# region NATIVE LOOPS
+
+_native_fname = '{native}' + {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+
+try:
+    # written with wrap_header(native=True), compiled by its *_native_build.py script
+    _native = CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), _native_fname))
+except OSError:
+    _native = None
+
+_native_loops = {}
+
+# the display lists being recorded (see `record`) and the call log being
+# written (see `log_calls`), when the binding has them
+_recordings = []
+_call_log = None
+
+
+class _StandIn:
+    """Replaces the foreign function `name` of `_rl` (`func`, typed through
+    it) in the wrappers while recording or logging calls."""
+    __slots__ = ('name', 'func')
+
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+
+    @property
+    def argtypes(self):
+        return self.func.argtypes
+
+    @argtypes.setter
+    def argtypes(self, value):
+        self.func.argtypes = value
+
+    @property
+    def restype(self):
+        return self.func.restype
+
+    @restype.setter
+    def restype(self, value):
+        self.func.restype = value
+
+
+def _foreign(func):
+    """Returns the foreign function of `_rl` behind a stand-in (see `record`
+    and `log_calls`), or `func` itself."""
+    while not isinstance(func, ctypes._CFuncPtr):
+        func = func.func
+    return func
+
+
+def _bound(name, py_name):
+    """Returns the foreign function `name`, typed by its wrapper `py_name`
+    (bound first in a lazy binding)."""
+    func = _foreign(getattr(_rl, name))
+    if func.argtypes is None:
+        getattr(sys.modules[_functions_module], py_name)
+    return func
+
+
+def _native_loop(name, types):
+    """Returns the native loop `name` of the compiled shim (typed on first
+    use), or None when the shim is not compiled or predates the loop."""
+    loop = _native_loops.get(name)
+    if loop is None and _native is not None:
+        loop = getattr(_native, name, None)
+        if loop is not None:
+            loop.argtypes = [c_void_p, c_int] + [arg for item_type in types for arg in (POINTER(item_type), c_int)]
+            loop.restype = None
+            _native_loops[name] = loop
+    return loop
+
+
+def _items(array, size=256):
+    """Iterates a ctypes array a slice at a time: slicing builds the items
+    several times faster than iterating the array does."""
+    bounds = zip(range(0, len(array), size), range(size, len(array) + size, size))
+    return chain.from_iterable(map(array.__getitem__, starmap(slice, bounds)))
+
+
+def _draw_batch(func, types, args, name):
+    """Calls `func` once per item. Each argument is either one value for the
+    whole batch (a structure or a number) or one value per item (a sequence,
+    a ctypes array or a buffer, see `_struct_array`).
+
+    With the compiled shim, the native loop `name` calls `func` in C: one
+    foreign call per batch. Otherwise the items are passed to `func` by a C
+    level iterator, without a Python frame per item: a bit faster than a
+    loop calling the wrapper, only the shim saves the foreign call per item.
+    """
+    # a stand-in (while recording or logging calls) gets each item, and so
+    # does `func` from lists: copying them to arrays costs more than it saves
+    loop = None
+    if isinstance(func, ctypes._CFuncPtr) and not any(isinstance(value, (list, tuple)) for value in args):
+        loop = _native_loop(name, types)
+    values = []
+    strides = []
+    count = None
+    for value, item_type in zip(args, types):
+        if isinstance(value, (item_type, Real)):
+            values.append(value)
+            strides.append(0)
+            continue
+        if issubclass(item_type, Structure) and not isinstance(value, (list, tuple)):
+            value = _struct_array(value, item_type)
+        elif loop is None:
+            value = value.tolist() if hasattr(value, 'tolist') else value
+        else:
+            try:
+                value = _struct_array(value, item_type)
+            except TypeError:
+                # e.g. float64 radii for a float parameter
+                value = (item_type * len(value))(*value.tolist())
+        if count is None:
+            count = len(value)
+        elif len(value) != count:
+            raise ValueError(f"expected {count} items, got {len(value)}")
+        values.append(value)
+        strides.append(1)
+    if count is None:
+        raise ValueError("expected at least one array of values")
+    if loop is None:
+        columns = [(_items(value) if isinstance(value, ctypes.Array) else value) if stride else repeat(value)
+                   for value, stride in zip(values, strides)]
+        deque(starmap(func, zip(*columns)), maxlen=0)
+        return
+    loop_args = [ctypes.cast(func, c_void_p), count]
+    for value, item_type, stride in zip(values, types, strides):
+        if not stride:
+            value = byref(value if isinstance(value, item_type) else item_type(value))
+        loop_args += (value, stride)
+    loop(*loop_args)
+
+
+_command_funcs = None
+
+
+def _execute_commands(data):
+    """Runs the commands packed in `data` (see `CommandBuffer`) with one
+    foreign call to the native executor of the shim."""
+    global _command_funcs
+    if not data:
+        return
+    if _call_log is not None:
+        _call_log.write_commands(data)
+    if _native is None or not hasattr(_native, 'ExecuteCommands'):
+        raise RuntimeError(f"command buffers need the native loops shim ({_native_fname}), "
+                           f"generated with wrap_header(native=True) and built by its *_native_build.py script")
+    if _command_funcs is None:
+        _native.ExecuteCommands.argtypes = [POINTER(c_void_p), c_void_p, c_int]
+        _native.ExecuteCommands.restype = c_int
+        # the foreign functions, even while stand-ins replace them
+        funcs = [ctypes.cast(_foreign(getattr(_rl, name)), c_void_p).value for name in _command_names]
+        _command_funcs = (c_void_p * len(funcs))(*funcs)
+    if isinstance(data, bytes):
+        executed = _native.ExecuteCommands(_command_funcs, data, len(data))
+    else:
+        # a view of the bytearray, released before it can be resized again
+        buffer = (ctypes.c_char * len(data)).from_buffer(data)
+        executed = _native.ExecuteCommands(_command_funcs, ctypes.addressof(buffer), len(data))
+        del buffer
+    if executed < 0:
+        raise ValueError("corrupted command buffer")
+
+# endregion (native loops)
+'''.split('\n')
+
+DISPLAY_LISTS_SRC = '''# region DISPLAY LISTS
+
+class _RecordedFunction(_StandIn):
+    """Stands for a foreign function while recording (see `record`): its
+    calls go to the innermost display list being recorded."""
+    __slots__ = ()
+
+    def __call__(self, *args):
+        _recordings[-1]._record(self.name, self.func, args)
+
+
+class DisplayList:
+    """Drawing calls captured by `record`, their arguments converted to
+    ctypes (and structures copied) once, issued again by `replay`."""
+    __slots__ = ('_calls', '_buffer', '_packed', 'valid')
+
+    def __init__(self):
+        self._calls = []
+        self._buffer = None
+        self._packed = None
+        self.valid = False
+
+    def __len__(self):
+        return len(self._calls)
+
+    def invalidate(self) -> None:
+        """Forgets the calls: the list must be recorded again before it is replayed."""
+        self._calls = []
+        self._buffer = self._packed = None
+        self.valid = False
+
+    def replay(self) -> None:
+        """Issues the recorded calls in the current drawing state (e.g. in a
+        `begin_mode2_d` block). With the native loops shim compiled, a list
+        made of commands (see `CommandBuffer`) takes one foreign call."""
+        if not self.valid:
+            raise RuntimeError("the display list is not recorded (or was invalidated)")
+        if _recordings:
+            _recordings[-1]._extend(self)
+        elif self._packed is not None:
+            _execute_commands(self._packed)
+        elif _call_log is not None:
+            stand_ins = _call_log.stand_ins
+            for func, args in self._calls:
+                stand_ins[id(func)](*args)
+        else:
+            for func, args in self._calls:
+                func(*args)
+
+    def _record(self, name, func, args):
+        func = _foreign(func)
+        converted = []
+        for argtype, value in zip(func.argtypes, args):
+            if issubclass(argtype, Structure):
+                value = argtype.from_buffer_copy(argtype.from_param(value))
+            elif issubclass(argtype, ctypes._SimpleCData) and not isinstance(value, argtype):
+                value = argtype(value)
+            converted.append(value)
+        self._calls.append((func, tuple(converted)))
+        if self._buffer is not None:
+            method = _command_names.get(name)
+            try:
+                getattr(self._buffer, method)(*args)
+            except (TypeError, StructError):
+                # not a command (method is None), or not packable arguments
+                self._buffer = None
+
+    def _extend(self, other):
+        self._calls.extend(other._calls)
+        if self._buffer is not None:
+            if other._packed is None:
+                self._buffer = None
+            else:
+                self._buffer._data += other._packed
+
+
+@contextmanager
+def record(display_list=None):
+    """Captures the drawing calls (`draw_*`, `begin_*`/`end_*` modes,
+    `clear_background`) made in the block into `display_list` (a new one, or
+    an existing one recorded again) instead of issuing them; other functions
+    run as usual. Recordings nest: replaying a list while recording another
+    one records its calls. Pointer arguments are kept by reference.
+    """
+    if not _recorded_names:
+        raise RuntimeError("no function can be recorded (the binding was generated with direct=True)")
+    display_list = DisplayList() if display_list is None else display_list
+    display_list.invalidate()
+    if _command_names and _native is not None and hasattr(_native, 'ExecuteCommands'):
+        display_list._buffer = CommandBuffer()
+    if not _recordings:
+        for name in _recorded_names:
+            setattr(_rl, name, _RecordedFunction(name, getattr(_rl, name)))
+    _recordings.append(display_list)
+    try:
+        yield display_list
+    finally:
+        _recordings.pop()
+        if not _recordings:
+            for name in _recorded_names:
+                setattr(_rl, name, getattr(_rl, name).func)
+    buffer = display_list._buffer
+    display_list._packed = None if buffer is None else bytes(buffer._data)
+    display_list._buffer = None
+    display_list.valid = True
+
+# endregion (display lists)
+'''.split('\n')
+
+CALL_LOGS_SRC = '''# region CALL LOGS
+
+_log_magic = b'RLCTBG CALL LOG 1 '
+_log_id = Struct('<H')
+_log_size = Struct('<i')
+# the scalar formats (long is logged on 8 bytes, whatever its size)
+_log_scalars = {code: Struct('<' + {'l': 'q', 'L': 'Q'}.get(code, code)) for code in '?cbBhHiIlLqQfd'}
+
+
+def _log_kind(ctype):
+    """Returns how values of `ctype` are logged: a scalar format, 'S<size>'
+    for a structure, 'z' for a string, 'p' for the memory a pointer
+    references and 'n' for nothing (callbacks, void)."""
+    if ctype is None:
+        return 'n'
+    if ctype is c_char_p:
+        return 'z'
+    if issubclass(ctype, Structure):
+        return f'S{ctypes.sizeof(ctype)}'
+    if issubclass(ctype, ctypes._SimpleCData) and ctype._type_ in _log_scalars:
+        return ctype._type_
+    if ctype is c_void_p or issubclass(ctype, (ctypes._Pointer, ctypes.Array)):
+        return 'p'
+    return 'n'
+
+
+def _log_memory(value):
+    """Returns a copy of the memory `value` references (passed to a pointer
+    parameter), or None for NULL and bare addresses."""
+    if value is None or isinstance(value, int):
+        return None
+    if isinstance(value, ctypes._Pointer):
+        return bytes(value.contents) if value else None
+    if isinstance(value, _CArgObject):
+        value = value._obj
+    if isinstance(value, (c_char_p, c_void_p)):
+        return value.value if isinstance(value, c_char_p) else None
+    try:
+        return bytes(value)
+    except TypeError:
+        return None
+
+
+def _log_encode(kind, value, parts):
+    if kind == 'n':
+        return
+    if kind == 'z' or kind == 'p':
+        if kind == 'z' and value is not None and not isinstance(value, bytes):
+            value = value.value
+        data = value if kind == 'z' else _log_memory(value)
+        if data is None:
+            parts.append(_log_size.pack(-1))
+        else:
+            parts.append(_log_size.pack(len(data)))
+            parts.append(data)
+    elif kind[0] == 'S':
+        parts.append(bytes(value))
+    else:
+        if isinstance(value, ctypes._SimpleCData):
+            value = value.value
+        if kind == 'c' and isinstance(value, int):
+            value = bytes((value,))
+        parts.append(_log_scalars[kind].pack(value))
+
+
+class _LogTruncated(Exception):
+    """Raised when a call log ends in the middle of a record."""
+
+
+def _log_check(data, offset, size):
+    if offset + size > len(data):
+        raise _LogTruncated
+
+
+def _log_decode(kind, data, offset):
+    if kind == 'n':
+        return None, offset
+    if kind == 'z' or kind == 'p':
+        _log_check(data, offset, 4)
+        size, = _log_size.unpack_from(data, offset)
+        offset += 4
+        if size < 0:
+            return None, offset
+    elif kind[0] == 'S':
+        size = int(kind[1:])
+    else:
+        scalar = _log_scalars[kind]
+        _log_check(data, offset, scalar.size)
+        return scalar.unpack_from(data, offset)[0], offset + scalar.size
+    _log_check(data, offset, size)
+    return data[offset:offset + size], offset + size
+
+
+class _LoggedFunction(_StandIn):
+    """Stands for a foreign function while a call log is written (see
+    `log_calls`): logs each call with its arguments and result."""
+    __slots__ = ('ident', 'kinds', 'result_kind')
+
+    def __init__(self, name, func):
+        super().__init__(name, func)
+        self.ident = None
+
+    def __call__(self, *args):
+        result = self.func(*args)
+        _call_log.write(self, args, result)
+        return result
+
+
+class _CallLogWriter:
+    __slots__ = ('file', 'stand_ins', 'count', 'commands')
+
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        self.file.write(_log_magic)
+        self.stand_ins = {}
+        self.count = 0
+        self.commands = None
+
+    def define(self, name, kinds, result_kind):
+        """Declares a function (its arguments and result encoding), the
+        following calls refer to it by its number."""
+        self.count += 1
+        signature = f"{name}:{','.join(kinds)}:{result_kind}".encode()
+        self.file.write(_log_id.pack(0) + _log_id.pack(len(signature)) + signature)
+        return self.count
+
+    def write(self, stand_in, args, result):
+        if stand_in.ident is None:
+            func = stand_in.func
+            stand_in.kinds = [_log_kind(argtype) for argtype in func.argtypes or ()]
+            # only the memory a pointer argument references is known
+            result_kind = _log_kind(func.restype)
+            stand_in.result_kind = 'n' if result_kind == 'p' else result_kind
+            stand_in.ident = self.define(stand_in.name, stand_in.kinds, stand_in.result_kind)
+        parts = [_log_id.pack(stand_in.ident)]
+        for kind, value in zip(stand_in.kinds, args):
+            _log_encode(kind, value, parts)
+        _log_encode(stand_in.result_kind, result, parts)
+        self.file.write(b''.join(parts))
+
+    def write_commands(self, data):
+        if self.commands is None:
+            self.commands = self.define('_execute_commands', ['p'], 'n')
+        self.file.write(_log_id.pack(self.commands) + _log_size.pack(len(data)) + bytes(data))
+
+
+@contextmanager
+def log_calls(path):
+    """Writes the library calls made in the block to the binary call log
+    `path`, in order, with their arguments (structures and the memory
+    pointer arguments reference copied) and results, for `CallLog`. The
+    calls of batches, command buffers and display lists are logged too.
+    """
+    global _call_log
+    if not _logged_names:
+        raise RuntimeError("no function can be logged (the binding was generated with direct=True)")
+    if _call_log is not None:
+        raise RuntimeError("a call log is already being written")
+    if _recordings:
+        raise RuntimeError("calls can not be logged while recording a display list")
+    writer = _CallLogWriter(path)
+    try:
+        for name in _logged_names:
+            func = getattr(_rl, name, None)
+            if func is not None:
+                # by id: foreign functions are not hashable
+                stand_in = writer.stand_ins[id(func)] = _LoggedFunction(name, func)
+                setattr(_rl, name, stand_in)
+        _call_log = writer
+        yield
+    finally:
+        _call_log = None
+        for stand_in in writer.stand_ins.values():
+            setattr(_rl, stand_in.name, stand_in.func)
+        writer.file.close()
+
+
+def _logged_function(name):
+    """Returns the foreign function `name`, typed (a lazy one is bound)."""
+    if name == '_execute_commands':
+        return _execute_commands
+    if name not in _logged_names:
+        raise ValueError(f"the call log uses {name}, which is not part of this binding")
+    return _bound(name, _logged_names[name])
+
+
+class CallLog:
+    """The calls of a log written by `log_calls`: `calls` lists their names,
+    arguments and results (structures and referenced memory as bytes) and
+    `replay` issues them again. A log cut short (e.g. by a crash) keeps its
+    complete calls."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        if not data.startswith(_log_magic):
+            raise ValueError(f"{path} is not a call log")
+        self.calls = []
+        self._replayed = None
+        signatures = [None]
+        offset = len(_log_magic)
+        try:
+            while offset < len(data):
+                _log_check(data, offset, 2)
+                ident, = _log_id.unpack_from(data, offset)
+                offset += 2
+                if ident == 0:
+                    _log_check(data, offset, 2)
+                    size, = _log_id.unpack_from(data, offset)
+                    _log_check(data, offset + 2, size)
+                    name, kinds, result_kind = data[offset + 2:offset + 2 + size].decode().split(':')
+                    signatures.append((name, kinds.split(',') if kinds else [], result_kind))
+                    offset += 2 + size
+                    continue
+                name, kinds, result_kind = signatures[ident]
+                args = []
+                for kind in kinds:
+                    value, offset = _log_decode(kind, data, offset)
+                    args.append(value)
+                result, offset = _log_decode(result_kind, data, offset)
+                self.calls.append((name, tuple(args), result))
+        except _LogTruncated:
+            pass
+        except (StructError, ValueError, IndexError, KeyError):
+            raise ValueError(f"{path} is corrupted") from None
+
+    def __len__(self):
+        return len(self.calls)
+
+    def _prepare(self):
+        calls = []
+        for name, args, _ in self.calls:
+            func = _logged_function(name)
+            if func is _execute_commands:
+                calls.append((func, args))
+                continue
+            if len(args) != len(func.argtypes):
+                raise ValueError(f"the call log and the binding disagree on the signature of {name}")
+            converted = []
+            for argtype, value in zip(func.argtypes, args):
+                if value is None or not isinstance(value, bytes) or argtype is c_char_p:
+                    pass
+                elif issubclass(argtype, Structure):
+                    if len(value) != ctypes.sizeof(argtype):
+                        raise ValueError(f"the call log and the binding disagree on the size of {argtype.__name__}")
+                    value = argtype.from_buffer_copy(value)
+                else:
+                    buffer = ctypes.create_string_buffer(value, len(value))
+                    value = buffer if argtype is c_void_p else ctypes.cast(buffer, argtype)
+                converted.append(value)
+            calls.append((func, tuple(converted)))
+        return calls
+
+    def replay(self):
+        """Issues the logged calls again, in order, straight to the foreign
+        functions of the library this module loaded (e.g. the stand-in one,
+        see `RLCTBG_LIBRARY`), and returns the time taken by each frame (the
+        calls up to each `EndDrawing`), in seconds.
+
+        Pointer arguments reference copies of the logged memory; addresses
+        stored in structures (e.g. `Image.data`) and bare ones are passed as
+        they were logged, so replays against the real library are limited to
+        the calls that do not dereference them (drawing, input, timing).
+        """
+        if self._replayed is None:
+            self._replayed = self._prepare()
+        end = _foreign(_rl.EndDrawing) if 'EndDrawing' in _logged_names else None
+        times = []
+        start = _perf_counter()
+        for func, args in self._replayed:
+            func(*args)
+            if func is end:
+                now = _perf_counter()
+                times.append(now - start)
+                start = now
+        if not times or self._replayed[-1][0] is not end:
+            times.append(_perf_counter() - start)
+        return times
+
+# endregion (call logs)
+'''.split('\n')
+
+COMMANDS_SRC = '''
+class CommandBuffer:
+    """Records draw calls (`draw_*`, `begin_*`/`end_*` modes,
+    `clear_background`) into a packed buffer, run by `submit` with a single
+    foreign call through the native loops shim. The methods take the same
+    arguments as the functions (structures or tuples of their fields)."""
+    __slots__ = ('_data',)
+
+    def __init__(self):
+        self._data = bytearray()
+
+    def clear(self) -> None:
+        """Forgets the recorded commands."""
+        self._data.clear()
+
+    def submit(self, clear: bool = True) -> None:
+        """Runs the recorded commands in order, then forgets them unless `clear` is False."""
+        _execute_commands(self._data)
+        if clear:
+            self._data.clear()'''.split('\n')
+
+STRINGS_SRC = '''# region STRINGS
+
+# the UTF-8 encodings of the last strings passed as `char *` arguments
+_encoded = _lru_cache(1024)(str.encode)
+
+
+def _encode(value):
+    # a str is encoded (once while it stays in the cache), anything else,
+    # bytes included, goes to ctypes unchanged (the wrappers inline it)
+    return _encoded(value) if value.__class__ is str else value
+
+
+def _decode(value):
+    return None if value is None else value.decode('utf-8', 'replace')
+
+# endregion (strings)
+'''.split('\n')
+
+MEMO_SRC = '''# region MEMOIZED FUNCTIONS
+
+# the LRU caches of the `*_cached` variants of the pure functions, by name
+_memo_caches = {}
+
+
+def _memoized(name, func):
+    cache = _memo_caches[name] = _lru_cache({memo_size})(func)
+    return cache
+
+
+def memo_info():
+    """Returns the `functools.lru_cache` statistics (hits, misses, maxsize,
+    currsize) of the bound `*_cached` functions, by name."""
+    return {name: cache.cache_info() for name, cache in _memo_caches.items()}
+
+
+def clear_memo():
+    """Empties the caches of the `*_cached` functions and resets their statistics."""
+    for cache in _memo_caches.values():
+        cache.cache_clear()
+
+# endregion (memoized functions)
+'''.split('\n')
+
+PROFILE_SRC = '''# region PROFILER
+
+_profile_history = deque(maxlen=600)
+_profile_frame = {}
+_profile_totals = {}
+
+
+def _profile_record(name, start, call, end):
+    counters = _profile_frame.get(name)
+    if counters is None:
+        counters = _profile_frame[name] = [0, 0.0, 0.0]
+    counters[0] += 1
+    counters[1] += end - start
+    counters[2] += call - start
+
+
+def _profile_end_frame():
+    # a frame runs from one `end_drawing` to the next, update logic included
+    frame = {name: tuple(counters) for name, counters in _profile_frame.items()}
+    _profile_frame.clear()
+    _profile_history.append(frame)
+    for name, (calls, wall, marshal) in frame.items():
+        total_calls, total_wall, total_marshal = _profile_totals.get(name, (0, 0.0, 0.0))
+        _profile_totals[name] = (total_calls + calls, total_wall + wall, total_marshal + marshal)
+
+
+_frame_hooks.append(_profile_end_frame)
+
+
+def profile_frames():
+    """Returns the counters of the last 600 frames, oldest first: for each
+    frame, a dict mapping the raylib function names to (calls, wall time,
+    marshaling time), in seconds. The marshaling time is the part spent in
+    Python before the foreign call (batches only count their wall time)."""
+    return list(_profile_history)
+
+
+def profile_totals():
+    """Returns the counters (see `profile_frames`) summed over the frames
+    ended since the last `reset_profile`."""
+    return dict(_profile_totals)
+
+
+def reset_profile():
+    """Forgets the counters."""
+    _profile_history.clear()
+    _profile_frame.clear()
+    _profile_totals.clear()
+
+# endregion (profiler)
+'''.split('\n')
+
+FRAME_CACHE_SRC = '''# region FRAME CACHE
+
+# the results of the frame-stable functions, by function (and arguments)
+_frame_cache = {}
+
+
+def clear_frame_cache():
+    """Forgets the cached results (as `begin_drawing`, `end_drawing` and the
+    setters do), e.g. after resizing the window from outside raylib."""
+    _frame_cache.clear()
+
+# endregion (frame cache)
+'''.split('\n')
+
+LAZY_SRC = '''
+# region LAZY BINDING
+
+
+def __getattr__(name: str):
+    # PEP 562: functions are typed and bound on first access, then cached in
+    # the module globals so later lookups never reach this hook again.
+    binder = globals().pop('_bind_' + name, None)
+    if binder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    wrapper = globals()[name] = binder()
+    return wrapper
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+# endregion (lazy binding)
+'''.split('\n')
+
+PACKAGE_SRC = '''
+# region LAZY SUBMODULES
+
+
+def __getattr__(name: str):
+    # PEP 562: submodules are only imported when one of their functions (or
+    # the submodule itself) is first accessed.
+    module_name = _function_modules.get(name, name if name in _submodules else None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module('.' + module_name, __name__)
+    if module_name == name:
+        return module
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+# endregion (lazy submodules)
+'''.split('\n')
+
+CFFI_HEADER_SRC = '''# -*- encoding: utf-8 -*-
+
+# ============================================================================ #
+#                                   WARNING                                    #
+# ---------------------------------------------------------------------------- #
+#                           DO NOT MODIFY THIS FILE                            #
+#                                                                              #
+#                   This file is generated by source code.                     #
+#                   Changes in the source will not persist.                    #
+# ============================================================================ #
+
+
+import sys
+import os
+import importlib
+import keyword
+from enum import IntEnum, auto
+'''.split('\n')
+
+CFFI_LOADER_SRC = '''# region LIBRARY LOADER
+
+_lib_fname = {
+    'win32': 'raylib.dll',
+    'linux': 'libraylib.so.2.5.0',
+    'darwin': 'libraylib.2.5.0.dylib'
+}
+
+_lib_fname_abspath = os.path.join(os.path.dirname(os.path.abspath(__file__)), _lib_fname[sys.platform])
+_lib_fname_abspath = os.environ.get('RLCTBG_LIBRARY', _lib_fname_abspath)
+_lib_fname_abspath = os.path.normcase(os.path.normpath(_lib_fname_abspath))
+
+try:
+    # API (out-of-line) mode, compiled by the generated *_cffi_build.py script
+    _ffi_module = importlib.import_module(('.' if __package__ else '') + '{module}', __package__ or None)
+    ffi, lib = _ffi_module.ffi, _ffi_module.lib
+except ImportError:
+    # ABI mode
+    from cffi import FFI
+    ffi = FFI()
+    ffi.cdef(CDEF)
+    lib = ffi.dlopen(_lib_fname_abspath)
+
+# endregion (library loader)
+'''.split('\n')
+
+CFFI_BUILD_SRC = '''# -*- encoding: utf-8 -*-
+
+# ============================================================================ #
+#                                   WARNING                                    #
+# ---------------------------------------------------------------------------- #
+#                           DO NOT MODIFY THIS FILE                            #
+#                                                                              #
+#                   This file is generated by source code.                     #
+#                   Changes in the source will not persist.                    #
+# ============================================================================ #
+
+"""Builds the cffi API (out-of-line) mode extension of the binding.
+
+Run it from any folder; `raylib.h` and the raylib binary must be next to it.
+Without the extension, the binding falls back to the (slower) ABI mode.
+"""
+
+import sys
+import os
+from cffi import FFI
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+_lib_fname = {
+    'win32': 'raylib.dll',
+    'linux': 'libraylib.so.2.5.0',
+    'darwin': 'libraylib.2.5.0.dylib'
+}
+
+ffibuilder = FFI()
+ffibuilder.cdef(CDEF)
+
+if sys.platform == 'win32':
+    ffibuilder.set_source('{module}', '#include "raylib.h"', include_dirs=[_here], library_dirs=[_here],
+                          libraries=['raylib'])
+else:
+    ffibuilder.set_source('{module}', '#include "raylib.h"', include_dirs=[_here],
+                          extra_link_args=[os.path.join(_here, _lib_fname[sys.platform]), '-Wl,-rpath,' + _here])
+
+if __name__ == '__main__':
+    ffibuilder.compile(tmpdir=_here, verbose=True)
+'''.split('\n')
+
+NATIVE_C_SRC = '''/* ========================================================================== *
+ *                                  WARNING                                   *
+ * -------------------------------------------------------------------------- *
+ *                          DO NOT MODIFY THIS FILE                           *
+ *                                                                            *
+ *                  This file is generated by source code.                    *
+ *                  Changes in the source will not persist.                   *
+ * ========================================================================== */
+
+/* Native loops of the batched entry points and executor of the command
+ * buffers. They receive the raylib functions to call, so the shim does not
+ * link against raylib. */
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <string.h>
+
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#else
+#define EXPORT __attribute__((visibility("default")))
+#endif
+'''.split('\n')
+
+STUB_C_SRC = '''/* ========================================================================== *
+ *                                  WARNING                                   *
+ * -------------------------------------------------------------------------- *
+ *                          DO NOT MODIFY THIS FILE                           *
+ *                                                                            *
+ *                  This file is generated by source code.                    *
+ *                  Changes in the source will not persist.                   *
+ * ========================================================================== */
+
+/* Stand-in raylib: every function of the header does nothing and returns its
+ * first argument of the return type, or zero (zeroed structures, NULL). It
+ * loads without a display, to test and benchmark the bindings headless. */
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <string.h>
+
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#else
+#define EXPORT __attribute__((visibility("default")))
+#endif
+'''.split('\n')
+
+NATIVE_BUILD_SRC = '''# -*- encoding: utf-8 -*-
+
+# ============================================================================ #
+#                                   WARNING                                    #
+# ---------------------------------------------------------------------------- #
+#                           DO NOT MODIFY THIS FILE                            #
+#                                                                              #
+#                   This file is generated by source code.                     #
+#                   Changes in the source will not persist.                    #
+# ============================================================================ #
+
+"""Builds the native loops shim of the binding with the local C compiler.
+
+Run it from any folder; it needs neither raylib.h nor the raylib binary but
+a C compiler (`cc`, or the one the CC environment variable names).
+Without the shim, the batched functions loop in Python (one foreign call per item).
+"""
+
+import sys
+import os
+import subprocess
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+_native_fname = '{native}' + {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+
+if __name__ == '__main__':
+    subprocess.run([os.environ.get('CC', 'cc'), '-shared', '-fPIC', '-O2', '-o', os.path.join(_here, _native_fname),
+                    os.path.join(_here, '{native}.c')], check=True)
+'''.split('\n')
+
 
 class Regex(NamedTuple):
     name: str
@@ -161,13 +1672,7 @@ class Regex(NamedTuple):
         return self.rule.match(string)
 
     def replace(self, old_string: str):
-        while True:
-            m: Match = self.rule.search(old_string)
-            if m:
-                old_string = old_string.replace(m[0], m[1])
-            else:
-                break
-        return old_string
+        return self.rule.sub(lambda m: m[1], old_string)
 
 
 RULE_DEFINE = Regex("DEFINE", re.compile(r"\s*#define\s+(\w+)\s+([a-zA-Z0-9./()]+)(\s+.*)?"))
@@ -183,15 +1688,47 @@ RULE_TYPE_ALIAS_DEFINE = Regex("TYPE_ALIAS_DEFINE", re.compile(r"\s*#define\s+(\
 RULE_TYPE_ALIAS_TYPEDEF = Regex("TYPE_ALIAS_TYPEDEF", re.compile(r"\s*typedef\s+(\w+)\s+(\w+);(\s+// .*)?"))
 RULE_ENUM_BEGIN = Regex("ENUM_BEGIN", re.compile(r"typedef enum {"))
 RULE_ENUM_MEMBER = Regex("ENUM_MEMBER", re.compile(r"\s+(\w+),?(\s+.*)?"))
-RULE_ENUM_MEMBER_VALUE = Regex("ENUM_MEMBER", re.compile(r"\s+(\w+)\s+= (\d+),?(\s+.*)?"))
+RULE_ENUM_MEMBER_VALUE = Regex("ENUM_MEMBER_VALUE", re.compile(r"\s+(\w+)\s+= (\d+),?(\s+.*)?"))
 RULE_ENUM_END = Regex("ENUM_END", re.compile(r"} (\w+);"))
 RULE_NAME_ALIAS = Regex("NAME_ALIAS", re.compile(r"#define (\w+)\s+(\w+)"))
 RULE_CALLBACK_NOTATION = Regex("CALLBACK_NOTATION", re.compile(r"typedef (\w+)\s+\(\*(\w+)\)(.*);"))
 RULE_FUNCTION = Regex("FUNCTION", re.compile(r"RLAPI (const )?(unsigned )?(\w+) (\**)(\w+)(.*);"))
 RULE_PARAM = Regex("PARAM", re.compile(r"(const )?(unsigned )?(\w+) (\**)(\w+)"))
+RULE_PARAM_LIST = re.compile(r"(?:^|,)\s*(?:(\.\.\.)|(const )?(unsigned )?(\w+) (\**)(\w+))")
 
 RULE_PROCESS = re.compile(r"// @(\w+)( \d+)?")
+RULE_MODULE = re.compile(r"// .*\(Module: (\w+)\)")
+RULE_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
 RULE_COMMENT = re.compile(r"// (.*)")
+RULE_COUNT = re.compile(r"num[A-Z]\w*|\w*Count")
+
+# Rules enabled between `// @<section>_begin` and `// @<section>_end`, by order
+# of precedence: a line is handled by the first rule it matches.
+SECTION_RULES: Dict[str, List[Regex]] = {
+    'define': [RULE_DEFINE],
+    'color_defines': [RULE_COLOR_DEFINES],
+    'struct': [
+        RULE_STRUCT_BEGIN,
+        RULE_STRUCT_EMPTY,
+        RULE_STRUCT_MEMBER,
+        RULE_STRUCT_END,
+        RULE_TYPE_ALIAS_TYPEDEF,
+        RULE_TYPE_ALIAS_DEFINE,
+    ],
+    'enum': [
+        RULE_ENUM_BEGIN,
+        RULE_ENUM_MEMBER_VALUE,
+        RULE_ENUM_MEMBER,
+        RULE_ENUM_END,
+    ],
+    'functions': [RULE_FUNCTION],
+}
+
+# Rules enabled by `// @<command> <count>` for the next <count> matching lines.
+COUNTED_RULES: Dict[str, Regex] = {
+    'define_name_alias': RULE_NAME_ALIAS,
+    'callback_notation': RULE_CALLBACK_NOTATION,
+}
 
 C_TYPES = {
     'void',
@@ -227,6 +1764,115 @@ C_TO_PY_TYPES = {
     'c_longdouble': 'float',
 }
 
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 2
+
+IR_SUFFIX = '.ir.json'
+IR_VERSION = 2
+# Below this many bytes of headers to parse, starting worker processes costs
+# more than it saves (raylib.h, ~90 KB, parses in a few milliseconds).
+PARALLEL_PARSE_SIZE = 1 << 20
+
+# Submodules of a split binding package, in header order. Header modules not
+# listed here are merged according to MODULE_ALIASES, or get a submodule of
+# their own, after these.
+MODULES = [
+    'core',
+    'shapes',
+    'textures',
+    'text',
+    'models',
+    'shaders',
+    'audio',
+]
+
+MODULE_ALIASES = {
+    'gestures': 'core',
+    'camera': 'core',
+    'rlgl': 'shaders',
+}
+
+# Structures given the `make`, `set` and `scratch` fast paths (see `StructData.convert`).
+HOT_STRUCTS = [
+    'Vector2',
+    'Vector3',
+    'Vector4',
+    'Rectangle',
+    'Color',
+]
+
+# struct module formats of the ctypes scalars the fast paths can pack.
+C_TO_STRUCT_FORMATS = {
+    'c_bool': '?',
+    'c_byte': 'b',
+    'c_ubyte': 'B',
+    'c_short': 'h',
+    'c_ushort': 'H',
+    'c_int': 'i',
+    'c_uint': 'I',
+    'c_long': 'l',
+    'c_ulong': 'L',
+    'c_float': 'f',
+    'c_double': 'd',
+}
+
+# Batched entry points: the function called once per item and the names of
+# the arguments (see `BatchFunctionData`).
+BATCHES = {
+    'DrawRectangles': ('DrawRectangleRec', ['recs', 'colors']),
+    'DrawCircles': ('DrawCircleV', ['centers', 'radii', 'colors']),
+    'DrawLines': ('DrawLineV', ['starts', 'ends', 'colors']),
+    'DrawTexturesPro': ('DrawTexturePro', ['texture', 'src', 'dst', 'origins', 'rotations', 'tints']),
+}
+
+# The function ending a frame: its wrapper runs the swap hooks before the foreign
+# call and the frame hooks (`add_frame_hook`) after it.
+FRAME_END = 'EndDrawing'
+
+# Functions a `CommandBuffer` records: no return value and by-value parameters
+# of the same size in C and in `struct` standard sizes (see `command_functions`).
+COMMAND_PREFIXES = ('Draw', 'Begin', 'End', 'ClearBackground')
+COMMAND_EXCLUDED = ('BeginDrawing', FRAME_END)
+COMMAND_FORMATS = '?bBhHiIfd'
+
+# The functions `InputSnapshot` captures the input state with (in the order
+# the native capture takes them): it is only generated when the header
+# declares them all, and kept by `used_by` with them.
+INPUT_FUNCTIONS = ('IsKeyDown', 'IsKeyPressed', 'IsKeyReleased', 'IsMouseButtonDown', 'IsMouseButtonPressed',
+                   'IsMouseButtonReleased', 'GetMousePosition', 'GetMouseWheelMove', 'GetKeyPressed')
+
+# The same for `GamepadSnapshot` (in the order the native capture loop takes
+# them) and the enumerations sizing its arrays.
+GAMEPAD_FUNCTIONS = ('IsGamepadAvailable', 'IsGamepadButtonDown', 'GetGamepadAxisMovement')
+GAMEPAD_ENUMS = ('GamepadNumber', 'GamepadButton', 'GamepadAxis')
+
+# The runtime features of the generated module, by the public names an
+# application uses them through: a binding trimmed with `used_by` only
+# carries the features the application references.
+RUNTIME_FEATURES = {
+    'telemetry': ('FrameTelemetry',),
+    'commands': ('CommandBuffer',),
+    'display_lists': ('DisplayList', 'record'),
+    'call_logs': ('CallLog', 'log_calls'),
+    'input': ('InputSnapshot',),
+    'gamepads': ('GamepadSnapshot',),
+}
+
+# The pure functions (their result only depends on their arguments), that get
+# a memoized `*_cached` variant, and the default size of its LRU cache.
+PURE_FUNCTIONS = ('Fade', 'ColorToInt', 'GetColor', 'ColorFromHSV', 'ColorToHSV', 'ColorNormalize',
+                  'CheckCollisionRecs', 'GetCollisionRec', 'MeasureText')
+MEMO_SIZE = 256
+
+# The functions returning the same result all frame long (for the same
+# arguments), cached by the wrappers of a `frame_cache` binding, and those
+# invalidating the cache. GetTime is not one: it reads the clock every call.
+FRAME_STABLE = ('GetScreenWidth', 'GetScreenHeight', 'IsWindowResized', 'GetFrameTime', 'GetFPS',
+                'GetMousePosition', 'GetMouseX', 'GetMouseY', 'GetMouseWheelMove',
+                'GetCameraMatrix', 'GetCameraMatrix2D')
+FRAME_CACHE_INVALIDATORS = ('BeginDrawing', FRAME_END, 'SetWindowSize', 'ToggleFullscreen',
+                            'SetMousePosition', 'SetMouseOffset', 'SetMouseScale')
+
 PROCESS_LINES = [
     'define_begin',
     'define_end',
@@ -299,194 +1945,1018 @@ def typename(unsigned: bool, dtype: str, ptr_level: int, array_len: int) -> str:
     return dtype
 
 
+def manifest_path(path_to_output: str) -> str:
+    """Returns the location of the manifest stored next to the generated output."""
+    return path_to_output.rstrip('/\\') + MANIFEST_SUFFIX
+
+
+def file_digest(location: str) -> str:
+    """Returns the sha256 hex digest of a file contents."""
+    sha = hashlib.sha256()
+    with open(location, 'rb') as src:
+        sha.update(src.read())
+    return sha.hexdigest()
+
+
+def file_stamp(location: str) -> Dict[str, Union[str, int]]:
+    """Returns the mtime, size and content digest of a file."""
+    st: os.stat_result = os.stat(location)
+    return {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': file_digest(location)}
+
+
+def stamp_matches(location: str, stamp: Optional[Dict[str, Union[str, int]]]) -> bool:
+    """Checks a file against a stamp recorded by `file_stamp`.
+
+    The mtime and size are compared first; the content is only hashed when
+    they differ (e.g. after a fresh checkout), so an untouched file costs a
+    single stat call. When only the mtime changed, the stamp takes the new
+    one: the caller saves it so that the next check is a stat call again.
+    """
+    if not stamp:
+        return False
+    try:
+        st: os.stat_result = os.stat(location)
+    except OSError:
+        return False
+    if st.st_mtime_ns == stamp.get('mtime_ns') and st.st_size == stamp.get('size'):
+        return True
+    if st.st_size == stamp.get('size') and file_digest(location) == stamp.get('sha256'):
+        stamp['mtime_ns'] = st.st_mtime_ns
+        return True
+    return False
+
+
+def stamps_match(stamps: List[Tuple[str, Optional[Dict[str, Union[str, int]]]]]) -> Tuple[bool, bool]:
+    """Checks files against their stamps (see `stamp_matches`), in order.
+
+    Returns whether they all match and whether a stamp took a new mtime.
+    """
+    mtimes: List = [stamp.get('mtime_ns') if stamp else None for _, stamp in stamps]
+    if not all(stamp_matches(location, stamp) for location, stamp in stamps):
+        return False, False
+    return True, mtimes != [stamp.get('mtime_ns') for _, stamp in stamps]
+
+
+def is_up_to_date(path_to_header: str, path_to_output: str, options: Optional[Dict] = None) -> bool:
+    """Returns True if the output was generated from this header, generator and options."""
+    try:
+        with open(manifest_path(path_to_output), 'r') as src:
+            manifest: Dict = json.load(src)
+    except (OSError, ValueError):
+        return False
+
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('options') != (options or {}):
+        return False
+
+    outputs: Dict[str, Dict] = manifest.get('outputs') or {}
+    if not outputs:
+        return False
+    matches, refreshed = stamps_match([(path_to_header, manifest.get('header')),
+                                       (os.path.abspath(__file__), manifest.get('generator'))]
+                                      + list(outputs.items()))
+    if refreshed:
+        try:
+            with open(manifest_path(path_to_output), 'w') as output:
+                json.dump(manifest, output, indent=4)
+        except OSError:
+            pass
+    return matches
+
+
+def write_manifest(path_to_header: str, path_to_output: str, outputs: List[str], options: Optional[Dict] = None):
+    manifest: Dict = {
+        'version': MANIFEST_VERSION,
+        'options': options or {},
+        'header': file_stamp(path_to_header),
+        'generator': file_stamp(os.path.abspath(__file__)),
+        'outputs': {location: file_stamp(location) for location in outputs},
+    }
+    with open(manifest_path(path_to_output), 'w') as output:
+        json.dump(manifest, output, indent=4)
+
+
+def write_if_changed(location: str, content: str) -> bool:
+    """Writes the content only if it differs from the file's, keeping its mtime
+    (and so the cached bytecode of a generated module) otherwise."""
+    try:
+        with open(location, 'r') as src:
+            if src.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(location, 'w') as output:
+        output.write(content)
+    return True
+
+
 def wrap_header(path_to_header: Optional[str] = None, path_to_output: Optional[str] = None,
-                import_module: bool=False) -> Union[str, ModuleType]:
+                import_module: bool=False, force: bool = False, lazy: bool = False,
+                direct: bool = False, split: bool = False,
+                used_by: Optional[List[str]] = None, backend: str = 'ctypes',
+                profile: bool = False, frame_cache: bool = False,
+                memo_size: Optional[int] = MEMO_SIZE, decode_strings: bool = False,
+                native: bool = False) -> Union[str, ModuleType]:
+    """Generates the binding module from the header (unless it is up to date).
+
+    With `lazy` the functions are not typed nor bound at import time: a module
+    level `__getattr__` resolves each one on first access and caches it.
+
+    With `direct` the functions are exported as the foreign function objects
+    themselves instead of Python wrappers (see `FunctionData.convert`).
+
+    With `split` the output is a package (by default `rlctbg/raylib/`, which
+    shadows `raylib.py`) with one submodule per raylib module sharing a
+    `common` module of constants, structures and enumerations. The package
+    imports the submodules lazily, on first access to one of their functions.
+
+    With `used_by` (a list of application source files or packages) the
+    output only contains the functions the application references, the
+    constants, structures and enumerations they reach, the used palette
+    entries and the referenced runtime features (see `find_used_names`,
+    `tree_shake` and `RUNTIME_FEATURES`).
+
+    With `backend='cffi'` the output exposes the same functions, structures
+    and constants on top of cffi instead of ctypes, without the runtime
+    helpers (see `generate_cffi`).
+
+    With `profile` every function wrapper counts its calls, wall time and
+    marshaling time, per frame (see `PROFILE_SRC`). Without it, the output
+    has no instrumentation at all.
+
+    With `frame_cache` (off by default) the functions returning the same
+    result all frame long (`FRAME_STABLE`: screen size, frame time, mouse
+    state, camera matrices...) only call raylib once per frame and arguments
+    (returning a copy of the cached structures).
+
+    The `PURE_FUNCTIONS` (`fade`, `color_to_int`, `check_collision_recs`,
+    `measure_text`...) get a `*_cached` variant keeping the results of the
+    last `memo_size` distinct arguments (without limit for None, no variant
+    for 0).
+
+    The wrappers accept `str` as well as `bytes` for the `char *` parameters
+    (encoded in UTF-8). With `decode_strings` they also return `str` instead
+    of `bytes` for the `char *` results, and `direct` keeps the wrappers of
+    the functions taking strings.
+
+    With `native` the C source of the native loops of the batches, commands,
+    gamepads and `InputSnapshot` capture (`<module>_native.c`) and the
+    script compiling it (`<module>_native_build.py`) are written next to the
+    binding (see `write_native`). Without the compiled shim, these loop in
+    Python.
+    """
+    if backend not in ('ctypes', 'cffi'):
+        raise ValueError(f"unknown backend: {backend!r}")
+    if backend == 'cffi' and (lazy or split or profile or frame_cache or decode_strings or native
+                              or memo_size != MEMO_SIZE):
+        raise ValueError("lazy, split, profiled, frame cached, memoized, decoding and native outputs are only "
+                         "available for the ctypes backend")
+    if direct and profile:
+        raise ValueError("profiled outputs need the function wrappers (direct=False)")
+    if profile and frame_cache:
+        raise ValueError("profiled outputs can not cache results (frame_cache=False)")
+
     if path_to_header is None:
         path_to_header = os.path.join(os.path.dirname(os.path.abspath(__file__)), "raylib.h")
     if path_to_output is None:
-        path_to_output = os.path.join(os.path.dirname(os.path.abspath(__file__)), "raylib.py")
+        path_to_output = os.path.join(os.path.dirname(os.path.abspath(__file__)), "raylib" if split else "raylib.py")
+
+    options: Dict = {'lazy': lazy, 'direct': direct, 'split': split, 'used_names': None}
+    if used_by is not None:
+        options['used_names'] = find_used_names(used_by)
+    if backend != 'ctypes':
+        options['backend'] = backend
+    if profile:
+        options['profile'] = True
+    if frame_cache:
+        options['frame_cache'] = True
+    if memo_size != MEMO_SIZE:
+        options['memo_size'] = memo_size
+    if decode_strings:
+        options['decode_strings'] = True
+    if native:
+        options['native'] = True
+    if force or not is_up_to_date(path_to_header, path_to_output, options):
+        if backend == 'cffi':
+            outputs: List[str] = generate_cffi(load_header(path_to_header), path_to_output, direct=direct,
+                                               used_names=options['used_names'])
+        else:
+            outputs: List[str] = generate(load_header(path_to_header), path_to_output, **options)
+        write_manifest(path_to_header, path_to_output, outputs, options)
+
+    if import_module:
+        folder, modname = os.path.split(os.path.splitext(os.path.abspath(path_to_output))[0])
+        if folder == os.path.dirname(os.path.abspath(__file__)):
+            # e.g. the default rlctbg/raylib.py or rlctbg/raylib/ package
+            return importlib.import_module(f".{modname}", __name__)
+        return importlib.import_module(modname)
+    else:
+        return path_to_output
+
+
+def wrap_headers(paths_to_headers: List[str], paths_to_outputs: Optional[List[str]] = None,
+                 import_modules: bool = False, force: bool = False, lazy: bool = False,
+                 direct: bool = False, split: bool = False, used_by: Optional[List[str]] = None,
+                 workers: Optional[int] = None, profile: bool = False,
+                 frame_cache: bool = False, memo_size: Optional[int] = MEMO_SIZE,
+                 decode_strings: bool = False, native: bool = False) -> List[Union[str, ModuleType]]:
+    """Generates one binding module per header (e.g. raylib.h, rlgl.h,
+    raymath.h), parsing the headers in parallel worker processes.
+
+    The outputs default to `<header name>.py` next to each header and must be
+    in the same folder: a type, enumeration or constant declared by several
+    headers is defined by the module of the first one and imported by the
+    others (see `share_declarations`), so a `Vector3` or a `Matrix` is the
+    same class in every module. The other options are those of `wrap_header`.
+
+    On platforms that spawn the worker processes (Windows, macOS), call it
+    from an `if __name__ == '__main__':` block; `workers=1` parses in process.
+    """
+    if direct and profile:
+        raise ValueError("profiled outputs need the function wrappers (direct=False)")
+    if profile and frame_cache:
+        raise ValueError("profiled outputs can not cache results (frame_cache=False)")
+    if paths_to_outputs is None:
+        paths_to_outputs = [os.path.splitext(path)[0] + ("" if split else ".py") for path in paths_to_headers]
+    if len(paths_to_outputs) != len(paths_to_headers):
+        raise ValueError("expected one output per header")
+    if len({os.path.dirname(os.path.abspath(path)) for path in paths_to_outputs}) > 1:
+        raise ValueError("the outputs must be in the same folder")
+
+    modules: List[str] = [os.path.splitext(os.path.basename(path.rstrip('/\\')))[0] for path in paths_to_outputs]
+    package: str = os.path.basename(os.path.dirname(os.path.abspath(paths_to_outputs[0])))
+    headers: List[HeaderData] = parse_headers(paths_to_headers, workers)
+    imports: List[Dict[str, List[str]]] = share_declarations(modules, headers)
+
+    used_names: List[Optional[List[str]]] = [None] * len(headers)
+    if used_by is not None:
+        used_names = [find_used_names(used_by, f"{package}.{module}") for module in modules]
+        # an owner keeps what the other modules import from it
+        for shared in imports:
+            for owner, names in shared.items():
+                index: int = modules.index(owner)
+                if used_names[index] is not None:
+                    used_names[index] = sorted(set(used_names[index]) | set(names))
+
+    for i, header in enumerate(headers):
+        options: Dict = {'lazy': lazy, 'direct': direct, 'split': split, 'used_names': used_names[i]}
+        if imports[i]:
+            options['imports'] = imports[i]
+        if profile:
+            options['profile'] = True
+        if frame_cache:
+            options['frame_cache'] = True
+        if memo_size != MEMO_SIZE:
+            options['memo_size'] = memo_size
+        if decode_strings:
+            options['decode_strings'] = True
+        if native:
+            options['native'] = True
+        if force or not is_up_to_date(paths_to_headers[i], paths_to_outputs[i], options):
+            outputs: List[str] = generate(header, paths_to_outputs[i], **options)
+            write_manifest(paths_to_headers[i], paths_to_outputs[i], outputs, options)
+
+    if import_modules:
+        return [importlib.import_module(f"{package}.{module}") for module in modules]
+    return paths_to_outputs
+
+
+@functools.lru_cache(maxsize=None)
+def compile_rules(rules: Tuple[Regex, ...]) -> Tuple[Pattern, Dict[str, Tuple[int, ...]]]:
+    """Combines the comment rule and `rules` into a single alternation.
+
+    Each rule becomes a named group, so one match per line both selects the
+    rule (`Match.lastgroup`) and captures its groups; the returned dict maps
+    every rule name to the indices of its groups in the combined pattern.
+    """
+    rules = (Regex("COMMENT", RULE_COMMENT),) + rules
+    pattern: Pattern = re.compile('|'.join(f"(?P<{rule.name}>{rule.rule.pattern})" for rule in rules))
+    groups: Dict[str, Tuple[int, ...]] = {}
+    for rule in rules:
+        index: int = pattern.groupindex[rule.name]
+        groups[rule.name] = tuple(range(index, index + rule.rule.groups + 1))
+    return pattern, groups
+
+
+def parse_header(path_to_header: str) -> 'HeaderData':
+    """Parses the annotated header into its intermediate representation."""
+    return HeaderParser().parse(load_source(path_to_header))
+
+
+def ir_cache_path(path_to_header: str) -> str:
+    """Returns the location of the intermediate representation cached for a header."""
+    return path_to_header + IR_SUFFIX
+
+
+def load_cached_header(path_to_header: str) -> Optional['HeaderData']:
+    """Returns the header from its JSON cache, or None if the cache is missing or stale."""
+    try:
+        with open(ir_cache_path(path_to_header), 'r') as src:
+            cached: Dict = json.load(src)
+        if cached.get('version') != IR_VERSION:
+            return None
+        matches, refreshed = stamps_match([(path_to_header, cached.get('header')),
+                                           (os.path.abspath(__file__), cached.get('generator'))])
+        if matches:
+            header: HeaderData = HeaderData.from_dict(cached['data'])
+            if refreshed:
+                write_ir_cache(path_to_header, json.dumps(cached))
+            return header
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def load_header(path_to_header: str, cache: bool = True) -> 'HeaderData':
+    """Returns the parsed header, reloaded from its JSON cache when still valid.
+
+    The cache is stored next to the header and is invalidated by any change in
+    the header or in the generator. Every output (bindings, stubs, benchmark
+    harnesses...) is produced from the returned `HeaderData`.
+    """
+    if cache:
+        cached: Optional[HeaderData] = load_cached_header(path_to_header)
+        if cached is not None:
+            return cached
+
+    header: HeaderData = parse_header(path_to_header)
+    if cache:
+        write_ir_cache(path_to_header, json.dumps(ir_cache(path_to_header, header)))
+    return header
+
+
+def ir_cache(path_to_header: str, header: 'HeaderData') -> Dict:
+    """Returns the JSON cache of a parsed header (see `load_header`)."""
+    return {
+        'version': IR_VERSION,
+        'header': file_stamp(path_to_header),
+        'generator': file_stamp(os.path.abspath(__file__)),
+        'data': header.to_dict(),
+    }
+
+
+def write_ir_cache(path_to_header: str, text: str):
+    try:
+        with open(ir_cache_path(path_to_header), 'w') as output:
+            output.write(text)
+    except OSError:
+        pass
+
+
+def parse_header_json(path_to_header: str) -> str:
+    """Parses a header in a worker process of `parse_headers` and returns its
+    JSON cache, much cheaper to send back than the `HeaderData` objects."""
+    return json.dumps(ir_cache(path_to_header, parse_header(path_to_header)))
+
+
+def usable_cpus() -> int:
+    """Returns the number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parse_headers(paths_to_headers: List[str], workers: Optional[int] = None) -> List['HeaderData']:
+    """Loads several headers (see `load_header`), parsing the ones whose cache is
+    stale in parallel worker processes (by default one per CPU).
+
+    The headers are parsed in process when there is a single one to parse,
+    a single usable CPU or less than `PARALLEL_PARSE_SIZE` bytes of them. The
+    workers send the JSON caches back and the caches are written here.
+    """
+    headers: List[Optional[HeaderData]] = [load_cached_header(path) for path in paths_to_headers]
+    pending: List[int] = [i for i, header in enumerate(headers) if header is None]
+    workers = min(usable_cpus() if workers is None else workers, usable_cpus(), len(pending))
+    if workers > 1 and sum(os.path.getsize(paths_to_headers[i]) for i in pending) >= PARALLEL_PARSE_SIZE:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            texts: List[str] = list(executor.map(parse_header_json, [paths_to_headers[i] for i in pending]))
+        for i, text in zip(pending, texts):
+            write_ir_cache(paths_to_headers[i], text)
+            headers[i] = HeaderData.from_dict(json.loads(text)['data'])
+    else:
+        for i in pending:
+            headers[i] = load_header(paths_to_headers[i])
+    return headers
+
+
+def share_declarations(modules: List[str], headers: List['HeaderData']) -> List[Dict[str, List[str]]]:
+    """Makes the binding modules share the types and constants of their headers.
+
+    The first module whose header declares a structure, enumeration, alias,
+    callback, constant or color owns it: the following headers lose their
+    declaration of it, and the returned imports (one dict per module, see
+    `generate`) make their module import the owner's instead, so every module
+    uses the same classes. The types a header only uses (e.g. the `Matrix`
+    an rlgl function returns) are imported from their owner too.
+    """
+    registry: Dict[str, str] = {}
+    imports: List[Dict[str, List[str]]] = []
+    for module, header in zip(modules, headers):
+        shared: Dict[str, List[str]] = {}
+
+        def share(owner: str, names: List[str]):
+            owned_names: List[str] = shared.setdefault(owner, [])
+            owned_names.extend(name for name in names if registry.get(name) == owner and name not in owned_names)
+
+        def owned(item: Union['Declaration', 'ColorData']) -> bool:
+            owner: Optional[str] = next((registry[name] for name in item.names if name in registry), None)
+            if owner is None or owner == module:
+                registry.update((name, module) for name in item.names)
+                return True
+            share(owner, item.names)
+            return False
+
+        header.declarations = [declaration for declaration in header.declarations if owned(declaration)]
+        header.palette = [color for color in header.palette if owned(color)]
+
+        declared: set = {name for item in header.declarations + header.palette for name in item.names}
+        for item in header.declarations + header.palette + header.functions:
+            for name in item.dependencies:
+                if name not in declared and registry.get(name, module) != module:
+                    share(registry[name], [name])
+        imports.append(shared)
+    return imports
+
+
+def batch_functions(functions: List['FunctionData']) -> List['BatchFunctionData']:
+    """Returns the batched entry points (see `BATCHES`) of the functions found in the header."""
+    by_name: Dict[str, FunctionData] = {func.name: func for func in functions}
+    return [BatchFunctionData(name, by_name[function], params)
+            for name, (function, params) in BATCHES.items() if function in by_name]
+
+
+def command_functions(functions: List['FunctionData']) -> List['FunctionData']:
+    """Returns the functions a `CommandBuffer` records (see `COMMAND_PREFIXES`), in opcode order."""
+    return [func for func in functions
+            if not isinstance(func, BatchFunctionData) and func.name.startswith(COMMAND_PREFIXES)
+            and func.name not in COMMAND_EXCLUDED and func.rettype == 'void' and func.ptr_level == 0
+            and all(p.command_format is not None for p in func.params)]
+
+
+def recorded_functions(functions: List['FunctionData']) -> List['FunctionData']:
+    """Returns the drawing functions `record` captures: the commands (see
+    `command_functions`) and those taking pointers or strings."""
+    return [func for func in functions
+            if not isinstance(func, BatchFunctionData) and func.name.startswith(COMMAND_PREFIXES)
+            and func.name not in COMMAND_EXCLUDED and func.rettype == 'void' and func.ptr_level == 0
+            and not any(p.is_varargs for p in func.params)]
+
+
+def generate(header: 'HeaderData', path_to_output: str, lazy: bool = False, direct: bool = False,
+             split: bool = False, used_names: Optional[List[str]] = None,
+             imports: Optional[Dict[str, List[str]]] = None, profile: bool = False,
+             frame_cache: bool = False, memo_size: Optional[int] = MEMO_SIZE,
+             decode_strings: bool = False, native: bool = False) -> List[str]:
+    """Generates the binding code and returns the list of files it is made of.
+
+    `imports` maps sibling binding modules to the names (declared by their
+    headers) this module imports and re-exports instead of defining them.
+    """
+    exported_names: List[str] = ["__all__ = [", "    'add_frame_hook',", "    'remove_frame_hook',",
+                                 "    'struct_dtype',", "    'as_array',", "    'as_ctypes',",
+                                 "    'memo_info',", "    'clear_memo',"]
+    if profile:
+        exported_names.extend(["    'profile_frames',", "    'profile_totals',", "    'reset_profile',"])
+    if frame_cache:
+        exported_names.append("    'clear_frame_cache',")
+    generated_code: List[str] = []
+    for module, names in (imports or {}).items():
+        generated_code.append(f"from {'..' if split else '.'}{module} import (")
+        generated_code.extend(f"    {name}," for name in names)
+        generated_code.append(")\n")
+        exported_names.extend(f"    '{name}'," for name in names)
+    funcion_wrappers: List[str] = []
+    declarations: List[Declaration] = header.declarations
+    palette: List[ColorData] = header.palette
+    functions: List[FunctionData] = header.functions + batch_functions(header.functions)
+
+    features: set = set(RUNTIME_FEATURES)
+    if used_names is not None:
+        used: set = set(used_names)
+        features = {feature for feature, names in RUNTIME_FEATURES.items() if used.intersection(names)}
+        if 'display_lists' in features:
+            # the lists made of commands replay in one foreign call
+            features.add('commands')
+        if 'InputSnapshot' in used:
+            used.update(func.py_name for func in functions if func.name in INPUT_FUNCTIONS)
+        if 'GamepadSnapshot' in used:
+            used.update(func.py_name for func in functions if func.name in GAMEPAD_FUNCTIONS)
+            used.update(GAMEPAD_ENUMS)
+        if 'CommandBuffer' in used:
+            # its methods are not `rl.<name>` accesses: it keeps every command
+            used.update(func.py_name for func in command_functions(functions))
+        used.update(func.py_name for func in functions if f"{func.py_name}_cached" in used)
+        declarations, palette, functions = tree_shake(declarations, palette, functions, used)
+
+    for i, declaration in enumerate(declarations):
+        declaration.convert(generated_code, exported_names)
+        # runs of defines and of name aliases end with a blank line
+        following: Optional[Declaration] = declarations[i + 1] if i + 1 < len(declarations) else None
+        if declaration.kind in ('define', 'alias') and (following is None or following.kind != declaration.kind):
+            generated_code.append("")
+
+    palette_code: List[str] = []
+    for color in palette:
+        color.convert(palette_code, [])
+
+    # the field layouts `struct_dtype` builds the NumPy dtypes from
+    palette_code.extend(["", "_dtype_fields = {"])
+    for declaration in declarations:
+        if isinstance(declaration, StructData):
+            declaration.convert_dtype(palette_code)
+    palette_code.extend(["}", ""])
+
+    # the native loops of the batched functions and the command buffer
+    # executor, compiled apart (see `write_native`)
+    batches: List[BatchFunctionData] = [func for func in functions if isinstance(func, BatchFunctionData)]
+    commands: List[FunctionData] = command_functions(functions) if 'commands' in features else []
+    if commands:
+        palette_code.extend(COMMANDS_SRC)
+        for opcode, func in enumerate(commands):
+            func.convert_command(palette_code, opcode)
+        palette_code.extend(["", ""])
+        exported_names.append("    'CommandBuffer',")
+    # the opcodes (in order) and `CommandBuffer` methods of the commands
+    palette_code.append("_command_names = {")
+    palette_code.extend(f"    '{func.name}': '{func.py_name}'," for func in commands)
+    palette_code.extend(["}", ""])
+
+    # the input snapshots and the functions they capture with
+    input_functions: List[FunctionData] = [func for name in INPUT_FUNCTIONS for func in functions if func.name == name]
+    if 'input' in features and len(input_functions) == len(INPUT_FUNCTIONS):
+        palette_code.extend(INPUT_SRC)
+        palette_code.append("_input_functions = {")
+        palette_code.extend(f"    '{func.name}': '{func.py_name}'," for func in input_functions)
+        palette_code.extend(["}", ""])
+        exported_names.append("    'InputSnapshot',")
+    else:
+        input_functions = []
+    gamepad_functions: List[FunctionData] = [func for name in GAMEPAD_FUNCTIONS
+                                             for func in functions if func.name == name]
+    enums: set = {name for declaration in declarations if isinstance(declaration, EnumData)
+                  for name in declaration.names[:1]}
+    if ('gamepads' in features and len(gamepad_functions) == len(GAMEPAD_FUNCTIONS)
+            and enums.issuperset(GAMEPAD_ENUMS)):
+        palette_code.extend(GAMEPADS_SRC)
+        palette_code.append("_gamepad_functions = {")
+        palette_code.extend(f"    '{func.name}': '{func.py_name}'," for func in gamepad_functions)
+        palette_code.extend(["}", ""])
+        exported_names.append("    'GamepadSnapshot',")
+    else:
+        gamepad_functions = []
+
+    # the functions `record` captures: the direct ones can not be replaced
+    if 'display_lists' in features:
+        palette_code.append("_recorded_names = frozenset({")
+        if not direct:
+            palette_code.extend(f"    '{func.name}'," for func in recorded_functions(functions))
+        palette_code.extend(["})", ""])
+        exported_names.extend(["    'DisplayList',", "    'record',"])
+
+    # the functions `log_calls` logs (by C name, with the wrapper binding them)
+    if 'call_logs' in features:
+        palette_code.append("_logged_names = {")
+        if not direct:
+            palette_code.extend(f"    '{func.name}': '{func.py_name}',"
+                                for func in functions if not isinstance(func, BatchFunctionData))
+        palette_code.extend(["}", ""])
+        exported_names.extend(["    'CallLog',", "    'log_calls',"])
+    if 'telemetry' in features:
+        exported_names.append("    'FrameTelemetry',")
+    # the module `_bound` binds the lazy functions through
+    palette_code.extend([f"_functions_module = {'__package__' if split else '__name__'}", ""])
+
+    if split:
+        # the palette must reach the package namespace through `import *`
+        palette_names: List[str] = [f"    '{color.name}'," for color in palette]
+        outputs: List[str] = write_package(path_to_output, exported_names + palette_names,
+                                           generated_code + palette_code, functions, lazy, direct, profile,
+                                           frame_cache, memo_size, decode_strings, features)
+        if native and (batches or commands or gamepad_functions or input_functions):
+            outputs.extend(write_native(declarations, batches, commands, os.path.join(path_to_output, "_native"),
+                                        gamepad_functions, input_functions))
+        return outputs
+
+    for func in functions:
+        func.convert(funcion_wrappers, exported_names, lazy=lazy, direct=direct, profile=profile,
+                     frame_cache=frame_cache, memo_size=memo_size, decode_strings=decode_strings)
+    exported_names.append(']\n')
+    if lazy:
+        funcion_wrappers.extend(LAZY_SRC)
+    native_name: str = f"{os.path.splitext(os.path.basename(path_to_output))[0]}_native"
+    runtime: List[str] = runtime_code(features, native_name, profile, frame_cache, memo_size)
+    write_if_changed(path_to_output, '\n'.join(HEADER_SRC + LOADER_SRC + runtime
+                                              + exported_names + generated_code + palette_code + funcion_wrappers) + '\n')
+    outputs: List[str] = [path_to_output]
+    if native and (batches or commands or gamepad_functions or input_functions):
+        outputs.extend(write_native(declarations, batches, commands,
+                                    os.path.join(os.path.dirname(path_to_output), native_name), gamepad_functions,
+                                    input_functions))
+    return outputs
+
+
+def runtime_code(features: set, native_name: str, profile: bool = False, frame_cache: bool = False,
+                 memo_size: Optional[int] = MEMO_SIZE) -> List[str]:
+    """Returns the runtime helpers of the module, with the blocks of the
+    `features` (see `RUNTIME_FEATURES`) and of the options only."""
+    blocks: List[List[str]] = [FRAME_SRC]
+    if 'telemetry' in features:
+        blocks.append(TELEMETRY_SRC)
+    blocks.extend([NUMPY_SRC, NATIVE_SRC])
+    if 'display_lists' in features:
+        blocks.append(DISPLAY_LISTS_SRC)
+    if 'call_logs' in features:
+        blocks.append(CALL_LOGS_SRC)
+    blocks.extend([STRINGS_SRC, MEMO_SRC])
+    if profile:
+        blocks.append(PROFILE_SRC)
+    if frame_cache:
+        blocks.append(FRAME_CACHE_SRC)
+    return [line.replace('{native}', native_name).replace('{memo_size}', str(memo_size))
+            for block in blocks for line in block]
+
+
+def write_native(declarations: List['Declaration'], batches: List['BatchFunctionData'],
+                 commands: List['FunctionData'], location: str,
+                 gamepads: Optional[List['FunctionData']] = None,
+                 inputs: Optional[List['FunctionData']] = None) -> List[str]:
+    """Writes the C source (`<location>.c`) of the native loops of `batches`,
+    of the executor of the `commands` (see `FunctionData.convert_command`)
+    and, given the `GAMEPAD_FUNCTIONS` and the `INPUT_FUNCTIONS`, of the
+    gamepads and input capture loops, and the script compiling it, and
+    returns their paths.
+
+    The structures are declared from the IR, so the shim does not need
+    raylib.h; the loops and the executor receive the raylib functions to call.
+    """
+    source: List[str] = list(NATIVE_C_SRC)
+    for declaration in declarations:
+        if isinstance(declaration, StructData) or (isinstance(declaration, AliasData) and declaration.typedef):
+            declaration.cdef(source)
+    source.append("")
+    called: Dict[str, FunctionData] = {func.name: func for func in [batch.function for batch in batches] + commands
+                                       + (gamepads or []) + (inputs or [])}
+    for func in called.values():
+        func.cdef_pointer(source)
+    for batch in batches:
+        batch.convert_native(source)
+    if commands:
+        source.extend([
+            "",
+            "EXPORT int ExecuteCommands(void **rl_funcs, const unsigned char *rl_data, int rl_size)",
+            "{",
+            "    const unsigned char *rl_cursor = rl_data;",
+            "    const unsigned char *rl_end = rl_data + rl_size;",
+            "    int rl_count = 0;",
+            "    while (rl_cursor < rl_end) {",
+            "        int rl_opcode;",
+            "        if ((size_t)(rl_end - rl_cursor) < sizeof(rl_opcode)) return -1;",
+            "        memcpy(&rl_opcode, rl_cursor, sizeof(rl_opcode)); rl_cursor += sizeof(rl_opcode);",
+            "        switch (rl_opcode) {",
+        ])
+        for opcode, func in enumerate(commands):
+            func.convert_native_command(source, opcode)
+        source.extend([
+            "        default:",
+            "            return -1;",
+            "        }",
+            "        rl_count++;",
+            "    }",
+            "    return rl_count;",
+            "}",
+        ])
+    if gamepads:
+        available, down, movement = (f"{func.name}Func" for func in gamepads)
+        source.extend([
+            "",
+            "EXPORT void CaptureGamepads(void **rl_funcs, int rl_pads, int rl_buttons, int rl_axes,",
+            "                            bool *rl_available, bool *rl_down, float *rl_movement)",
+            "{",
+            "    for (int rl_pad = 0; rl_pad < rl_pads; rl_pad++) {",
+            f"        bool rl_ready = rl_available[rl_pad] = (({available})rl_funcs[0])(rl_pad);",
+            "        for (int rl_button = 0; rl_button < rl_buttons; rl_button++) {",
+            f"            rl_down[rl_pad*rl_buttons + rl_button] = rl_ready && (({down})rl_funcs[1])(rl_pad, rl_button);",
+            "        }",
+            "        for (int rl_axis = 0; rl_axis < rl_axes; rl_axis++) {",
+            f"            rl_movement[rl_pad*rl_axes + rl_axis] = rl_ready ? (({movement})rl_funcs[2])(rl_pad, rl_axis) : 0.0f;",
+            "        }",
+            "    }",
+            "}",
+        ])
+    if inputs:
+        key_down, key_pressed, key_released, button_down, button_pressed, button_released, mouse, wheel, key = (
+            f"{func.name}Func" for func in inputs)
+        source.extend([
+            "",
+            "EXPORT int CaptureInput(void **rl_funcs, const int *rl_codes, int rl_keys, int rl_buttons,",
+            "                        unsigned long long *rl_bits, Vector2 *rl_mouse, int *rl_wheel, int *rl_pressed)",
+            "{",
+            "    memset(rl_bits, 0, 6*sizeof(*rl_bits));",
+            "    for (int rl_i = 0; rl_i < rl_keys; rl_i++) {",
+            f"        if ((({key_down})rl_funcs[0])(rl_codes[rl_i])) rl_bits[0] |= 1ULL << rl_i;",
+            f"        if ((({key_pressed})rl_funcs[1])(rl_codes[rl_i])) rl_bits[1] |= 1ULL << rl_i;",
+            f"        if ((({key_released})rl_funcs[2])(rl_codes[rl_i])) rl_bits[2] |= 1ULL << rl_i;",
+            "    }",
+            "    for (int rl_i = 0; rl_i < rl_buttons; rl_i++) {",
+            "        int rl_code = rl_codes[rl_keys + rl_i];",
+            f"        if ((({button_down})rl_funcs[3])(rl_code)) rl_bits[3] |= 1ULL << rl_i;",
+            f"        if ((({button_pressed})rl_funcs[4])(rl_code)) rl_bits[4] |= 1ULL << rl_i;",
+            f"        if ((({button_released})rl_funcs[5])(rl_code)) rl_bits[5] |= 1ULL << rl_i;",
+            "    }",
+            f"    *rl_mouse = (({mouse})rl_funcs[6])();",
+            f"    *rl_wheel = (({wheel})rl_funcs[7])();",
+            "    int rl_count = 0;",
+            "    while (rl_count < 64) {",
+            f"        int rl_key = (({key})rl_funcs[8])();",
+            "        if (rl_key <= 0) break;",
+            "        rl_pressed[rl_count++] = rl_key;",
+            "    }",
+            "    return rl_count;",
+            "}",
+        ])
+    write_if_changed(location + ".c", '\n'.join(source) + '\n')
+
+    native_name: str = os.path.basename(location)
+    build: List[str] = [line.replace('{native}', native_name) for line in NATIVE_BUILD_SRC]
+    write_if_changed(location + "_build.py", '\n'.join(build) + '\n')
+    return [location + ".c", location + "_build.py"]
+
+
+def generate_cffi(header: 'HeaderData', path_to_output: str, direct: bool = False,
+                  used_names: Optional[List[str]] = None) -> List[str]:
+    """Generates the binding on top of cffi and returns the list of files it is made of.
+
+    The module has the same names as the ctypes one (structures are factories
+    returning owning struct cdata) and loads the API mode extension when the
+    `<module>_cffi_build.py` script written next to it has been run, falling
+    back to ABI mode otherwise. Pointers must be cffi cdata (`ffi.NULL`
+    instead of None).
+
+    It has none of the runtime of the ctypes module: no frame hooks, NumPy
+    views, batches, `*_cached` variants, structure fast paths (`make`, `set`,
+    `scratch`) nor `RUNTIME_FEATURES`. With `used_names`, referencing one of
+    them raises a ValueError.
+    """
+    if used_names is not None:
+        unavailable: set = {'add_frame_hook', 'remove_frame_hook', 'struct_dtype', 'as_array', 'as_ctypes',
+                            'memo_info', 'clear_memo'}
+        unavailable.update(name for names in RUNTIME_FEATURES.values() for name in names)
+        unavailable.update(f"{to_snake_case(name)}_cached" for name in PURE_FUNCTIONS)
+        unavailable.update(batch.py_name for batch in batch_functions(header.functions))
+        missing: List[str] = sorted(unavailable.intersection(used_names))
+        if missing:
+            raise ValueError(f"not available with the cffi backend: {', '.join(missing)}")
 
-    lines: List[str] = load_source(path_to_header)
-    active_rules: List[Regex] = []
     exported_names: List[str] = ["__all__ = ["]
     generated_code: List[str] = []
     funcion_wrappers: List[str] = []
-    palette: List[str] = []
-    callback_counter: int = 0
-    define_alias_counter: int = 0
-    last_comment: str = ""
-
-    with open(path_to_output, 'w') as output:
-        for lineno, line in enumerate(lines):
-            comment: Match = re.match(RULE_COMMENT, line)
-            if comment:
-                last_comment = comment[1]
-                m: Match = re.match(RULE_PROCESS, line)
-                if m:
-                    last_comment = ""
-                    command: str = m[1]
-                    # print(lineno + 1, command)
-                    if command == 'define_begin':
-                        active_rules.append(RULE_DEFINE)
-                    elif command == 'define_end':
-                        active_rules.remove(RULE_DEFINE)
-                        generated_code.append("")
-                    elif command == 'functions_begin':
-                        active_rules.append(RULE_FUNCTION)
-                    elif command == 'functions_end':
-                        active_rules.remove(RULE_FUNCTION)
-                    elif command == 'struct_begin':
-                        active_rules.append(RULE_STRUCT_BEGIN)
-                        active_rules.append(RULE_STRUCT_EMPTY)
-                        active_rules.append(RULE_STRUCT_MEMBER)
-                        active_rules.append(RULE_STRUCT_END)
-                        active_rules.append(RULE_TYPE_ALIAS_TYPEDEF)
-                        active_rules.append(RULE_TYPE_ALIAS_DEFINE)
-                    elif command == 'struct_end':
-                        active_rules.remove(RULE_STRUCT_BEGIN)
-                        active_rules.remove(RULE_STRUCT_EMPTY)
-                        active_rules.remove(RULE_STRUCT_MEMBER)
-                        active_rules.remove(RULE_STRUCT_END)
-                        active_rules.remove(RULE_TYPE_ALIAS_TYPEDEF)
-                        active_rules.remove(RULE_TYPE_ALIAS_DEFINE)
-                    elif command == 'enum_begin':
-                        active_rules.append(RULE_ENUM_BEGIN)
-                        active_rules.append(RULE_ENUM_MEMBER)
-                        active_rules.append(RULE_ENUM_MEMBER_VALUE)
-                        active_rules.append(RULE_ENUM_END)
-                    elif command == 'enum_end':
-                        active_rules.remove(RULE_ENUM_BEGIN)
-                        active_rules.remove(RULE_ENUM_MEMBER)
-                        active_rules.remove(RULE_ENUM_MEMBER_VALUE)
-                        active_rules.remove(RULE_ENUM_END)
-                    elif command == 'callback_notation':
-                         callback_counter = int(m[2], 10)
-                         active_rules.append(RULE_CALLBACK_NOTATION)
-                    elif command == 'color_defines_begin':
-                        active_rules.append(RULE_COLOR_DEFINES)
-                    elif command == 'color_defines_end':
-                        active_rules.remove(RULE_COLOR_DEFINES)
-                    elif command == 'define_name_alias':
-                        define_alias_counter = int(m[2], 10)
-                        active_rules.append(RULE_NAME_ALIAS)
-            else:
-                for rule in active_rules:
-                    match: Match = rule(line)
-                    if match:
-                        # print(f"{rule.name} ({lineno + 1}): {line[:-1]}", file=output)
-                        if rule is RULE_NAME_ALIAS:
-                            generated_code.append(f"{match[1]} = {match[2]}")
-                            exported_names.append(f"    '{match[1]}',")
-                            define_alias_counter -= 1
-                            if define_alias_counter <= 0:
-                                active_rules.remove(RULE_NAME_ALIAS)
-                                generated_code.append("")
-                        if rule is RULE_TYPE_ALIAS_TYPEDEF:
-                            generated_code.append(f"\n{match[2]} = {match[1]}\n")
-                            exported_names.append(f"    '{match[2]}',")
-                        if rule is RULE_TYPE_ALIAS_DEFINE:
-                            generated_code.append(f"\n{match[1]} = {match[2]}\n")
-                            exported_names.append(f"    '{match[1]}',")
-                        if rule is RULE_STRUCT_EMPTY:
-                            generated_code.append(f"\nclass {match[1]}(Structure):\n    pass\n")
-                            exported_names.append(f"    '{match[1]}',")
-                        elif rule is RULE_DEFINE:
-                            value: str = match[2]
-                            value = RULE_REALNUM_SUFFIX.replace(value)
-                            generated_code.append(f"{match[1]} = {value}")
-                            exported_names.append(f"    '{match[1]}',")
-                        elif rule is RULE_ENUM_BEGIN:
-                            EnumData.begin(last_comment)
-                        elif rule is RULE_ENUM_MEMBER:
-                            EnumData.current.add_member(match[1], 'auto()')
-                        elif rule is RULE_ENUM_MEMBER_VALUE:
-                            EnumData.current.add_member(match[1], match[2])
-                        elif rule is RULE_ENUM_END:
-                            EnumData.current.name = match[1]
-                            EnumData.end(generated_code, exported_names)
-
-                        elif rule is RULE_COLOR_DEFINES:
-                            color_comment = match[3].replace("//", '#')
-                            palette.append(f"{match[1]} = Color({match[2]}) {color_comment}")
-
-                        elif rule is RULE_STRUCT_BEGIN:
-                            StructData.begin(last_comment)
-                            StructData.current.name = match[1]
-                        elif rule is RULE_STRUCT_EMPTY:
-                            print('#')
-                        elif rule is RULE_STRUCT_MEMBER:
-                            # print(lineno + 1, match.groups())
-                            name: str = match[3]
-                            arraymatch: Match = RULE_STRUCT_MEMBER_ARRAY(name)
-                            array_len: Optional[str] = None
-                            if arraymatch:
-                                name = arraymatch[1]
-                                array_len = arraymatch[2]
-                            StructData.current.add_field(name, match[1], array_len)
-                        elif rule is RULE_STRUCT_END:
-                            StructData.end(generated_code, exported_names)
-
-                        elif rule is RULE_CALLBACK_NOTATION:
-                            cb_name: str = match[2]
-                            cb_type: typename(False, match[1], 0, -1)
-                            cb_params: List[str] = match[3].strip('()').split(', ')
-                            cb_ptypes: List[str] = []
-                            for param in cb_params:
-                                parammatch: Match = RULE_PARAM(param)
-                                if parammatch:
-                                    cb_ptypes.append(typename(
-                                        parammatch[2] is not None,
-                                        parammatch[3],
-                                        len(parammatch[4]),
-                                        -1
-                                    ))
-                            callback: str = f"{cb_name} = CFUNCTYPE({', '.join(cb_ptypes)})"
-                            generated_code.append("")
-                            generated_code.append(callback)
-                            generated_code.append("")
-                            exported_names.append(f"    '{cb_name}',")
-                            print(callback)
-                            callback_counter -= 1
-                            if callback_counter <= 0:
-                                active_rules.remove(RULE_CALLBACK_NOTATION)
-
-                        elif rule is RULE_FUNCTION:
-                            func: FunctionData = FunctionData()
-                            func.unsigned = match[2] is not None
-                            func.rettype = match[3]
-                            func.ptr_level = len(match[4])
-                            func.name = match[5]
-                            params: str = match[6]
-                            if params != '(void)':
-                                if ',' in params:
-                                    paramlist: List[str] = params.strip('()').split(', ')
-                                else:
-                                    paramlist: List[str] = [params.strip('()')]
-                                for param in paramlist:
-                                    if param == '...':
-                                        func.add_param(False, '', 0, '', True)
-                                    else:
-                                        parammatch: Match = RULE_PARAM(param)
-                                        if parammatch:
-                                            func.add_param(
-                                                parammatch[2] is not None,
-                                                parammatch[3],
-                                                len(parammatch[4]),
-                                                parammatch[5],
-                                                False
-                                            )
-                            func.convert(funcion_wrappers, exported_names)
-
-        exported_names.append(']\n')
-        for line in (LOADER_SRC + exported_names + generated_code + palette + funcion_wrappers):
-            print(line, file=output)
+    cdef: List[str] = []
+    declarations: List[Declaration] = header.declarations
+    palette: List[ColorData] = header.palette
+    functions: List[FunctionData] = header.functions
+
+    if used_names is not None:
+        declarations, palette, functions = tree_shake(declarations, palette, functions, set(used_names))
+
+    for i, declaration in enumerate(declarations):
+        if isinstance(declaration, (StructData, CallbackData)):
+            declaration.cdef(cdef)
+            declaration.convert_cffi(generated_code, exported_names)
+        else:
+            if isinstance(declaration, AliasData) and declaration.typedef:
+                declaration.cdef(cdef)
+            declaration.convert(generated_code, exported_names)
+        following: Optional[Declaration] = declarations[i + 1] if i + 1 < len(declarations) else None
+        if declaration.kind in ('define', 'alias') and (following is None or following.kind != declaration.kind):
+            generated_code.append("")
+
+    palette_code: List[str] = []
+    for color in palette:
+        color.convert(palette_code, [])
+
+    for func in functions:
+        func.cdef(cdef)
+        func.convert_cffi(funcion_wrappers, exported_names, direct=direct)
+    exported_names.append(']\n')
+
+    modname: str = os.path.splitext(os.path.basename(path_to_output))[0]
+    ffi_modname: str = f"_{modname}_cffi"
+    cdef_src: List[str] = ["CDEF = '''"] + cdef + ["'''", ""]
+    loader: List[str] = [line.replace('{module}', ffi_modname) for line in CFFI_LOADER_SRC]
+    write_if_changed(path_to_output, '\n'.join(CFFI_HEADER_SRC + cdef_src + loader + exported_names + generated_code
+                                              + palette_code + funcion_wrappers) + '\n')
+
+    location: str = os.path.join(os.path.dirname(path_to_output), f"{modname}_cffi_build.py")
+    build: List[str] = [line.replace('{module}', ffi_modname) for line in CFFI_BUILD_SRC]
+    build.insert(build.index("ffibuilder = FFI()"), '\n'.join(cdef_src))
+    write_if_changed(location, '\n'.join(build) + '\n')
+
+    return [path_to_output, location]
+
+
+def write_stub(header: 'HeaderData', path_to_source: str) -> str:
+    """Writes the C source of a stand-in library implementing every function
+    of the header (see `FunctionData.convert_stub`) and returns its path."""
+    source: List[str] = list(STUB_C_SRC)
+    for declaration in header.declarations:
+        if isinstance(declaration, (StructData, CallbackData)) or (isinstance(declaration, AliasData)
+                                                                    and declaration.typedef):
+            declaration.cdef(source)
+    for func in header.functions:
+        func.convert_stub(source)
+    write_if_changed(path_to_source, '\n'.join(source) + '\n')
+    return path_to_source
+
+
+def compile_library(path_to_source: str, path_to_library: str) -> str:
+    """Compiles a C source into a shared library with the local C compiler
+    (`cc`, or the one the CC environment variable names) and returns its path.
+    """
+    import subprocess
+
+    subprocess.run([os.environ.get('CC', 'cc'), '-shared', '-fPIC', '-O2', '-o', path_to_library, path_to_source],
+                   check=True)
+    return path_to_library
+
+
+def build_stub(path_to_header: Optional[str] = None, path_to_library: Optional[str] = None) -> str:
+    """Builds a stand-in for the raylib binary from the header and returns its path.
+
+    Its functions do nothing (see `FunctionData.convert_stub`), so the
+    bindings can be imported, tested and benchmarked without raylib nor a
+    display: point the `RLCTBG_LIBRARY` environment variable at it before
+    importing the binding. The C source is written next to the library
+    (by default `rlctbg/libraylib_stub.so`, or .dll/.dylib).
+    """
+    if path_to_header is None:
+        path_to_header = os.path.join(os.path.dirname(os.path.abspath(__file__)), "raylib.h")
+    if path_to_library is None:
+        extension: str = {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+        path_to_library = os.path.join(os.path.dirname(os.path.abspath(__file__)), "libraylib_stub" + extension)
+    path_to_source: str = write_stub(load_header(path_to_header), os.path.splitext(path_to_library)[0] + ".c")
+    return compile_library(path_to_source, path_to_library)
+
+
+def find_used_names(sources: List[str], module: str = 'rlctbg.raylib') -> Optional[List[str]]:
+    """Scans application sources for the names they take from the binding module.
+
+    `sources` are python files or folders (searched recursively). Both
+    `<alias>.<name>` attribute accesses (after `import rlctbg.raylib as <alias>`
+    or `from rlctbg import raylib as <alias>`) and `from rlctbg.raylib import
+    <name>` are recognized. Returns None if a source star-imports the module,
+    since its usage can not be known.
+    """
+    package, _, basename = module.rpartition('.')
+    files: List[str] = []
+    for source in sources:
+        if os.path.isdir(source):
+            for folder, _, filenames in os.walk(source):
+                files.extend(os.path.join(folder, f) for f in sorted(filenames) if f.endswith('.py'))
+        else:
+            files.append(source)
+
+    used: set = set()
+    for location in files:
+        with open(location, 'r') as src:
+            tree: ast.AST = ast.parse(src.read(), location)
+
+        aliases: set = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name == module:
+                        aliases.add(alias.asname or module)
+            elif isinstance(node, ast.ImportFrom):
+                if node.module == module:
+                    for alias in node.names:
+                        if alias.name == '*':
+                            return None
+                        used.add(alias.name)
+                elif node.module == package:
+                    for alias in node.names:
+                        if alias.name == basename:
+                            aliases.add(alias.asname or basename)
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute):
+                value: ast.AST = node.value
+                # rebuilds dotted names such as `rlctbg.raylib`
+                dotted: List[str] = []
+                while isinstance(value, ast.Attribute):
+                    dotted.insert(0, value.attr)
+                    value = value.value
+                if isinstance(value, ast.Name):
+                    dotted.insert(0, value.id)
+                    if '.'.join(dotted) in aliases:
+                        used.add(node.attr)
+
+    return sorted(used)
+
+
+def tree_shake(declarations: List['Declaration'], palette: List['ColorData'], functions: List['FunctionData'],
+               used: set) -> tuple:
+    """Drops what is not reachable from the used names.
+
+    Functions and palette entries are kept if used; constants, structures,
+    enumerations, aliases and callbacks are kept if used or needed (through
+    field, parameter, return and alias types) by something kept.
+    """
+    functions = [func for func in functions if func.py_name in used]
+    palette = [color for color in palette if set(color.names) & used]
+
+    providers: Dict[str, 'Declaration'] = {}
+    for declaration in declarations:
+        for name in declaration.names:
+            providers[name] = declaration
+
+    pending: List[str] = list(used)
+    for item in functions + palette:
+        pending.extend(item.dependencies)
+
+    reached: set = set()
+    while pending:
+        name: str = pending.pop()
+        declaration: Optional['Declaration'] = providers.get(name)
+        if declaration is None or id(declaration) in reached:
+            continue
+        reached.add(id(declaration))
+        pending.extend(declaration.dependencies)
+
+    declarations = [d for d in declarations if not d.names or id(d) in reached]
+    return declarations, palette, functions
+
+
+def write_package(path_to_output: str, exported_names: List[str], common_code: List[str],
+                  functions: List['FunctionData'], lazy: bool, direct: bool, profile: bool = False,
+                  frame_cache: bool = False, memo_size: Optional[int] = MEMO_SIZE,
+                  decode_strings: bool = False, features: Optional[set] = None) -> List[str]:
+    """Writes the binding as a package of lazily imported submodules (see `wrap_header`)."""
+    os.makedirs(path_to_output, exist_ok=True)
+    outputs: List[str] = []
+
+    # the binaries stay next to the package, not inside it
+    loader: List[str] = [line.replace("os.path.dirname(os.path.abspath(__file__))",
+                                      "os.path.dirname(os.path.dirname(os.path.abspath(__file__)))")
+                         for line in LOADER_SRC]
+    location: str = os.path.join(path_to_output, "common.py")
+    runtime: List[str] = runtime_code(set(RUNTIME_FEATURES) if features is None else features, '_native',
+                                      profile, frame_cache, memo_size)
+    write_if_changed(location, '\n'.join(HEADER_SRC + loader + runtime + exported_names
+                                          + [']\n'] + common_code) + '\n')
+    outputs.append(location)
+
+    modules: List[str] = list(MODULES)
+    for func in functions:
+        if func.module not in modules:
+            if not func.module.isidentifier() or keyword.iskeyword(func.module) or func.module.startswith('_') \
+                    or func.module == 'common':
+                raise ValueError(f"{func.name} is in module {func.module!r}, which can not be a submodule name")
+            modules.append(func.module)
+
+    function_modules: List[str] = ["_function_modules = {"]
+    for module in modules:
+        wrappers: List[str] = []
+        exports: List[str] = ["__all__ = ["]
+        for func in functions:
+            if func.module == module:
+                func.convert(wrappers, exports, lazy=lazy, direct=direct, profile=profile, frame_cache=frame_cache,
+                             memo_size=memo_size, decode_strings=decode_strings)
+                function_modules.append(f"    '{to_snake_case(func.name)}': '{module}',")
+                if memo_size != 0 and func.name in PURE_FUNCTIONS:
+                    function_modules.append(f"    '{to_snake_case(func.name)}_cached': '{module}',")
+        exports.append(']\n')
+        if lazy:
+            wrappers.extend(LAZY_SRC)
+        imports: List[str] = ["from .common import *",
+                              "from .common import _rl, _frame_hooks, _swap_hooks, _struct_array, _draw_batch, _memoized",
+                              "from .common import _encoded, _encode, _decode", ""]
+        if profile:
+            imports.insert(-1, "from .common import _profile_record")
+        if frame_cache:
+            imports.insert(-1, "from .common import _frame_cache")
+        location = os.path.join(path_to_output, f"{module}.py")
+        write_if_changed(location, '\n'.join(HEADER_SRC + imports + exports + wrappers) + '\n')
+        outputs.append(location)
+    function_modules.append("}\n")
+
+    package: List[str] = [
+        "# -*- encoding: utf-8 -*-",
+        "",
+        "import importlib",
+        "",
+        "from .common import *",
+        "from .common import __all__ as _common_all",
+        "",
+        f"_submodules = {tuple(modules)!r}",
+        "",
+    ]
+    package.extend(function_modules)
+    package.append("__all__ = _common_all + list(_function_modules)")
+    package.extend(PACKAGE_SRC)
+    location = os.path.join(path_to_output, "__init__.py")
+    write_if_changed(location, '\n'.join(package) + '\n')
+    outputs.append(location)
 
-    if import_module:
-        modname: str = os.path.basename(path_to_output)[:-3]
-        exec(f"import {modname}")
-        return globals()[modname]
-    else:
-        return path_to_output
+    return outputs
 
 # endregion (functions)
 # ---------------------------------------------------------
@@ -494,6 +2964,7 @@ def wrap_header(path_to_header: Optional[str] = None, path_to_output: Optional[s
 
 
 class EnumData:
+    kind: str = 'enum'
     current: Optional['EnumData'] = None
 
     @classmethod
@@ -502,9 +2973,9 @@ class EnumData:
         cls.current = cls(doc)
 
     @classmethod
-    def end(cls, lines: List[str], export: List[str]):
+    def end(cls, declarations: List['Declaration']):
         if cls.current:
-            cls.current.convert(lines, export)
+            declarations.append(cls.current)
             cls.current = None
 
     def __init__(self, doc: str = ""):
@@ -522,6 +2993,30 @@ class EnumData:
             self.prefix = prefix
         self.members[mname] = value
 
+    @property
+    def names(self) -> List[str]:
+        return [self.name] + [f"{self.prefix}_{n}" for n in self.members]
+
+    @property
+    def dependencies(self) -> List[str]:
+        return []
+
+    def to_dict(self) -> Dict:
+        return {
+            'kind': self.kind,
+            'name': self.name,
+            'doc': self.doc,
+            'members': [[f"{self.prefix}_{n}", None if v == 'auto()' else int(v, 10)] for n, v in self.members.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EnumData':
+        enum: EnumData = cls(data['doc'])
+        enum.name = data['name']
+        for name, value in data['members']:
+            enum.add_member(name, 'auto()' if value is None else str(value))
+        return enum
+
     def convert(self, lines: List[str], export: List[str]):
         assert self.name != "", "Enum name is undefined."
         assert len(self.members), "Enum is empty."
@@ -570,6 +3065,7 @@ class StructData:
         'c_void_p'
     ]
 
+    kind: str = 'struct'
     current: Optional['StructData'] = None
 
     @classmethod
@@ -578,9 +3074,9 @@ class StructData:
         cls.current = cls(doc)
 
     @classmethod
-    def end(cls, lines: List[str], export: List[str]):
+    def end(cls, declarations: List['Declaration']):
         if cls.current:
-            cls.current.convert(lines, export)
+            declarations.append(cls.current)
             cls.current = None
 
     def __init__(self, doc: str = ""):
@@ -588,6 +3084,47 @@ class StructData:
         self.name: str = ""
         self.fields: List[StructFieldData] = []
 
+    @property
+    def names(self) -> List[str]:
+        return [self.name]
+
+    @property
+    def dependencies(self) -> List[str]:
+        return [field.type for field in self.fields]
+
+    def to_dict(self) -> Dict:
+        return {
+            'kind': self.kind,
+            'name': self.name,
+            'doc': self.doc,
+            'fields': [field.to_dict() for field in self.fields],
+        }
+
+    def cdef(self, lines: List[str]):
+        if not self.fields:
+            lines.append(f"typedef struct {self.name} {self.name};")
+            return
+        lines.append(f"typedef struct {self.name} {{")
+        for field in self.fields:
+            lines.append(f"    {field.c_declaration()};")
+        lines.append(f"}} {self.name};")
+
+    def convert_cffi(self, lines: List[str], exports: List[str]):
+        lines.append("")
+        lines.append(f"def {self.name}(*args, **kwargs):")
+        if self.doc != "":
+            lines.append(f'    """{self.doc}"""')
+        lines.append(f"    return ffi.new('{self.name} *', kwargs or args)[0]")
+        lines.append("")
+        exports.append(f"    '{self.name}',")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StructData':
+        struct: StructData = cls(data['doc'])
+        struct.name = data['name']
+        struct.fields = [StructFieldData.from_dict(field) for field in data['fields']]
+        return struct
+
     def add_field(self, name: str, ftype: str, array_len: Optional[str] = None):
         if ',' in name:
             names = name.split(', ')
@@ -605,17 +3142,64 @@ class StructData:
             self.fields.append(field)
 
     def convert(self, lines: List[str], exports: List[str]):
+        if not self.fields:
+            # opaque type (`typedef struct rAudioBuffer rAudioBuffer;`)
+            lines.append(f"\nclass {self.name}(Structure):\n    __slots__ = ()\n")
+            exports.append(f"    '{self.name}',")
+            return
+
         lines.append("")
         lines.append(f"class {self.name}(Structure):")
         if self.doc != "":
             lines.append(f'    """{self.doc}"""')
+        # no per-instance __dict__ on top of the C buffer
+        lines.append(f"    __slots__ = ()")
         lines.append(f"    _fields_ = [")
         for field in self.fields:
             field.convert(lines)
         lines.append(f"    ]")
+        if self.name in HOT_STRUCTS:
+            self.convert_fast_paths(lines)
         lines.append("")
         exports.append(f"    '{self.name}',")
 
+    def convert_dtype(self, lines: List[str]):
+        """Appends the `_dtype_fields` entry of the structure (opaque ones have none)."""
+        if self.fields:
+            lines.append(f"    {self.name}: [{', '.join(field.dtype_spec() for field in self.fields)}],")
+
+    def convert_fast_paths(self, lines: List[str]):
+        """Appends the `make`, `set` and `scratch` methods, which pack all the
+        fields at once with `struct` instead of setting them one by one."""
+        ctypes: List[str] = [typename(f.unsigned, f.type, f.ptr_level, f.array_len) for f in self.fields]
+        if not all(dtype in C_TO_STRUCT_FORMATS for dtype in ctypes):
+            return
+        pack_into: str = f"_pack_into=Struct('{''.join(C_TO_STRUCT_FORMATS[dtype] for dtype in ctypes)}').pack_into"
+        params: str = ", ".join(f"{f.name}: {C_TO_PY_TYPES[dtype]}" for f, dtype in zip(self.fields, ctypes))
+        names: str = ", ".join(f.name for f in self.fields)
+        lines.extend([
+            "",
+            "    @staticmethod",
+            f"    def make({params}, {pack_into}) -> '{self.name}':",
+            '        """Builds an instance packing all the fields at once."""',
+            f"        obj = {self.name}()",
+            f"        _pack_into(obj, 0, {names})",
+            "        return obj",
+            "",
+            f"    def set(self, {params}, {pack_into}) -> '{self.name}':",
+            '        """Overwrites all the fields in place and returns the instance."""',
+            f"        _pack_into(self, 0, {names})",
+            "        return self",
+            "",
+            "    @staticmethod",
+            f"    def scratch({params}, _pool=_ScratchPool(), {pack_into}) -> '{self.name}':",
+            '        """Like `make`, but the instance is reused after `end_drawing`: do not keep it."""',
+            f"        obj = _pool.free.pop() if _pool.free else {self.name}()",
+            "        _pool.used.append(obj)",
+            f"        _pack_into(obj, 0, {names})",
+            "        return obj",
+        ])
+
 
 class StructFieldData:
 
@@ -626,21 +3210,88 @@ class StructFieldData:
         self.ptr_level: int = 0
         self.array_len: int = -1
 
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StructFieldData':
+        field: StructFieldData = cls()
+        vars(field).update(data)
+        return field
+
+    def c_declaration(self) -> str:
+        array: str = f"[{self.array_len}]" if self.array_len > 0 else ""
+        return f"{'unsigned ' if self.unsigned else ''}{self.type.strip()} {'*' * self.ptr_level}{self.name}{array}"
+
     def convert(self, lines: List[str]):
         dtype: str = typename(self.unsigned, self.type, self.ptr_level, self.array_len)
         lines.append(f"       ('{self.name}', {dtype}),")
 
+    def dtype_spec(self) -> str:
+        """Returns the `(name, format or structure, count)` of the field for `struct_dtype`."""
+        dtype: str = typename(self.unsigned, self.type, self.ptr_level, -1)
+        count: int = max(self.array_len, 0)
+        if dtype.startswith('POINTER(') or dtype in ('c_char_p', 'c_void_p'):
+            ftype: str = "'P'"
+        elif dtype == 'c_char':
+            ftype, count = f"'S{count or 1}'", 0
+        elif dtype in C_TO_STRUCT_FORMATS:
+            ftype = f"'{C_TO_STRUCT_FORMATS[dtype]}'"
+        else:
+            ftype = dtype
+        return f"('{self.name}', {ftype}, {count})"
+
 
 class FunctionData:
+    kind: str = 'function'
 
     def __init__(self):
         self.name: str = ''
         self.rettype: str = ''
         self.ptr_level: int = 0
         self.unsigned: bool = False
+        self.is_const: bool = False
+        self.module: str = MODULES[0]
         self.params: List[FunctionParamData] = []
 
-    def add_param(self, unsigned: bool, ptype: str, ptr_level: int, name: str, is_varargs: bool = False):
+    @property
+    def py_name(self) -> str:
+        return to_snake_case(self.name)
+
+    @property
+    def names(self) -> List[str]:
+        return [self.name]
+
+    @property
+    def dependencies(self) -> List[str]:
+        return [self.rettype] + [p.type for p in self.params if not p.is_varargs]
+
+    def to_dict(self) -> Dict:
+        return {
+            'kind': self.kind,
+            'name': self.name,
+            'rettype': self.rettype,
+            'ptr_level': self.ptr_level,
+            'unsigned': self.unsigned,
+            'is_const': self.is_const,
+            'module': self.module,
+            'params': [param.to_dict() for param in self.params],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FunctionData':
+        func: FunctionData = cls()
+        func.name = data['name']
+        func.rettype = data['rettype']
+        func.ptr_level = data['ptr_level']
+        func.unsigned = data['unsigned']
+        func.is_const = data['is_const']
+        func.module = data['module']
+        func.params = [FunctionParamData.from_dict(param) for param in data['params']]
+        return func
+
+    def add_param(self, unsigned: bool, ptype: str, ptr_level: int, name: str, is_varargs: bool = False,
+                  is_const: bool = False):
         param: FunctionParamData = FunctionParamData()
         if is_varargs:
             param.is_varargs = True
@@ -649,26 +3300,363 @@ class FunctionData:
             param.type = ptype
             param.ptr_level = ptr_level
             param.name = name
+            param.is_const = is_const
         self.params.append(param)
 
-    def convert(self, lines: List[str], exports: List[str]):
+    @property
+    def array_params(self) -> Dict[str, str]:
+        """Maps the structure pointer parameters followed by their count (as
+        `Vector2 *points, int numPoints`) to the name of the count."""
+        arrays: Dict[str, str] = {}
+        for param, count in zip(self.params, self.params[1:]):
+            if (not param.is_varargs and param.ptr_level == 1 and param.type not in C_TYPES
+                    and count.type == 'int' and count.ptr_level == 0 and RULE_COUNT.fullmatch(count.name)):
+                arrays[param.name] = count.name
+        return arrays
+
+    @property
+    def requires_wrapper(self) -> bool:
+        """True if the function can not be exported as the bare foreign function."""
+        return any(p.is_varargs for p in self.params)
+
+    def convert(self, lines: List[str], exports: List[str], lazy: bool = False, direct: bool = False,
+                profile: bool = False, frame_cache: bool = False, memo_size: Optional[int] = MEMO_SIZE,
+                decode_strings: bool = False):
+        """Appends the binding code of the function to `lines`.
+
+        With `direct` the snake case name is bound straight to the configured
+        foreign function (no Python frame per call, positional arguments only),
+        except for functions that require a wrapper (varargs),
+        for `FRAME_END`, whose wrapper runs the frame hooks, for functions
+        taking arrays of structures (see `array_params`), whose wrapper
+        accepts any contiguous buffer, for the functions of the frame cache
+        and, with `decode_strings`, for the functions taking or returning
+        strings.
+
+        With `profile` the wrapper times the argument conversion and the
+        foreign call (see `PROFILE_SRC`).
+
+        With `frame_cache` the wrappers of the `FRAME_STABLE` functions return
+        the result of their first call of the frame (for the same arguments)
+        and those of the `FRAME_CACHE_INVALIDATORS` clear it (see
+        `FRAME_CACHE_SRC`).
+
+        Unless `memo_size` is 0, the `PURE_FUNCTIONS` also get a `*_cached`
+        variant going through an LRU cache (see `MEMO_SRC`).
+
+        The wrappers also accept `str` for the `char *` parameters, encoded
+        through a cache (see `STRINGS_SRC`); passing bytes only costs a type
+        identity check. With `decode_strings` the `char *` results are
+        decoded to `str`.
+        """
         dtype: str = typename(self.unsigned, self.rettype, self.ptr_level, -1)
         pydtype: str = dtype
         if pydtype in C_TO_PY_TYPES:
             pydtype = C_TO_PY_TYPES[dtype]
-        py_name: str = to_snake_case(self.name)
+        decodes: bool = decode_strings and dtype == 'c_char_p'
+        if decodes:
+            pydtype = 'str'
+        strings: List[FunctionParamData] = [p for p in self.params if p.is_string]
+        py_name: str = self.py_name
         params = ", ".join([p.convert_to_string() for p in self.params])
         ptypes = ", ".join([typename(p.unsigned, p.type, p.ptr_level, -1) for p in self.params if not p.is_varargs])
+        arrays: Dict[str, str] = self.array_params
+        pnames = ", ".join([f"_struct_array({p.py_name}, {p.type}, {to_snake_case(arrays[p.name])})"
+                            if p.name in arrays else p.py_name for p in self.params if not p.is_varargs])
+
+        cached: bool = frame_cache and self.name in FRAME_STABLE
+        invalidates: bool = frame_cache and self.name in FRAME_CACHE_INVALIDATORS
+
+        body: List[str] = [
+            f"_rl.{self.name}.argtypes = [{ptypes}]",
+            f"_rl.{self.name}.restype = {dtype}",
+        ]
+        if (direct and not self.requires_wrapper and not arrays and self.name != FRAME_END
+                and not cached and not invalidates and not decodes and not (decode_strings and strings)):
+            body.append(f"{py_name} = _rl.{self.name}")
+        elif profile:
+            body.append(f"def {py_name}({params}) -> {pydtype}:")
+            if self.name == FRAME_END:
+                body.append(f"    for hook in _swap_hooks:")
+                body.append(f"        hook()")
+            body.append("    _start = _perf_counter()")
+            for p in self.params:
+                if p.name in arrays:
+                    body.append(f"    {p.py_name} = _struct_array({p.py_name}, {p.type}, {to_snake_case(arrays[p.name])})")
+                elif p.is_string:
+                    body.append(f"    if {p.py_name}.__class__ is str:")
+                    body.append(f"        {p.py_name} = _encoded({p.py_name})")
+            body.append("    _call = _perf_counter()")
+            args: str = ", ".join(p.py_name for p in self.params if not p.is_varargs)
+            call: str = f"_rl.{self.name}({args})"
+            body.append(f"    {'' if pydtype == 'None' else '_result = '}{f'_decode({call})' if decodes else call}")
+            body.append(f"    _profile_record('{self.name}', _start, _call, _perf_counter())")
+            if self.name == FRAME_END:
+                body.append(f"    for hook in _frame_hooks:")
+                body.append(f"        hook()")
+            if pydtype != 'None':
+                body.append("    return _result")
+        elif cached:
+            # structures are keyed by their bytes
+            key: str = ", ".join(f"bytes({p.py_name})" if p.type not in C_TYPES else p.py_name for p in self.params)
+            body.append(f"def {py_name}({params}) -> {pydtype}:")
+            body.append(f"    _key = ('{self.name}', {key})" if key else f"    _key = '{self.name}'")
+            body.append("    _result = _frame_cache.get(_key)")
+            body.append("    if _result is None:")
+            body.append(f"        _result = _frame_cache[_key] = _rl.{self.name}({pnames})")
+            # the cached structure is never handed out, the caller may modify its copy
+            body.append(f"    return {dtype}.from_buffer_copy(_result)" if self.ptr_level == 0 and
+                        self.rettype not in C_TYPES else "    return _result")
+        else:
+            body.append(f"def {py_name}({params}) -> {pydtype}:")
+            if self.name == FRAME_END:
+                body.append(f"    for hook in _swap_hooks:")
+                body.append(f"        hook()")
+            if invalidates:
+                body.append("    _frame_cache.clear()")
+            call: str = f"_rl.{self.name}({pnames})"
+            if decodes:
+                call = f"_decode({call})"
+            for p in strings:
+                body.append(f"    if {p.py_name}.__class__ is str:")
+                body.append(f"        {p.py_name} = _encoded({p.py_name})")
+            body.append(f"    {'' if pydtype == 'None' else 'return '}{call}")
+            if self.name == FRAME_END:
+                body.append(f"    for hook in _frame_hooks:")
+                body.append(f"        hook()")
+
+        lines.append("")
+        if lazy:
+            lines.append(f"def _bind_{py_name}():")
+            lines.extend(f"    {line}" for line in body)
+            lines.append(f"    return {py_name}")
+        else:
+            lines.extend(body)
+        lines.append("")
+        exports.append(f"    '{py_name}',")
+
+        if memo_size != 0 and self.name in PURE_FUNCTIONS:
+            self.convert_memoized(lines, exports, lazy, decode_strings)
+
+    def convert_memoized(self, lines: List[str], exports: List[str], lazy: bool = False, decode_strings: bool = False):
+        """Appends the memoized variant of the pure function to `lines`.
+
+        Structures are not hashable: the variant passes their bytes to the
+        cache, which rebuilds them on a miss. Strings are keyed as given, str
+        or bytes, and encoded on a miss. A structure result is cached as its
+        bytes too, so every call returns a new instance the caller may modify.
+        """
+        dtype: str = typename(self.unsigned, self.rettype, self.ptr_level, -1)
+        pydtype: str = 'str' if decode_strings and dtype == 'c_char_p' else C_TO_PY_TYPES.get(dtype, dtype)
+        py_name: str = f"{self.py_name}_cached"
+        structs: List[FunctionParamData] = [p for p in self.params if p.ptr_level == 0 and p.type not in C_TYPES]
+        returns_struct: bool = self.ptr_level == 0 and self.rettype not in C_TYPES
+        names: str = ", ".join(p.py_name for p in self.params)
+        args: str = ", ".join(f"{p.type}.from_buffer_copy({p.py_name})" if p in structs else
+                              f"_encode({p.py_name})" if p.is_string else p.py_name for p in self.params)
+        call: str = f"_rl.{self.name}({args})"
+        if pydtype == 'str':
+            call = f"_decode({call})"
+        elif returns_struct:
+            call = f"bytes({call})"
+        cache: str = f"_memoized('{py_name}', lambda {names}: {call})"
+
+        body: List[str] = [
+            f"_rl.{self.name}.argtypes = [{', '.join(typename(p.unsigned, p.type, p.ptr_level, -1) for p in self.params)}]",
+            f"_rl.{self.name}.restype = {dtype}",
+        ] if lazy else []
+        if structs or returns_struct:
+            keys: str = ", ".join(f"bytes({p.py_name})" if p in structs else p.py_name for p in self.params)
+            params: str = ", ".join(p.convert_to_string() for p in self.params)
+            result: str = f"{dtype}.from_buffer_copy(_{py_name}({keys}))" if returns_struct else f"_{py_name}({keys})"
+            body.extend([
+                f"_{py_name} = {cache}",
+                "",
+                "",
+                f"def {py_name}({params}) -> {pydtype}:",
+                f"    return {result}",
+            ])
+        else:
+            # nothing to convert: the cache is the function
+            body.append(f"{py_name} = {cache}")
+
+        lines.append("")
+        if lazy:
+            lines.append(f"def _bind_{py_name}():")
+            lines.extend(f"    {line}" if line else line for line in body)
+            lines.append(f"    return {py_name}")
+        else:
+            lines.extend(body)
+        lines.append("")
+        exports.append(f"    '{py_name}',")
+
+    def c_declaration(self) -> str:
+        params: str = ", ".join(p.c_declaration() for p in self.params) or "void"
+        rettype: str = f"{'const ' if self.is_const else ''}{'unsigned ' if self.unsigned else ''}{self.rettype}"
+        return f"{rettype} {'*' * self.ptr_level}{self.name}({params})"
+
+    def cdef(self, lines: List[str]):
+        lines.append(f"{self.c_declaration()};")
+
+    def convert_stub(self, lines: List[str]):
+        """Appends a stand-in definition of the function to `lines`: it does
+        nothing and returns its first argument of the return type (echo), or
+        zero (a zeroed structure, NULL)."""
+        rettype: str = f"{'const ' if self.is_const else ''}{'unsigned ' if self.unsigned else ''}{self.rettype}"
+        echo: Optional[FunctionParamData] = next(
+            (p for p in self.params if not p.is_varargs and p.type == self.rettype
+             and p.unsigned == self.unsigned and p.ptr_level == self.ptr_level), None)
+
+        lines.append("")
+        lines.append(f"EXPORT {self.c_declaration()}")
+        lines.append("{")
+        if self.rettype == 'void' and self.ptr_level == 0:
+            pass
+        elif echo is not None:
+            cast: str = f"({rettype} {'*' * self.ptr_level})" if self.ptr_level > 0 else ""
+            lines.append(f"    return {cast}{echo.name};")
+        elif self.ptr_level > 0:
+            lines.append("    return NULL;")
+        elif self.rettype in C_TYPES:
+            lines.append("    return 0;")
+        else:
+            lines.append(f"    {rettype} result;")
+            lines.append("    memset(&result, 0, sizeof(result));")
+            lines.append("    return result;")
+        lines.append("}")
+
+    def cdef_pointer(self, lines: List[str]):
+        """Appends the type of a pointer to the function (`<name>Func`) to `lines`."""
+        params: str = ", ".join(p.c_declaration() for p in self.params) or "void"
+        rettype: str = f"{'const ' if self.is_const else ''}{'unsigned ' if self.unsigned else ''}{self.rettype}"
+        lines.append(f"typedef {rettype} {'*' * self.ptr_level}(*{self.name}Func)({params});")
+
+    def convert_command(self, lines: List[str], opcode: int):
+        """Appends the `CommandBuffer` method recording the function to `lines`.
+
+        A command is its opcode and the scalar arguments (packed with the
+        `struct` standard sizes, without padding) followed by the raw memory
+        of the structure arguments.
+        """
+        scalars: List[FunctionParamData] = [p for p in self.params if p.command_format != 's']
+        structs: List[FunctionParamData] = [p for p in self.params if p.command_format == 's']
+        py_name: str = self.py_name
+        fmt: str = '=i' + ''.join(p.command_format for p in scalars)
+        params: str = "".join(f", {p.convert_to_string()}" for p in self.params)
+
+        lines.append("")
+        lines.append(f"    _pack_{py_name} = Struct('{fmt}').pack")
+        lines.append("")
+        lines.append(f"    def {py_name}(self{params}) -> None:")
+        lines.append(f"        data = self._data")
+        lines.append(f"        data += self._pack_{py_name}({', '.join([str(opcode)] + [p.py_name for p in scalars])})")
+        for param in structs:
+            ptype: str = typename(param.unsigned, param.type, 0, -1)
+            lines.append(f"        data += {param.py_name} if type({param.py_name}) is {ptype} else {ptype}(*{param.py_name})")
+
+    def convert_native_command(self, lines: List[str], opcode: int):
+        """Appends the case of the native executor decoding and calling the
+        command recorded by `convert_command` to `lines`."""
+        params: List[FunctionParamData] = ([p for p in self.params if p.command_format != 's']
+                                           + [p for p in self.params if p.command_format == 's'])
+        lines.append(f"        case {opcode}: {{  /* {self.name} */")
+        lines.extend(f"            {p.c_declaration().replace('const ', '')};" for p in params)
+        if params:
+            size: str = " + ".join(f"sizeof({p.name})" for p in params)
+            lines.append(f"            if ((size_t)(rl_end - rl_cursor) < {size}) return -1;")
+        for param in params:
+            lines.append(f"            memcpy(&{param.name}, rl_cursor, sizeof({param.name})); "
+                         f"rl_cursor += sizeof({param.name});")
+        lines.append(f"            (({self.name}Func)rl_funcs[{opcode}])({', '.join(p.name for p in self.params)});")
+        lines.append(f"            break;")
+        lines.append(f"        }}")
+
+    def convert_cffi(self, lines: List[str], exports: List[str], direct: bool = False):
+        """Appends the cffi binding code of the function to `lines`.
+
+        Strings are returned as bytes (as c_char_p does); everything else is
+        returned as is.
+        """
+        py_name: str = self.py_name
+        params = ", ".join([p.py_name for p in self.params])
         pnames = ", ".join([p.py_name for p in self.params if not p.is_varargs])
+        returns_string: bool = self.rettype == 'char' and not self.unsigned and self.ptr_level == 1
+
+        lines.append("")
+        if direct and not self.requires_wrapper and not returns_string:
+            lines.append(f"{py_name} = lib.{self.name}")
+        elif returns_string:
+            lines.append(f"def {py_name}({params}) -> bytes:")
+            lines.append(f"    result = lib.{self.name}({pnames})")
+            lines.append(f"    return None if result == ffi.NULL else ffi.string(result)")
+        else:
+            lines.append(f"def {py_name}({params}):")
+            lines.append(f"    {'' if self.rettype == 'void' and self.ptr_level == 0 else 'return '}lib.{self.name}({pnames})")
+        lines.append("")
+        exports.append(f"    '{py_name}',")
+
+
+class BatchFunctionData(FunctionData):
+    """A batched entry point calling `function` once per item, from a native
+    loop when the shim is compiled (see `_draw_batch` and `write_native`)."""
+    kind: str = 'batch'
+
+    def __init__(self, name: str, function: FunctionData, param_names: List[str]):
+        super().__init__()
+        self.name = name
+        self.function: FunctionData = function
+        self.param_names: List[str] = param_names
+        self.rettype = 'void'
+        self.module = function.module
+        self.params = function.params
+
+    def convert(self, lines: List[str], exports: List[str], lazy: bool = False, direct: bool = False,
+                profile: bool = False, frame_cache: bool = False, memo_size: Optional[int] = MEMO_SIZE,
+                decode_strings: bool = False):
+        func: FunctionData = self.function
+        py_name: str = self.py_name
+        ptypes: List[str] = [typename(p.unsigned, p.type, p.ptr_level, -1) for p in func.params]
+        body: List[str] = [
+            f"_rl.{func.name}.argtypes = [{', '.join(ptypes)}]",
+            f"_rl.{func.name}.restype = {typename(func.unsigned, func.rettype, func.ptr_level, -1)}",
+            f"def {py_name}({', '.join(self.param_names)}) -> None:",
+            f'    """Calls `{func.py_name}` once per item: each argument is one value or an array of values."""',
+            f"    _draw_batch(_rl.{func.name}, [{', '.join(ptypes)}], [{', '.join(self.param_names)}], '{self.name}')",
+        ]
+        if profile:
+            body.insert(-1, "    _start = _perf_counter()")
+            body.append(f"    _profile_record('{self.name}', _start, _start, _perf_counter())")
 
         lines.append("")
-        lines.append(f"_rl.{self.name}.argtypes = [{ptypes}]")
-        lines.append(f"_rl.{self.name}.restype = {dtype}")
-        lines.append(f"def {py_name}({params}) -> {pydtype}:")
-        lines.append(f"    {'' if pydtype is 'None' else 'return '}_rl.{self.name}({pnames})")
+        if lazy:
+            lines.append(f"def _bind_{py_name}():")
+            lines.extend(f"    {line}" for line in body)
+            lines.append(f"    return {py_name}")
+        else:
+            lines.extend(body)
         lines.append("")
         exports.append(f"    '{py_name}',")
 
+    def convert_native(self, lines: List[str]):
+        """Appends the C loop calling `function` once per item to `lines`.
+
+        Each array comes with a stride (0 to repeat its first item).
+        """
+        func: FunctionData = self.function
+        c_types: List[str] = [f"{'unsigned ' if p.unsigned else ''}{p.type}" for p in func.params]
+        params: str = ", ".join(f"const {ctype} *{name}, int {name}_stride"
+                                for ctype, name in zip(c_types, self.param_names))
+        args: str = ", ".join(f"{name}[i*{name}_stride]" for name in self.param_names)
+        lines.extend([
+            "",
+            f"EXPORT void {self.name}({func.name}Func func, int count, {params})",
+            "{",
+            "    for (int i = 0; i < count; i++) {",
+            f"        func({args});",
+            "    }",
+            "}",
+        ])
+
 
 class FunctionParamData:
 
@@ -677,12 +3665,47 @@ class FunctionParamData:
         self.type: str = ''
         self.ptr_level: int = 0
         self.unsigned: bool = False
+        self.is_const: bool = False
         self.is_varargs: bool = False
 
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FunctionParamData':
+        param: FunctionParamData = cls()
+        vars(param).update(data)
+        return param
+
+    def c_declaration(self) -> str:
+        if self.is_varargs:
+            return "..."
+        if self.type == 'va_list':
+            # cffi can not declare va_list in ABI mode
+            return f"void *{self.name}"
+        return f"{'const ' if self.is_const else ''}{'unsigned ' if self.unsigned else ''}{self.type} {'*' * self.ptr_level}{self.name}"
+
     @property
     def py_name(self) -> str:
         return to_snake_case(self.name) if not self.is_varargs else "*args"
 
+    @property
+    def is_string(self) -> bool:
+        """True for `char *` parameters (bound as `c_char_p`)."""
+        return not self.is_varargs and self.ptr_level == 1 and self.type == 'char' and not self.unsigned
+
+    @property
+    def command_format(self) -> Optional[str]:
+        """The `struct` format of the parameter in a command buffer: 's' for
+        a structure passed by value, None if it can not be recorded."""
+        if self.is_varargs or self.ptr_level > 0:
+            return None
+        dtype: str = typename(self.unsigned, self.type, 0, -1)
+        if not dtype.startswith('c_'):
+            return 's'
+        fmt: Optional[str] = C_TO_STRUCT_FORMATS.get(dtype)
+        return fmt if fmt is not None and fmt in COMMAND_FORMATS else None
+
     def convert_to_string(self) -> str:
         if self.is_varargs:
             return "*args"
@@ -691,8 +3714,311 @@ class FunctionParamData:
         if dtype in C_TO_PY_TYPES:
             dtype = C_TO_PY_TYPES[dtype]
         py_name: str = to_snake_case(self.name)
+        if self.is_string:
+            dtype = 'Union[str, bytes]'
         return f"{py_name}: {dtype}"
 
 
+class CallbackData(FunctionData):
+    """A function pointer type (`typedef void (*TraceLogCallback)(...)`)."""
+    kind: str = 'callback'
+
+    def convert(self, lines: List[str], exports: List[str], **options):
+        restype: str = typename(self.unsigned, self.rettype, self.ptr_level, -1)
+        ptypes: List[str] = [typename(p.unsigned, p.type, p.ptr_level, -1) for p in self.params if not p.is_varargs]
+        lines.append("")
+        lines.append(f"{self.name} = CFUNCTYPE({', '.join([restype] + ptypes)})")
+        lines.append("")
+        exports.append(f"    '{self.name}',")
+
+    def cdef(self, lines: List[str]):
+        params: str = ", ".join(p.c_declaration() for p in self.params) or "void"
+        lines.append(f"typedef {'unsigned ' if self.unsigned else ''}{self.rettype} {'*' * self.ptr_level}(*{self.name})({params});")
+
+    def convert_cffi(self, lines: List[str], exports: List[str], **options):
+        lines.append("")
+        lines.append(f"def {self.name}(func):")
+        lines.append(f"    return ffi.callback('{self.name}', func)")
+        lines.append("")
+        exports.append(f"    '{self.name}',")
+
+
+class DefineData:
+    kind: str = 'define'
+
+    def __init__(self, name: str = '', value: str = ''):
+        self.name: str = name
+        self.value: str = value
+
+    @property
+    def py_value(self) -> str:
+        return RULE_REALNUM_SUFFIX.replace(self.value)
+
+    @property
+    def names(self) -> List[str]:
+        return [self.name]
+
+    @property
+    def dependencies(self) -> List[str]:
+        return RULE_IDENTIFIER.findall(self.py_value)
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'name': self.name, 'value': self.value}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DefineData':
+        return cls(data['name'], data['value'])
+
+    def convert(self, lines: List[str], exports: List[str]):
+        lines.append(f"{self.name} = {self.py_value}")
+        exports.append(f"    '{self.name}',")
+
+
+class AliasData:
+    """Another name for a constant (`#define LOC_MAP_DIFFUSE LOC_MAP_ALBEDO`) or,
+    with `typedef`, for a type (`typedef Texture Texture2D;`)."""
+
+    def __init__(self, name: str = '', target: str = '', typedef: bool = False):
+        self.kind: str = 'typedef' if typedef else 'alias'
+        self.name: str = name
+        self.target: str = target
+        self.typedef: bool = typedef
+
+    @property
+    def names(self) -> List[str]:
+        return [self.name]
+
+    @property
+    def dependencies(self) -> List[str]:
+        return [self.target]
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'name': self.name, 'target': self.target, 'typedef': self.typedef}
+
+    def cdef(self, lines: List[str]):
+        lines.append(f"typedef {self.target} {self.name};")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AliasData':
+        return cls(data['name'], data['target'], data['typedef'])
+
+    def convert(self, lines: List[str], exports: List[str]):
+        if self.typedef:
+            lines.append(f"\n{self.name} = {self.target}\n")
+        else:
+            lines.append(f"{self.name} = {self.target}")
+        exports.append(f"    '{self.name}',")
+
+
+class ColorData:
+    """A palette entry (`#define LIGHTGRAY CLITERAL(Color){ 200, 200, 200, 255 }`)."""
+    kind: str = 'color'
+
+    def __init__(self, name: str = '', value: str = '', comment: str = ''):
+        self.name: str = name
+        self.value: str = value
+        self.comment: str = comment
+
+    @property
+    def names(self) -> List[str]:
+        return [self.name]
+
+    @property
+    def dependencies(self) -> List[str]:
+        return ['Color']
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'name': self.name, 'value': self.value, 'comment': self.comment}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ColorData':
+        return cls(data['name'], data['value'], data['comment'])
+
+    def convert(self, lines: List[str], exports: List[str]):
+        lines.append(f"{self.name} = Color({self.value}) {self.comment.replace('//', '#')}")
+
+
+Declaration = Union[DefineData, AliasData, StructData, EnumData, CallbackData]
+
+DECLARATION_KINDS: Dict[str, type] = {
+    'define': DefineData,
+    'alias': AliasData,
+    'typedef': AliasData,
+    'struct': StructData,
+    'enum': EnumData,
+    'callback': CallbackData,
+}
+
+
+class HeaderParser:
+    """Single pass parser of the annotated header.
+
+    The `// @` commands switch the active sections (see `SECTION_RULES` and
+    `COUNTED_RULES`); each line is matched once against the combined rules of
+    the active sections and dispatched to the `on_<rule>` method of the rule
+    it matched.
+    """
+
+    def __init__(self):
+        self.header: HeaderData = HeaderData()
+        self.active_rules: List[Regex] = []
+        self.counters: Dict[str, int] = {}
+        self.last_comment: str = ""
+        self.module: str = MODULES[0]
+        self.handlers: Dict[str, Callable[[Tuple[str, ...]], None]] = {}
+        self.pattern: Pattern = None
+        self.groups: Dict[str, Tuple[int, ...]] = {}
+        self.update_rules()
+
+    def update_rules(self):
+        self.pattern, self.groups = compile_rules(tuple(self.active_rules))
+        self.handlers = {name: getattr(self, f"on_{name.lower()}") for name in self.groups}
+
+    def parse(self, lines: List[str]) -> 'HeaderData':
+        for line in lines:
+            match: Match = self.pattern.match(line)
+            if match:
+                name: str = match.lastgroup
+                indices: Tuple[int, ...] = self.groups[name]
+                self.handlers[name](match.group(*indices) if len(indices) > 1 else (match[name],))
+        return self.header
+
+    def on_comment(self, match: Tuple[str, ...]):
+        self.last_comment = match[1]
+        m: Match = RULE_MODULE.match(match[0])
+        if m:
+            self.module = MODULE_ALIASES.get(m[1], m[1])
+        m = RULE_PROCESS.match(match[0])
+        if m:
+            self.last_comment = ""
+            self.on_command(m[1], m[2])
+
+    def on_command(self, command: str, count: Optional[str]):
+        section, _, marker = command.rpartition('_')
+        if marker == 'begin' and section in SECTION_RULES:
+            self.active_rules.extend(SECTION_RULES[section])
+        elif marker == 'end' and section in SECTION_RULES:
+            for rule in SECTION_RULES[section]:
+                self.active_rules.remove(rule)
+        elif command in COUNTED_RULES:
+            rule: Regex = COUNTED_RULES[command]
+            self.counters[rule.name] = int(count, 10)
+            self.active_rules.append(rule)
+        else:
+            return
+        self.update_rules()
+
+    def count(self, rule: Regex):
+        self.counters[rule.name] -= 1
+        if self.counters[rule.name] <= 0:
+            self.active_rules.remove(rule)
+            self.update_rules()
+
+    def on_define(self, match: Tuple[str, ...]):
+        self.header.declarations.append(DefineData(match[1], match[2]))
+
+    def on_color_defines(self, match: Tuple[str, ...]):
+        self.header.palette.append(ColorData(match[1], match[2], match[3]))
+
+    def on_struct_begin(self, match: Tuple[str, ...]):
+        StructData.begin(self.last_comment)
+        StructData.current.name = match[1]
+
+    def on_struct_empty(self, match: Tuple[str, ...]):
+        opaque: StructData = StructData()
+        opaque.name = match[1]
+        self.header.declarations.append(opaque)
+
+    def on_struct_member(self, match: Tuple[str, ...]):
+        name: str = match[3]
+        arraymatch: Match = RULE_STRUCT_MEMBER_ARRAY(name)
+        array_len: Optional[str] = None
+        if arraymatch:
+            name = arraymatch[1]
+            array_len = arraymatch[2]
+        StructData.current.add_field(name, match[1], array_len)
+
+    def on_struct_end(self, match: Tuple[str, ...]):
+        StructData.end(self.header.declarations)
+
+    def on_type_alias_typedef(self, match: Tuple[str, ...]):
+        self.header.declarations.append(AliasData(match[2], match[1], True))
+
+    def on_type_alias_define(self, match: Tuple[str, ...]):
+        self.header.declarations.append(AliasData(match[1], match[2], True))
+
+    def on_enum_begin(self, match: Tuple[str, ...]):
+        EnumData.begin(self.last_comment)
+
+    def on_enum_member_value(self, match: Tuple[str, ...]):
+        EnumData.current.add_member(match[1], match[2])
+
+    def on_enum_member(self, match: Tuple[str, ...]):
+        EnumData.current.add_member(match[1], 'auto()')
+
+    def on_enum_end(self, match: Tuple[str, ...]):
+        EnumData.current.name = match[1]
+        EnumData.end(self.header.declarations)
+
+    def on_name_alias(self, match: Tuple[str, ...]):
+        self.header.declarations.append(AliasData(match[1], match[2]))
+        self.count(RULE_NAME_ALIAS)
+
+    def on_callback_notation(self, match: Tuple[str, ...]):
+        callback: CallbackData = CallbackData()
+        callback.name = match[2]
+        callback.rettype = match[1]
+        self.add_params(callback, match[3])
+        self.header.declarations.append(callback)
+        self.count(RULE_CALLBACK_NOTATION)
+
+    def on_function(self, match: Tuple[str, ...]):
+        func: FunctionData = FunctionData()
+        func.is_const = match[1] is not None
+        func.unsigned = match[2] is not None
+        func.rettype = match[3]
+        func.ptr_level = len(match[4])
+        func.name = match[5]
+        func.module = self.module
+        self.add_params(func, match[6])
+        self.header.functions.append(func)
+
+    @staticmethod
+    def add_params(func: 'FunctionData', params: str):
+        """Adds the parameters of a `(type name, ...)` list, in a single scan."""
+        for param in RULE_PARAM_LIST.finditer(params.strip('()')):
+            if param[1]:
+                func.add_param(False, '', 0, '', True)
+            else:
+                func.add_param(param[3] is not None, param[4], len(param[5]), param[6], False, param[2] is not None)
+
+
+class HeaderData:
+    """The parsed header: declarations (in header order), palette and functions.
+
+    This is the intermediate representation all the outputs are generated
+    from; `to_dict`/`from_dict` give its JSON form (see `load_header`).
+    """
+
+    def __init__(self):
+        self.declarations: List[Declaration] = []
+        self.palette: List[ColorData] = []
+        self.functions: List[FunctionData] = []
+
+    def to_dict(self) -> Dict:
+        return {
+            'declarations': [declaration.to_dict() for declaration in self.declarations],
+            'palette': [color.to_dict() for color in self.palette],
+            'functions': [func.to_dict() for func in self.functions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HeaderData':
+        header: HeaderData = cls()
+        header.declarations = [DECLARATION_KINDS[d['kind']].from_dict(d) for d in data['declarations']]
+        header.palette = [ColorData.from_dict(color) for color in data['palette']]
+        header.functions = [FunctionData.from_dict(func) for func in data['functions']]
+        return header
+
 # endregion (classes)
 # ---------------------------------------------------------
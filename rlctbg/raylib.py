@@ -12,9 +12,16 @@
 
 import sys
 import os
-import platform
 import ctypes
 from enum import IntEnum, auto
+from struct import Struct, error as StructError
+from itertools import chain, repeat, starmap
+from collections import deque
+from numbers import Real
+from typing import Union
+from contextlib import contextmanager
+from functools import lru_cache as _lru_cache
+from time import perf_counter as _perf_counter
 from ctypes import (
     c_bool,
     c_char_p,
@@ -35,7 +42,6 @@ from ctypes import (
     CFUNCTYPE,
     POINTER,
     CDLL,
-    WinDLL,
     Structure,
     byref,
 )
@@ -51,11 +57,15 @@ _lib_fname = {
 _lib_platform = sys.platform
 
 if _lib_platform == 'win32':
+    import platform
+
     _bitness = platform.architecture()[0]
 else:
     _bitness = '64bit' if sys.maxsize > 2 ** 32 else '32bit'
 
 _lib_fname_abspath = os.path.join(os.path.dirname(os.path.abspath(__file__)), _lib_fname[_lib_platform])
+# e.g. a stand-in library built by `rlctbg.build_stub` to run headless
+_lib_fname_abspath = os.environ.get('RLCTBG_LIBRARY', _lib_fname_abspath)
 _lib_fname_abspath = os.path.normcase(os.path.normpath(_lib_fname_abspath))
 
 print(
@@ -116,7 +126,7 @@ if _lib_platform == 'win32':
                                          use_errno, use_last_error)
 
 
-    class WinDLLEx(WinDLL):
+    class WinDLLEx(ctypes.WinDLL):
         def __init__(self, name, mode=0, handle=None,
                      use_errno=False, use_last_error=True):
             if handle is None:
@@ -131,15 +141,995 @@ if _lib_platform == 'win32':
         print("Unable to load raylib 2.5.0 dll.")
         _rl = None
 else:
-    _rl = CDLL(_lib_fname_abspath)
+    try:
+        _rl = CDLL(_lib_fname_abspath)
+    except OSError:
+        _rl = None
 
 if _rl is None:
-    print("Failed to load shared library.")
-    exit()
+    raise ImportError(f"Failed to load shared library: {_lib_fname_abspath} "
+                      f"(set RLCTBG_LIBRARY to the path of the raylib binary)")
 
 # endregion (library loader)
 
+# region FRAME HOOKS
+
+_frame_hooks = []
+# run just before the `end_drawing` foreign call (buffer swap, frame rate wait)
+_swap_hooks = []
+
+
+def add_frame_hook(hook):
+    """Registers a callable run, without arguments, after every `end_drawing`."""
+    _frame_hooks.append(hook)
+    return hook
+
+
+def remove_frame_hook(hook):
+    _frame_hooks.remove(hook)
+
+
+class _ScratchPool:
+    """Structure instances handed out by `scratch` and recycled after each frame."""
+    __slots__ = ('free', 'used')
+
+    def __init__(self):
+        self.free = []
+        self.used = []
+        _frame_hooks.append(self.reset)
+
+    def reset(self):
+        self.free.extend(self.used)
+        self.used.clear()
+
+# endregion (frame hooks)
+
+# region FRAME TELEMETRY
+
+class FrameTelemetry:
+    """Rolling frame time statistics over the last `window` frames, taken
+    by the frame hooks between `start` and `stop` (or in a `with` block).
+
+    A frame runs from one `end_drawing` to the next. Its time is split into
+    the time spent in Python (update logic, draw calls) and the time spent
+    in `end_drawing` (buffer swap, vsync or target FPS wait); frames longer
+    than `budget` seconds are hitches. With `path`, the statistics are
+    written every `interval` seconds, in the Prometheus text format (e.g.
+    for the node exporter textfile collector) or, for a `.jsonl` path,
+    appended as a JSON line.
+    """
+    SERIES = ('frame', 'python', 'end_drawing')
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, budget=1 / 60, window=3600, path=None, interval=10.0):
+        self.budget = budget
+        self.path = path
+        self.interval = interval
+        self.frames = deque(maxlen=window)
+        self.count = 0
+        self.hitches = 0
+        self.sums = [0.0, 0.0, 0.0]
+        self._swap = 0.0
+        self._end = None
+        self._next_write = None
+
+    def start(self):
+        """Starts measuring from the next `end_drawing`."""
+        if self._on_frame not in _frame_hooks:
+            _swap_hooks.append(self._on_swap)
+            _frame_hooks.append(self._on_frame)
+        return self
+
+    def stop(self):
+        """Stops measuring, writing the statistics a last time with `path`."""
+        if self._on_frame in _frame_hooks:
+            _swap_hooks.remove(self._on_swap)
+            _frame_hooks.remove(self._on_frame)
+            if self.path is not None and self._end is not None:
+                self.write()
+        self._end = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _on_swap(self):
+        self._swap = _perf_counter()
+
+    def _on_frame(self):
+        now = _perf_counter()
+        end, self._end = self._end, now
+        if end is None:
+            # the first frame measured starts here
+            self._next_write = now + self.interval if self.path is not None else None
+            return
+        frame = now - end
+        swap = now - self._swap
+        self.frames.append((frame, frame - swap, swap))
+        self.count += 1
+        sums = self.sums
+        sums[0] += frame
+        sums[1] += frame - swap
+        sums[2] += swap
+        if frame > self.budget:
+            self.hitches += 1
+        if self._next_write is not None and now >= self._next_write:
+            self._next_write = now + self.interval
+            self.write()
+
+    def quantiles(self):
+        """Returns, for each series ('frame', 'python', 'end_drawing'), a
+        dict mapping 0.5, 0.95 and 0.99 to the frame time quantiles of the
+        window, in seconds."""
+        result = {}
+        for i, series in enumerate(self.SERIES):
+            values = sorted(frame[i] for frame in self.frames) or [0.0]
+            result[series] = {q: values[min(len(values) - 1, int(q * len(values)))] for q in self.QUANTILES}
+        return result
+
+    def stats(self):
+        """Returns the quantiles (see `quantiles`), the number of frames
+        measured, their total time per series and the hitch counts, since
+        `start` and over the window."""
+        return {
+            'frames': self.count,
+            'quantiles': self.quantiles(),
+            'sums': dict(zip(self.SERIES, self.sums)),
+            'hitches': self.hitches,
+            'window_frames': len(self.frames),
+            'window_hitches': sum(1 for frame in self.frames if frame[0] > self.budget),
+            'budget': self.budget,
+        }
+
+    def write(self, path=None):
+        """Writes the statistics to `path` (by default the one of the telemetry)."""
+        path = self.path if path is None else path
+        stats = self.stats()
+        if path.endswith('.jsonl'):
+            import json
+            import time
+            stats['time'] = time.time()
+            with open(path, 'a') as output:
+                output.write(json.dumps(stats) + '\n')
+            return
+        lines = []
+        for series, description in zip(self.SERIES, ("Frame time", "Time spent in Python per frame",
+                                                      "Time spent in end_drawing per frame")):
+            metric = f"raylib_{series}_seconds"
+            lines.append(f"# HELP {metric} {description}, quantiles over the last {stats['window_frames']} frames.")
+            lines.append(f"# TYPE {metric} summary")
+            for q, value in stats['quantiles'][series].items():
+                lines.append(f'{metric}{{quantile="{q}"}} {value!r}')
+            lines.append(f"{metric}_sum {stats['sums'][series]!r}")
+            lines.append(f"{metric}_count {stats['frames']}")
+        lines.append("# HELP raylib_frame_hitches_total Frames longer than the budget.")
+        lines.append("# TYPE raylib_frame_hitches_total counter")
+        lines.append(f"raylib_frame_hitches_total {stats['hitches']}")
+        lines.append("# HELP raylib_frame_budget_seconds Frame time budget.")
+        lines.append("# TYPE raylib_frame_budget_seconds gauge")
+        lines.append(f"raylib_frame_budget_seconds {stats['budget']!r}")
+        # replaced at once, so a collector never reads a partial file
+        with open(path + '.tmp', 'w') as output:
+            output.write('\n'.join(lines) + '\n')
+        os.replace(path + '.tmp', path)
+
+# endregion (frame telemetry)
+
+# region NUMPY VIEWS
+
+_dtypes = {}
+
+
+def _struct_fields(struct_type):
+    # the table of the module defining the structure: with several headers,
+    # a shared one is only listed by the module of the first header
+    return getattr(sys.modules.get(struct_type.__module__), '_dtype_fields', _dtype_fields)[struct_type]
+
+
+def struct_dtype(struct_type):
+    """Returns the NumPy dtype with the memory layout of a structure (numpy is
+    only imported by the first call)."""
+    dtype = _dtypes.get(struct_type)
+    if dtype is None:
+        import numpy
+        names, formats, offsets = [], [], []
+        for name, ftype, count in _struct_fields(struct_type):
+            ftype = numpy.dtype(ftype) if isinstance(ftype, str) else struct_dtype(ftype)
+            names.append(name)
+            formats.append((ftype, count) if count > 0 else ftype)
+            offsets.append(getattr(struct_type, name).offset)
+        dtype = _dtypes[struct_type] = numpy.dtype({
+            'names': names,
+            'formats': formats,
+            'offsets': offsets,
+            'itemsize': ctypes.sizeof(struct_type),
+        })
+    return dtype
+
+
+def as_array(data, count=None):
+    """Views a ctypes array, or a pointer to `count` items, as a NumPy array
+    sharing its memory."""
+    import numpy
+    item_type = data._type_
+    if count is not None:
+        data = (item_type * count).from_address(ctypes.addressof(data.contents))
+    if issubclass(item_type, Structure):
+        return numpy.frombuffer(data, struct_dtype(item_type))
+    return numpy.ctypeslib.as_array(data)
+
+
+def as_ctypes(array, struct_type):
+    """Views a C contiguous NumPy array as a ctypes array of `struct_type`, to
+    pass it to raylib without copying.
+
+    The array either has the dtype of `struct_type` (see `struct_dtype`) or,
+    when all the fields share a type, that type: e.g. `float32` with a last
+    dimension of 2 for `Vector2`.
+    """
+    dtype = struct_dtype(struct_type)
+    if array.dtype != dtype and {field[0].base for field in dtype.fields.values()} != {array.dtype}:
+        raise TypeError(f"expected an array of {dtype} for {struct_type.__name__}, got {array.dtype}")
+    if array.nbytes % dtype.itemsize:
+        raise ValueError(f"the array size is not a multiple of sizeof({struct_type.__name__})")
+    return (struct_type * (array.nbytes // dtype.itemsize)).from_buffer(array)
+
+# endregion (numpy views)
+
+# region BUFFER ARGUMENTS
+
+_item_layouts = {}
+_CArgObject = type(byref(c_int()))
+_native_order = '<' if sys.byteorder == 'little' else '>'
+_kind_names = {'f': 'float', 'i': 'int', 'u': 'uint', '?': 'bool', 'S': 'bytes'}
+
+
+def _format_code(code):
+    """The kind and size of a buffer or dtype format code (e.g. '<f', 'L',
+    '&<f', 's', 'S32'), or None for a non-native byte order or an unknown code."""
+    if code[0] in '@=^':
+        code = code[1:]
+    elif code[0] in '<>!':
+        if code[0].replace('!', '>') != _native_order:
+            return None
+        code = code[1:]
+    if code[0] == '&' or code == 'P':
+        return 'u', ctypes.sizeof(c_void_p)
+    if code[0] == 'S' or code in 'sc':
+        return 'S', int(code[1:] or 1)
+    try:
+        size = Struct(code).size
+    except StructError:
+        return None
+    return ('f' if code in 'efd' else '?' if code == '?' else 'i' if code.islower() else 'u'), size
+
+
+@_lru_cache(maxsize=None)
+def _format_fields(buffer_format):
+    """The (kind, size) of the scalar fields of a buffer format (e.g. '<f', or
+    'T{<f:x:<f:y:}' for a structured one), nested structures flattened and
+    bytes folded, or None if a field has a non-native byte order or the format
+    can not be read."""
+    import re
+    token = re.compile(r"\s*(?:(\d*)x|(?:\((\d+(?:,\d+)*)\))?(\d*)(T\{|[@=<>!^]?&?[@=<>!^]?[a-zA-Z?])|\})(?::\w*:)?")
+    fields, position, depth = [], 0, 0
+    while position < len(buffer_format):
+        match = token.match(buffer_format, position)
+        if match is None:
+            return None
+        position = match.end()
+        padding, shape, repeat, code = match.groups()
+        if padding is not None:
+            continue
+        if code is None:
+            depth -= 1
+            if depth < 0:
+                return None
+            continue
+        count = int(repeat or 1)
+        for dimension in (shape.split(',') if shape else ()):
+            count *= int(dimension)
+        if code == 'T{':
+            # arrays of nested structures do not occur in raylib
+            if count != 1:
+                return None
+            depth += 1
+            continue
+        field = _format_code(code)
+        if field is None:
+            return None
+        if field[0] == 'S':
+            fields.append(('S', field[1] * count))
+        else:
+            fields.extend([field] * count)
+    return tuple(fields) if depth == 0 else None
+
+
+def _struct_layout(struct_type):
+    """The scalar fields of `struct_type` (see `_format_fields`) and the one
+    they all are, when they fill it without padding."""
+    layout = _item_layouts.get(struct_type)
+    if layout is None:
+        fields = []
+        if issubclass(struct_type, Structure):
+            for _, ftype, count in _struct_fields(struct_type):
+                if isinstance(ftype, str):
+                    field = _format_code(ftype)
+                    fields.extend([field] * max(count, 1) if field[0] != 'S' else [('S', field[1] * max(count, 1))])
+                else:
+                    fields.extend(_struct_layout(ftype)[0])
+        else:
+            fields.append(_format_code(struct_type._type_))
+        item = fields[0] if len(set(fields)) == 1 and sum(size for _, size in fields) == ctypes.sizeof(struct_type) else None
+        layout = _item_layouts[struct_type] = tuple(fields), item
+    return layout
+
+
+def _struct_array(data, struct_type, count=None):
+    """Passes a contiguous buffer of at least `count` structures (a NumPy
+    array, an `array.array`, a memoryview...) to a `struct_type *` parameter
+    without copying it; ctypes arrays and pointers go through untouched,
+    `byref()` is cast and lists or tuples of structures are copied.
+
+    The buffer holds either structures with the same fields (e.g. a
+    structured NumPy array) or the type shared by all their fields (e.g.
+    `float32` for `Vector2`), its last dimensions then making up whole
+    structures (e.g. a shape of `(n, 2)`, or a flat buffer of `2 * n` floats).
+    `struct_type` may also be a scalar type (e.g. `c_float`).
+    Read-only buffers are copied. Without `count` the whole buffer is used.
+    """
+    if data is None or isinstance(data, (ctypes.Array, ctypes._Pointer)):
+        return data
+    if isinstance(data, _CArgObject):
+        # ctypes only accepts byref() of a single struct_type
+        return data if isinstance(data._obj, struct_type) else ctypes.cast(data, ctypes.POINTER(struct_type))
+    if isinstance(data, (list, tuple)):
+        if count is not None and len(data) < count:
+            raise ValueError(f"the sequence holds less than {count} {struct_type.__name__}")
+        return (struct_type * len(data))(*data)
+    view = memoryview(data)
+    fields, item = _struct_layout(struct_type)
+    size = ctypes.sizeof(struct_type)
+    buffer_fields = _format_fields(view.format)
+    if view.format.startswith('T{'):
+        if buffer_fields != fields or view.itemsize != size:
+            raise TypeError(f"expected a buffer of {struct_type.__name__}, got '{view.format}'")
+    elif buffer_fields is None or len(buffer_fields) != 1 or buffer_fields[0] != item:
+        expected = f" or of {_kind_names[item[0]]}{item[1] * 8}" if item is not None else ""
+        raise TypeError(f"expected a buffer of {struct_type.__name__}{expected}, got '{view.format}'")
+    elif len(fields) > 1:
+        shape = view.shape or (1,)
+        if len(shape) == 1:
+            whole = shape[0] % len(fields) == 0
+        else:
+            # e.g. (n, 2) for Vector2, (n, 4, 4) or (n, 16) for Matrix
+            items = 1
+            for dimension in reversed(shape[1:]):
+                items *= dimension
+                if items >= len(fields):
+                    break
+            whole = items == len(fields)
+        if not whole:
+            raise ValueError(f"the buffer of shape {tuple(shape)} does not hold whole {struct_type.__name__} "
+                             f"({len(fields)} values each)")
+    if not view.c_contiguous:
+        raise ValueError("the buffer must be C contiguous")
+    if count is None:
+        count = view.nbytes // size
+    elif view.nbytes < count * size:
+        raise ValueError(f"the buffer holds less than {count} {struct_type.__name__}")
+    array_type = struct_type * count
+    return array_type.from_buffer_copy(view) if view.readonly else array_type.from_buffer(view)
+
+# endregion (buffer arguments)
+
+# region NATIVE LOOPS
+
+_native_fname = 'raylib_native' + {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+
+try:
+    # written with wrap_header(native=True), compiled by its *_native_build.py script
+    _native = CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), _native_fname))
+except OSError:
+    _native = None
+
+_native_loops = {}
+
+# the display lists being recorded (see `record`) and the call log being
+# written (see `log_calls`), when the binding has them
+_recordings = []
+_call_log = None
+
+
+class _StandIn:
+    """Replaces the foreign function `name` of `_rl` (`func`, typed through
+    it) in the wrappers while recording or logging calls."""
+    __slots__ = ('name', 'func')
+
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+
+    @property
+    def argtypes(self):
+        return self.func.argtypes
+
+    @argtypes.setter
+    def argtypes(self, value):
+        self.func.argtypes = value
+
+    @property
+    def restype(self):
+        return self.func.restype
+
+    @restype.setter
+    def restype(self, value):
+        self.func.restype = value
+
+
+def _foreign(func):
+    """Returns the foreign function of `_rl` behind a stand-in (see `record`
+    and `log_calls`), or `func` itself."""
+    while not isinstance(func, ctypes._CFuncPtr):
+        func = func.func
+    return func
+
+
+def _bound(name, py_name):
+    """Returns the foreign function `name`, typed by its wrapper `py_name`
+    (bound first in a lazy binding)."""
+    func = _foreign(getattr(_rl, name))
+    if func.argtypes is None:
+        getattr(sys.modules[_functions_module], py_name)
+    return func
+
+
+def _native_loop(name, types):
+    """Returns the native loop `name` of the compiled shim (typed on first
+    use), or None when the shim is not compiled or predates the loop."""
+    loop = _native_loops.get(name)
+    if loop is None and _native is not None:
+        loop = getattr(_native, name, None)
+        if loop is not None:
+            loop.argtypes = [c_void_p, c_int] + [arg for item_type in types for arg in (POINTER(item_type), c_int)]
+            loop.restype = None
+            _native_loops[name] = loop
+    return loop
+
+
+def _items(array, size=256):
+    """Iterates a ctypes array a slice at a time: slicing builds the items
+    several times faster than iterating the array does."""
+    bounds = zip(range(0, len(array), size), range(size, len(array) + size, size))
+    return chain.from_iterable(map(array.__getitem__, starmap(slice, bounds)))
+
+
+def _draw_batch(func, types, args, name):
+    """Calls `func` once per item. Each argument is either one value for the
+    whole batch (a structure or a number) or one value per item (a sequence,
+    a ctypes array or a buffer, see `_struct_array`).
+
+    With the compiled shim, the native loop `name` calls `func` in C: one
+    foreign call per batch. Otherwise the items are passed to `func` by a C
+    level iterator, without a Python frame per item: a bit faster than a
+    loop calling the wrapper, only the shim saves the foreign call per item.
+    """
+    # a stand-in (while recording or logging calls) gets each item, and so
+    # does `func` from lists: copying them to arrays costs more than it saves
+    loop = None
+    if isinstance(func, ctypes._CFuncPtr) and not any(isinstance(value, (list, tuple)) for value in args):
+        loop = _native_loop(name, types)
+    values = []
+    strides = []
+    count = None
+    for value, item_type in zip(args, types):
+        if isinstance(value, (item_type, Real)):
+            values.append(value)
+            strides.append(0)
+            continue
+        if issubclass(item_type, Structure) and not isinstance(value, (list, tuple)):
+            value = _struct_array(value, item_type)
+        elif loop is None:
+            value = value.tolist() if hasattr(value, 'tolist') else value
+        else:
+            try:
+                value = _struct_array(value, item_type)
+            except TypeError:
+                # e.g. float64 radii for a float parameter
+                value = (item_type * len(value))(*value.tolist())
+        if count is None:
+            count = len(value)
+        elif len(value) != count:
+            raise ValueError(f"expected {count} items, got {len(value)}")
+        values.append(value)
+        strides.append(1)
+    if count is None:
+        raise ValueError("expected at least one array of values")
+    if loop is None:
+        columns = [(_items(value) if isinstance(value, ctypes.Array) else value) if stride else repeat(value)
+                   for value, stride in zip(values, strides)]
+        deque(starmap(func, zip(*columns)), maxlen=0)
+        return
+    loop_args = [ctypes.cast(func, c_void_p), count]
+    for value, item_type, stride in zip(values, types, strides):
+        if not stride:
+            value = byref(value if isinstance(value, item_type) else item_type(value))
+        loop_args += (value, stride)
+    loop(*loop_args)
+
+
+_command_funcs = None
+
+
+def _execute_commands(data):
+    """Runs the commands packed in `data` (see `CommandBuffer`) with one
+    foreign call to the native executor of the shim."""
+    global _command_funcs
+    if not data:
+        return
+    if _call_log is not None:
+        _call_log.write_commands(data)
+    if _native is None or not hasattr(_native, 'ExecuteCommands'):
+        raise RuntimeError(f"command buffers need the native loops shim ({_native_fname}), "
+                           f"generated with wrap_header(native=True) and built by its *_native_build.py script")
+    if _command_funcs is None:
+        _native.ExecuteCommands.argtypes = [POINTER(c_void_p), c_void_p, c_int]
+        _native.ExecuteCommands.restype = c_int
+        # the foreign functions, even while stand-ins replace them
+        funcs = [ctypes.cast(_foreign(getattr(_rl, name)), c_void_p).value for name in _command_names]
+        _command_funcs = (c_void_p * len(funcs))(*funcs)
+    if isinstance(data, bytes):
+        executed = _native.ExecuteCommands(_command_funcs, data, len(data))
+    else:
+        # a view of the bytearray, released before it can be resized again
+        buffer = (ctypes.c_char * len(data)).from_buffer(data)
+        executed = _native.ExecuteCommands(_command_funcs, ctypes.addressof(buffer), len(data))
+        del buffer
+    if executed < 0:
+        raise ValueError("corrupted command buffer")
+
+# endregion (native loops)
+
+# region DISPLAY LISTS
+
+class _RecordedFunction(_StandIn):
+    """Stands for a foreign function while recording (see `record`): its
+    calls go to the innermost display list being recorded."""
+    __slots__ = ()
+
+    def __call__(self, *args):
+        _recordings[-1]._record(self.name, self.func, args)
+
+
+class DisplayList:
+    """Drawing calls captured by `record`, their arguments converted to
+    ctypes (and structures copied) once, issued again by `replay`."""
+    __slots__ = ('_calls', '_buffer', '_packed', 'valid')
+
+    def __init__(self):
+        self._calls = []
+        self._buffer = None
+        self._packed = None
+        self.valid = False
+
+    def __len__(self):
+        return len(self._calls)
+
+    def invalidate(self) -> None:
+        """Forgets the calls: the list must be recorded again before it is replayed."""
+        self._calls = []
+        self._buffer = self._packed = None
+        self.valid = False
+
+    def replay(self) -> None:
+        """Issues the recorded calls in the current drawing state (e.g. in a
+        `begin_mode2_d` block). With the native loops shim compiled, a list
+        made of commands (see `CommandBuffer`) takes one foreign call."""
+        if not self.valid:
+            raise RuntimeError("the display list is not recorded (or was invalidated)")
+        if _recordings:
+            _recordings[-1]._extend(self)
+        elif self._packed is not None:
+            _execute_commands(self._packed)
+        elif _call_log is not None:
+            stand_ins = _call_log.stand_ins
+            for func, args in self._calls:
+                stand_ins[id(func)](*args)
+        else:
+            for func, args in self._calls:
+                func(*args)
+
+    def _record(self, name, func, args):
+        func = _foreign(func)
+        converted = []
+        for argtype, value in zip(func.argtypes, args):
+            if issubclass(argtype, Structure):
+                value = argtype.from_buffer_copy(argtype.from_param(value))
+            elif issubclass(argtype, ctypes._SimpleCData) and not isinstance(value, argtype):
+                value = argtype(value)
+            converted.append(value)
+        self._calls.append((func, tuple(converted)))
+        if self._buffer is not None:
+            method = _command_names.get(name)
+            try:
+                getattr(self._buffer, method)(*args)
+            except (TypeError, StructError):
+                # not a command (method is None), or not packable arguments
+                self._buffer = None
+
+    def _extend(self, other):
+        self._calls.extend(other._calls)
+        if self._buffer is not None:
+            if other._packed is None:
+                self._buffer = None
+            else:
+                self._buffer._data += other._packed
+
+
+@contextmanager
+def record(display_list=None):
+    """Captures the drawing calls (`draw_*`, `begin_*`/`end_*` modes,
+    `clear_background`) made in the block into `display_list` (a new one, or
+    an existing one recorded again) instead of issuing them; other functions
+    run as usual. Recordings nest: replaying a list while recording another
+    one records its calls. Pointer arguments are kept by reference.
+    """
+    if not _recorded_names:
+        raise RuntimeError("no function can be recorded (the binding was generated with direct=True)")
+    display_list = DisplayList() if display_list is None else display_list
+    display_list.invalidate()
+    if _command_names and _native is not None and hasattr(_native, 'ExecuteCommands'):
+        display_list._buffer = CommandBuffer()
+    if not _recordings:
+        for name in _recorded_names:
+            setattr(_rl, name, _RecordedFunction(name, getattr(_rl, name)))
+    _recordings.append(display_list)
+    try:
+        yield display_list
+    finally:
+        _recordings.pop()
+        if not _recordings:
+            for name in _recorded_names:
+                setattr(_rl, name, getattr(_rl, name).func)
+    buffer = display_list._buffer
+    display_list._packed = None if buffer is None else bytes(buffer._data)
+    display_list._buffer = None
+    display_list.valid = True
+
+# endregion (display lists)
+
+# region CALL LOGS
+
+_log_magic = b'RLCTBG CALL LOG 1 '
+_log_id = Struct('<H')
+_log_size = Struct('<i')
+# the scalar formats (long is logged on 8 bytes, whatever its size)
+_log_scalars = {code: Struct('<' + {'l': 'q', 'L': 'Q'}.get(code, code)) for code in '?cbBhHiIlLqQfd'}
+
+
+def _log_kind(ctype):
+    """Returns how values of `ctype` are logged: a scalar format, 'S<size>'
+    for a structure, 'z' for a string, 'p' for the memory a pointer
+    references and 'n' for nothing (callbacks, void)."""
+    if ctype is None:
+        return 'n'
+    if ctype is c_char_p:
+        return 'z'
+    if issubclass(ctype, Structure):
+        return f'S{ctypes.sizeof(ctype)}'
+    if issubclass(ctype, ctypes._SimpleCData) and ctype._type_ in _log_scalars:
+        return ctype._type_
+    if ctype is c_void_p or issubclass(ctype, (ctypes._Pointer, ctypes.Array)):
+        return 'p'
+    return 'n'
+
+
+def _log_memory(value):
+    """Returns a copy of the memory `value` references (passed to a pointer
+    parameter), or None for NULL and bare addresses."""
+    if value is None or isinstance(value, int):
+        return None
+    if isinstance(value, ctypes._Pointer):
+        return bytes(value.contents) if value else None
+    if isinstance(value, _CArgObject):
+        value = value._obj
+    if isinstance(value, (c_char_p, c_void_p)):
+        return value.value if isinstance(value, c_char_p) else None
+    try:
+        return bytes(value)
+    except TypeError:
+        return None
+
+
+def _log_encode(kind, value, parts):
+    if kind == 'n':
+        return
+    if kind == 'z' or kind == 'p':
+        if kind == 'z' and value is not None and not isinstance(value, bytes):
+            value = value.value
+        data = value if kind == 'z' else _log_memory(value)
+        if data is None:
+            parts.append(_log_size.pack(-1))
+        else:
+            parts.append(_log_size.pack(len(data)))
+            parts.append(data)
+    elif kind[0] == 'S':
+        parts.append(bytes(value))
+    else:
+        if isinstance(value, ctypes._SimpleCData):
+            value = value.value
+        if kind == 'c' and isinstance(value, int):
+            value = bytes((value,))
+        parts.append(_log_scalars[kind].pack(value))
+
+
+class _LogTruncated(Exception):
+    """Raised when a call log ends in the middle of a record."""
+
+
+def _log_check(data, offset, size):
+    if offset + size > len(data):
+        raise _LogTruncated
+
+
+def _log_decode(kind, data, offset):
+    if kind == 'n':
+        return None, offset
+    if kind == 'z' or kind == 'p':
+        _log_check(data, offset, 4)
+        size, = _log_size.unpack_from(data, offset)
+        offset += 4
+        if size < 0:
+            return None, offset
+    elif kind[0] == 'S':
+        size = int(kind[1:])
+    else:
+        scalar = _log_scalars[kind]
+        _log_check(data, offset, scalar.size)
+        return scalar.unpack_from(data, offset)[0], offset + scalar.size
+    _log_check(data, offset, size)
+    return data[offset:offset + size], offset + size
+
+
+class _LoggedFunction(_StandIn):
+    """Stands for a foreign function while a call log is written (see
+    `log_calls`): logs each call with its arguments and result."""
+    __slots__ = ('ident', 'kinds', 'result_kind')
+
+    def __init__(self, name, func):
+        super().__init__(name, func)
+        self.ident = None
+
+    def __call__(self, *args):
+        result = self.func(*args)
+        _call_log.write(self, args, result)
+        return result
+
+
+class _CallLogWriter:
+    __slots__ = ('file', 'stand_ins', 'count', 'commands')
+
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        self.file.write(_log_magic)
+        self.stand_ins = {}
+        self.count = 0
+        self.commands = None
+
+    def define(self, name, kinds, result_kind):
+        """Declares a function (its arguments and result encoding), the
+        following calls refer to it by its number."""
+        self.count += 1
+        signature = f"{name}:{','.join(kinds)}:{result_kind}".encode()
+        self.file.write(_log_id.pack(0) + _log_id.pack(len(signature)) + signature)
+        return self.count
+
+    def write(self, stand_in, args, result):
+        if stand_in.ident is None:
+            func = stand_in.func
+            stand_in.kinds = [_log_kind(argtype) for argtype in func.argtypes or ()]
+            # only the memory a pointer argument references is known
+            result_kind = _log_kind(func.restype)
+            stand_in.result_kind = 'n' if result_kind == 'p' else result_kind
+            stand_in.ident = self.define(stand_in.name, stand_in.kinds, stand_in.result_kind)
+        parts = [_log_id.pack(stand_in.ident)]
+        for kind, value in zip(stand_in.kinds, args):
+            _log_encode(kind, value, parts)
+        _log_encode(stand_in.result_kind, result, parts)
+        self.file.write(b''.join(parts))
+
+    def write_commands(self, data):
+        if self.commands is None:
+            self.commands = self.define('_execute_commands', ['p'], 'n')
+        self.file.write(_log_id.pack(self.commands) + _log_size.pack(len(data)) + bytes(data))
+
+
+@contextmanager
+def log_calls(path):
+    """Writes the library calls made in the block to the binary call log
+    `path`, in order, with their arguments (structures and the memory
+    pointer arguments reference copied) and results, for `CallLog`. The
+    calls of batches, command buffers and display lists are logged too.
+    """
+    global _call_log
+    if not _logged_names:
+        raise RuntimeError("no function can be logged (the binding was generated with direct=True)")
+    if _call_log is not None:
+        raise RuntimeError("a call log is already being written")
+    if _recordings:
+        raise RuntimeError("calls can not be logged while recording a display list")
+    writer = _CallLogWriter(path)
+    try:
+        for name in _logged_names:
+            func = getattr(_rl, name, None)
+            if func is not None:
+                # by id: foreign functions are not hashable
+                stand_in = writer.stand_ins[id(func)] = _LoggedFunction(name, func)
+                setattr(_rl, name, stand_in)
+        _call_log = writer
+        yield
+    finally:
+        _call_log = None
+        for stand_in in writer.stand_ins.values():
+            setattr(_rl, stand_in.name, stand_in.func)
+        writer.file.close()
+
+
+def _logged_function(name):
+    """Returns the foreign function `name`, typed (a lazy one is bound)."""
+    if name == '_execute_commands':
+        return _execute_commands
+    if name not in _logged_names:
+        raise ValueError(f"the call log uses {name}, which is not part of this binding")
+    return _bound(name, _logged_names[name])
+
+
+class CallLog:
+    """The calls of a log written by `log_calls`: `calls` lists their names,
+    arguments and results (structures and referenced memory as bytes) and
+    `replay` issues them again. A log cut short (e.g. by a crash) keeps its
+    complete calls."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        if not data.startswith(_log_magic):
+            raise ValueError(f"{path} is not a call log")
+        self.calls = []
+        self._replayed = None
+        signatures = [None]
+        offset = len(_log_magic)
+        try:
+            while offset < len(data):
+                _log_check(data, offset, 2)
+                ident, = _log_id.unpack_from(data, offset)
+                offset += 2
+                if ident == 0:
+                    _log_check(data, offset, 2)
+                    size, = _log_id.unpack_from(data, offset)
+                    _log_check(data, offset + 2, size)
+                    name, kinds, result_kind = data[offset + 2:offset + 2 + size].decode().split(':')
+                    signatures.append((name, kinds.split(',') if kinds else [], result_kind))
+                    offset += 2 + size
+                    continue
+                name, kinds, result_kind = signatures[ident]
+                args = []
+                for kind in kinds:
+                    value, offset = _log_decode(kind, data, offset)
+                    args.append(value)
+                result, offset = _log_decode(result_kind, data, offset)
+                self.calls.append((name, tuple(args), result))
+        except _LogTruncated:
+            pass
+        except (StructError, ValueError, IndexError, KeyError):
+            raise ValueError(f"{path} is corrupted") from None
+
+    def __len__(self):
+        return len(self.calls)
+
+    def _prepare(self):
+        calls = []
+        for name, args, _ in self.calls:
+            func = _logged_function(name)
+            if func is _execute_commands:
+                calls.append((func, args))
+                continue
+            if len(args) != len(func.argtypes):
+                raise ValueError(f"the call log and the binding disagree on the signature of {name}")
+            converted = []
+            for argtype, value in zip(func.argtypes, args):
+                if value is None or not isinstance(value, bytes) or argtype is c_char_p:
+                    pass
+                elif issubclass(argtype, Structure):
+                    if len(value) != ctypes.sizeof(argtype):
+                        raise ValueError(f"the call log and the binding disagree on the size of {argtype.__name__}")
+                    value = argtype.from_buffer_copy(value)
+                else:
+                    buffer = ctypes.create_string_buffer(value, len(value))
+                    value = buffer if argtype is c_void_p else ctypes.cast(buffer, argtype)
+                converted.append(value)
+            calls.append((func, tuple(converted)))
+        return calls
+
+    def replay(self):
+        """Issues the logged calls again, in order, straight to the foreign
+        functions of the library this module loaded (e.g. the stand-in one,
+        see `RLCTBG_LIBRARY`), and returns the time taken by each frame (the
+        calls up to each `EndDrawing`), in seconds.
+
+        Pointer arguments reference copies of the logged memory; addresses
+        stored in structures (e.g. `Image.data`) and bare ones are passed as
+        they were logged, so replays against the real library are limited to
+        the calls that do not dereference them (drawing, input, timing).
+        """
+        if self._replayed is None:
+            self._replayed = self._prepare()
+        end = _foreign(_rl.EndDrawing) if 'EndDrawing' in _logged_names else None
+        times = []
+        start = _perf_counter()
+        for func, args in self._replayed:
+            func(*args)
+            if func is end:
+                now = _perf_counter()
+                times.append(now - start)
+                start = now
+        if not times or self._replayed[-1][0] is not end:
+            times.append(_perf_counter() - start)
+        return times
+
+# endregion (call logs)
+
+# region STRINGS
+
+# the UTF-8 encodings of the last strings passed as `char *` arguments
+_encoded = _lru_cache(1024)(str.encode)
+
+
+def _encode(value):
+    # a str is encoded (once while it stays in the cache), anything else,
+    # bytes included, goes to ctypes unchanged (the wrappers inline it)
+    return _encoded(value) if value.__class__ is str else value
+
+
+def _decode(value):
+    return None if value is None else value.decode('utf-8', 'replace')
+
+# endregion (strings)
+
+# region MEMOIZED FUNCTIONS
+
+# the LRU caches of the `*_cached` variants of the pure functions, by name
+_memo_caches = {}
+
+
+def _memoized(name, func):
+    cache = _memo_caches[name] = _lru_cache(256)(func)
+    return cache
+
+
+def memo_info():
+    """Returns the `functools.lru_cache` statistics (hits, misses, maxsize,
+    currsize) of the bound `*_cached` functions, by name."""
+    return {name: cache.cache_info() for name, cache in _memo_caches.items()}
+
+
+def clear_memo():
+    """Empties the caches of the `*_cached` functions and resets their statistics."""
+    for cache in _memo_caches.values():
+        cache.cache_clear()
+
+# endregion (memoized functions)
+
 __all__ = [
+    'add_frame_hook',
+    'remove_frame_hook',
+    'struct_dtype',
+    'as_array',
+    'as_ctypes',
+    'memo_info',
+    'clear_memo',
     'PI',
     'DEG2RAD',
     'RAD2DEG',
@@ -474,6 +1464,14 @@ __all__ = [
     'NPT_3PATCH_VERTICAL',
     'NPT_3PATCH_HORIZONTAL',
     'TraceLogCallback',
+    'CommandBuffer',
+    'InputSnapshot',
+    'GamepadSnapshot',
+    'DisplayList',
+    'record',
+    'CallLog',
+    'log_calls',
+    'FrameTelemetry',
     'init_window',
     'window_should_close',
     'close_window',
@@ -529,12 +1527,18 @@ __all__ = [
     'get_frame_time',
     'get_time',
     'color_to_int',
+    'color_to_int_cached',
     'color_normalize',
+    'color_normalize_cached',
     'color_from_normalized',
     'color_to_hsv',
+    'color_to_hsv_cached',
     'color_from_hsv',
+    'color_from_hsv_cached',
     'get_color',
+    'get_color_cached',
     'fade',
+    'fade_cached',
     'set_config_flags',
     'set_trace_log_level',
     'set_trace_log_exit',
@@ -642,9 +1646,11 @@ __all__ = [
     'draw_poly_lines',
     'set_shapes_texture',
     'check_collision_recs',
+    'check_collision_recs_cached',
     'check_collision_circles',
     'check_collision_circle_rec',
     'get_collision_rec',
+    'get_collision_rec_cached',
     'check_collision_point_rec',
     'check_collision_point_circle',
     'check_collision_point_triangle',
@@ -731,6 +1737,7 @@ __all__ = [
     'draw_text_rec',
     'draw_text_codepoint',
     'measure_text',
+    'measure_text_cached',
     'measure_text_ex',
     'get_glyph_index',
     'text_is_equal',
@@ -893,6 +1900,10 @@ __all__ = [
     'stop_audio_stream',
     'set_audio_stream_volume',
     'set_audio_stream_pitch',
+    'draw_rectangles',
+    'draw_circles',
+    'draw_lines',
+    'draw_textures_pro',
 ]
 
 PI = 3.14159265358979323846
@@ -903,23 +1914,66 @@ MAX_TOUCH_POINTS = 10
 
 class Vector2(Structure):
     """Vector2 type"""
+    __slots__ = ()
     _fields_ = [
        ('x', c_float),
        ('y', c_float),
     ]
 
+    @staticmethod
+    def make(x: float, y: float, _pack_into=Struct('ff').pack_into) -> 'Vector2':
+        """Builds an instance packing all the fields at once."""
+        obj = Vector2()
+        _pack_into(obj, 0, x, y)
+        return obj
+
+    def set(self, x: float, y: float, _pack_into=Struct('ff').pack_into) -> 'Vector2':
+        """Overwrites all the fields in place and returns the instance."""
+        _pack_into(self, 0, x, y)
+        return self
+
+    @staticmethod
+    def scratch(x: float, y: float, _pool=_ScratchPool(), _pack_into=Struct('ff').pack_into) -> 'Vector2':
+        """Like `make`, but the instance is reused after `end_drawing`: do not keep it."""
+        obj = _pool.free.pop() if _pool.free else Vector2()
+        _pool.used.append(obj)
+        _pack_into(obj, 0, x, y)
+        return obj
+
 
 class Vector3(Structure):
     """Vector3 type"""
+    __slots__ = ()
     _fields_ = [
        ('x', c_float),
        ('y', c_float),
        ('z', c_float),
     ]
 
+    @staticmethod
+    def make(x: float, y: float, z: float, _pack_into=Struct('fff').pack_into) -> 'Vector3':
+        """Builds an instance packing all the fields at once."""
+        obj = Vector3()
+        _pack_into(obj, 0, x, y, z)
+        return obj
+
+    def set(self, x: float, y: float, z: float, _pack_into=Struct('fff').pack_into) -> 'Vector3':
+        """Overwrites all the fields in place and returns the instance."""
+        _pack_into(self, 0, x, y, z)
+        return self
+
+    @staticmethod
+    def scratch(x: float, y: float, z: float, _pool=_ScratchPool(), _pack_into=Struct('fff').pack_into) -> 'Vector3':
+        """Like `make`, but the instance is reused after `end_drawing`: do not keep it."""
+        obj = _pool.free.pop() if _pool.free else Vector3()
+        _pool.used.append(obj)
+        _pack_into(obj, 0, x, y, z)
+        return obj
+
 
 class Vector4(Structure):
     """Vector4 type"""
+    __slots__ = ()
     _fields_ = [
        ('x', c_float),
        ('y', c_float),
@@ -927,12 +1981,33 @@ class Vector4(Structure):
        ('w', c_float),
     ]
 
+    @staticmethod
+    def make(x: float, y: float, z: float, w: float, _pack_into=Struct('ffff').pack_into) -> 'Vector4':
+        """Builds an instance packing all the fields at once."""
+        obj = Vector4()
+        _pack_into(obj, 0, x, y, z, w)
+        return obj
+
+    def set(self, x: float, y: float, z: float, w: float, _pack_into=Struct('ffff').pack_into) -> 'Vector4':
+        """Overwrites all the fields in place and returns the instance."""
+        _pack_into(self, 0, x, y, z, w)
+        return self
+
+    @staticmethod
+    def scratch(x: float, y: float, z: float, w: float, _pool=_ScratchPool(), _pack_into=Struct('ffff').pack_into) -> 'Vector4':
+        """Like `make`, but the instance is reused after `end_drawing`: do not keep it."""
+        obj = _pool.free.pop() if _pool.free else Vector4()
+        _pool.used.append(obj)
+        _pack_into(obj, 0, x, y, z, w)
+        return obj
+
 
 Quaternion = Vector4
 
 
 class Matrix(Structure):
     """Matrix type (OpenGL style 4x4 - right handed, column major)"""
+    __slots__ = ()
     _fields_ = [
        ('m0', c_float),
        ('m4', c_float),
@@ -955,6 +2030,7 @@ class Matrix(Structure):
 
 class Color(Structure):
     """Color type, RGBA (32bit)"""
+    __slots__ = ()
     _fields_ = [
        ('r', c_ubyte),
        ('g', c_ubyte),
@@ -962,9 +2038,30 @@ class Color(Structure):
        ('a', c_ubyte),
     ]
 
+    @staticmethod
+    def make(r: int, g: int, b: int, a: int, _pack_into=Struct('BBBB').pack_into) -> 'Color':
+        """Builds an instance packing all the fields at once."""
+        obj = Color()
+        _pack_into(obj, 0, r, g, b, a)
+        return obj
+
+    def set(self, r: int, g: int, b: int, a: int, _pack_into=Struct('BBBB').pack_into) -> 'Color':
+        """Overwrites all the fields in place and returns the instance."""
+        _pack_into(self, 0, r, g, b, a)
+        return self
+
+    @staticmethod
+    def scratch(r: int, g: int, b: int, a: int, _pool=_ScratchPool(), _pack_into=Struct('BBBB').pack_into) -> 'Color':
+        """Like `make`, but the instance is reused after `end_drawing`: do not keep it."""
+        obj = _pool.free.pop() if _pool.free else Color()
+        _pool.used.append(obj)
+        _pack_into(obj, 0, r, g, b, a)
+        return obj
+
 
 class Rectangle(Structure):
     """Rectangle type"""
+    __slots__ = ()
     _fields_ = [
        ('x', c_float),
        ('y', c_float),
@@ -972,9 +2069,30 @@ class Rectangle(Structure):
        ('height', c_float),
     ]
 
+    @staticmethod
+    def make(x: float, y: float, width: float, height: float, _pack_into=Struct('ffff').pack_into) -> 'Rectangle':
+        """Builds an instance packing all the fields at once."""
+        obj = Rectangle()
+        _pack_into(obj, 0, x, y, width, height)
+        return obj
+
+    def set(self, x: float, y: float, width: float, height: float, _pack_into=Struct('ffff').pack_into) -> 'Rectangle':
+        """Overwrites all the fields in place and returns the instance."""
+        _pack_into(self, 0, x, y, width, height)
+        return self
+
+    @staticmethod
+    def scratch(x: float, y: float, width: float, height: float, _pool=_ScratchPool(), _pack_into=Struct('ffff').pack_into) -> 'Rectangle':
+        """Like `make`, but the instance is reused after `end_drawing`: do not keep it."""
+        obj = _pool.free.pop() if _pool.free else Rectangle()
+        _pool.used.append(obj)
+        _pack_into(obj, 0, x, y, width, height)
+        return obj
+
 
 class Image(Structure):
     """NOTE: Data stored in CPU memory (RAM)"""
+    __slots__ = ()
     _fields_ = [
        ('data', c_void_p),
        ('width', c_int),
@@ -986,6 +2104,7 @@ class Image(Structure):
 
 class Texture2D(Structure):
     """NOTE: Data stored in GPU memory"""
+    __slots__ = ()
     _fields_ = [
        ('id', c_uint),
        ('width', c_int),
@@ -1003,6 +2122,7 @@ TextureCubemap = Texture2D
 
 class RenderTexture2D(Structure):
     """RenderTexture2D type, for texture rendering"""
+    __slots__ = ()
     _fields_ = [
        ('id', c_uint),
        ('texture', Texture2D),
@@ -1016,6 +2136,7 @@ RenderTexture = RenderTexture2D
 
 class NPatchInfo(Structure):
     """N-Patch layout info"""
+    __slots__ = ()
     _fields_ = [
        ('sourceRec', Rectangle),
        ('left', c_int),
@@ -1028,6 +2149,7 @@ class NPatchInfo(Structure):
 
 class CharInfo(Structure):
     """Font character info"""
+    __slots__ = ()
     _fields_ = [
        ('value', c_int),
        ('offsetX', c_int),
@@ -1039,6 +2161,7 @@ class CharInfo(Structure):
 
 class Font(Structure):
     """Font type, includes texture and charSet array data"""
+    __slots__ = ()
     _fields_ = [
        ('baseSize', c_int),
        ('charsCount', c_int),
@@ -1053,6 +2176,7 @@ SpriteFont = Font
 
 class Camera3D(Structure):
     """Camera type, defines a camera position/orientation in 3d space"""
+    __slots__ = ()
     _fields_ = [
        ('position', Vector3),
        ('target', Vector3),
@@ -1067,6 +2191,7 @@ Camera = Camera3D
 
 class Camera2D(Structure):
     """Camera2D type, defines a 2d camera"""
+    __slots__ = ()
     _fields_ = [
        ('offset', Vector2),
        ('target', Vector2),
@@ -1077,6 +2202,7 @@ class Camera2D(Structure):
 
 class Mesh(Structure):
     """NOTE: Data stored in CPU memory (and GPU)"""
+    __slots__ = ()
     _fields_ = [
        ('vertexCount', c_int),
        ('triangleCount', c_int),
@@ -1098,6 +2224,7 @@ class Mesh(Structure):
 
 class Shader(Structure):
     """Shader type (generic)"""
+    __slots__ = ()
     _fields_ = [
        ('id', c_uint),
        ('locs', POINTER(c_int)),
@@ -1106,6 +2233,7 @@ class Shader(Structure):
 
 class MaterialMap(Structure):
     """Material texture map"""
+    __slots__ = ()
     _fields_ = [
        ('texture', Texture2D),
        ('color', Color),
@@ -1115,6 +2243,7 @@ class MaterialMap(Structure):
 
 class Material(Structure):
     """Material type (generic)"""
+    __slots__ = ()
     _fields_ = [
        ('shader', Shader),
        ('maps', POINTER(MaterialMap)),
@@ -1124,6 +2253,7 @@ class Material(Structure):
 
 class Transform(Structure):
     """Transformation properties"""
+    __slots__ = ()
     _fields_ = [
        ('translation', Vector3),
        ('rotation', Quaternion),
@@ -1133,6 +2263,7 @@ class Transform(Structure):
 
 class BoneInfo(Structure):
     """Bone information"""
+    __slots__ = ()
     _fields_ = [
        ('name', c_char * 32),
        ('parent', c_int),
@@ -1141,6 +2272,7 @@ class BoneInfo(Structure):
 
 class Model(Structure):
     """Model type"""
+    __slots__ = ()
     _fields_ = [
        ('transform', Matrix),
        ('meshCount', c_int),
@@ -1156,6 +2288,7 @@ class Model(Structure):
 
 class ModelAnimation(Structure):
     """Model animation"""
+    __slots__ = ()
     _fields_ = [
        ('boneCount', c_int),
        ('bones', POINTER(BoneInfo)),
@@ -1166,6 +2299,7 @@ class ModelAnimation(Structure):
 
 class Ray(Structure):
     """Ray type (useful for raycast)"""
+    __slots__ = ()
     _fields_ = [
        ('position', Vector3),
        ('direction', Vector3),
@@ -1174,6 +2308,7 @@ class Ray(Structure):
 
 class RayHitInfo(Structure):
     """Raycast hit information"""
+    __slots__ = ()
     _fields_ = [
        ('hit', c_bool),
        ('distance', c_float),
@@ -1184,6 +2319,7 @@ class RayHitInfo(Structure):
 
 class BoundingBox(Structure):
     """Bounding box type"""
+    __slots__ = ()
     _fields_ = [
        ('min', Vector3),
        ('max', Vector3),
@@ -1192,6 +2328,7 @@ class BoundingBox(Structure):
 
 class Wave(Structure):
     """Wave type, defines audio wave data"""
+    __slots__ = ()
     _fields_ = [
        ('sampleCount', c_uint),
        ('sampleRate', c_uint),
@@ -1202,11 +2339,12 @@ class Wave(Structure):
 
 
 class rAudioBuffer(Structure):
-    pass
+    __slots__ = ()
 
 
 class AudioStream(Structure):
     """NOTE: Useful to create custom audio streams not bound to a specific file"""
+    __slots__ = ()
     _fields_ = [
        ('sampleRate', c_uint),
        ('sampleSize', c_uint),
@@ -1217,6 +2355,7 @@ class AudioStream(Structure):
 
 class Sound(Structure):
     """Sound source type"""
+    __slots__ = ()
     _fields_ = [
        ('sampleCount', c_uint),
        ('stream', AudioStream),
@@ -1225,6 +2364,7 @@ class Sound(Structure):
 
 class Music(Structure):
     """NOTE: Anything longer than ~10 seconds should be streamed"""
+    __slots__ = ()
     _fields_ = [
        ('ctxType', c_int),
        ('ctxData', c_void_p),
@@ -1236,6 +2376,7 @@ class Music(Structure):
 
 class VrDeviceInfo(Structure):
     """Head-Mounted-Display device parameters"""
+    __slots__ = ()
     _fields_ = [
        ('hResolution', c_int),
        ('vResolution', c_int),
@@ -1915,7 +3056,7 @@ NPT_3PATCH_VERTICAL = NPatchType.N3PATCH_VERTICAL
 NPT_3PATCH_HORIZONTAL = NPatchType.N3PATCH_HORIZONTAL
 
 
-TraceLogCallback = CFUNCTYPE(c_int, c_char_p, c_void_p)
+TraceLogCallback = CFUNCTYPE(None, c_int, c_char_p, c_void_p)
 
 LIGHTGRAY = Color(200, 200, 200, 255)    # Light Gray
 GRAY = Color(130, 130, 130, 255)    # Gray
@@ -1944,9 +3085,1496 @@ BLANK = Color(0, 0, 0, 0)            # Blank (Transparent)
 MAGENTA = Color(255, 0, 255, 255)      # Magenta
 RAYWHITE = Color(245, 245, 245, 255)    # My own White (raylib logo)
 
+_dtype_fields = {
+    Vector2: [('x', 'f', 0), ('y', 'f', 0)],
+    Vector3: [('x', 'f', 0), ('y', 'f', 0), ('z', 'f', 0)],
+    Vector4: [('x', 'f', 0), ('y', 'f', 0), ('z', 'f', 0), ('w', 'f', 0)],
+    Matrix: [('m0', 'f', 0), ('m4', 'f', 0), ('m8', 'f', 0), ('m12', 'f', 0), ('m1', 'f', 0), ('m5', 'f', 0), ('m9', 'f', 0), ('m13', 'f', 0), ('m2', 'f', 0), ('m6', 'f', 0), ('m10', 'f', 0), ('m14', 'f', 0), ('m3', 'f', 0), ('m7', 'f', 0), ('m11', 'f', 0), ('m15', 'f', 0)],
+    Color: [('r', 'B', 0), ('g', 'B', 0), ('b', 'B', 0), ('a', 'B', 0)],
+    Rectangle: [('x', 'f', 0), ('y', 'f', 0), ('width', 'f', 0), ('height', 'f', 0)],
+    Image: [('data', 'P', 0), ('width', 'i', 0), ('height', 'i', 0), ('mipmaps', 'i', 0), ('format', 'i', 0)],
+    Texture2D: [('id', 'I', 0), ('width', 'i', 0), ('height', 'i', 0), ('mipmaps', 'i', 0), ('format', 'i', 0)],
+    RenderTexture2D: [('id', 'I', 0), ('texture', Texture2D, 0), ('depth', Texture2D, 0), ('depthTexture', '?', 0)],
+    NPatchInfo: [('sourceRec', Rectangle, 0), ('left', 'i', 0), ('top', 'i', 0), ('right', 'i', 0), ('bottom', 'i', 0), ('type', 'i', 0)],
+    CharInfo: [('value', 'i', 0), ('offsetX', 'i', 0), ('offsetY', 'i', 0), ('advanceX', 'i', 0), ('image', Image, 0)],
+    Font: [('baseSize', 'i', 0), ('charsCount', 'i', 0), ('texture', Texture2D, 0), ('recs', 'P', 0), ('chars', 'P', 0)],
+    Camera3D: [('position', Vector3, 0), ('target', Vector3, 0), ('up', Vector3, 0), ('fovy', 'f', 0), ('type', 'i', 0)],
+    Camera2D: [('offset', Vector2, 0), ('target', Vector2, 0), ('rotation', 'f', 0), ('zoom', 'f', 0)],
+    Mesh: [('vertexCount', 'i', 0), ('triangleCount', 'i', 0), ('vertices', 'P', 0), ('texcoords', 'P', 0), ('texcoords2', 'P', 0), ('normals', 'P', 0), ('tangents', 'P', 0), ('colors', 'P', 0), ('indices', 'P', 0), ('animVertices', 'P', 0), ('animNormals', 'P', 0), ('boneIds', 'P', 0), ('boneWeights', 'P', 0), ('vaoId', 'I', 0), ('vboId', 'P', 0)],
+    Shader: [('id', 'I', 0), ('locs', 'P', 0)],
+    MaterialMap: [('texture', Texture2D, 0), ('color', Color, 0), ('value', 'f', 0)],
+    Material: [('shader', Shader, 0), ('maps', 'P', 0), ('params', 'P', 0)],
+    Transform: [('translation', Vector3, 0), ('rotation', Quaternion, 0), ('scale', Vector3, 0)],
+    BoneInfo: [('name', 'S32', 0), ('parent', 'i', 0)],
+    Model: [('transform', Matrix, 0), ('meshCount', 'i', 0), ('meshes', 'P', 0), ('materialCount', 'i', 0), ('materials', 'P', 0), ('meshMaterial', 'P', 0), ('boneCount', 'i', 0), ('bones', 'P', 0), ('bindPose', 'P', 0)],
+    ModelAnimation: [('boneCount', 'i', 0), ('bones', 'P', 0), ('frameCount', 'i', 0), ('framePoses', 'P', 0)],
+    Ray: [('position', Vector3, 0), ('direction', Vector3, 0)],
+    RayHitInfo: [('hit', '?', 0), ('distance', 'f', 0), ('position', Vector3, 0), ('normal', Vector3, 0)],
+    BoundingBox: [('min', Vector3, 0), ('max', Vector3, 0)],
+    Wave: [('sampleCount', 'I', 0), ('sampleRate', 'I', 0), ('sampleSize', 'I', 0), ('channels', 'I', 0), ('data', 'P', 0)],
+    AudioStream: [('sampleRate', 'I', 0), ('sampleSize', 'I', 0), ('channels', 'I', 0), ('buffer', 'P', 0)],
+    Sound: [('sampleCount', 'I', 0), ('stream', AudioStream, 0)],
+    Music: [('ctxType', 'i', 0), ('ctxData', 'P', 0), ('sampleCount', 'I', 0), ('loopCount', 'I', 0), ('stream', AudioStream, 0)],
+    VrDeviceInfo: [('hResolution', 'i', 0), ('vResolution', 'i', 0), ('hScreenSize', 'f', 0), ('vScreenSize', 'f', 0), ('vScreenCenter', 'f', 0), ('eyeToScreenDistance', 'f', 0), ('lensSeparationDistance', 'f', 0), ('interpupillaryDistance', 'f', 0), ('lensDistortionValues', 'f', 4), ('chromaAbCorrection', 'f', 4)],
+}
+
+
+class CommandBuffer:
+    """Records draw calls (`draw_*`, `begin_*`/`end_*` modes,
+    `clear_background`) into a packed buffer, run by `submit` with a single
+    foreign call through the native loops shim. The methods take the same
+    arguments as the functions (structures or tuples of their fields)."""
+    __slots__ = ('_data',)
+
+    def __init__(self):
+        self._data = bytearray()
+
+    def clear(self) -> None:
+        """Forgets the recorded commands."""
+        self._data.clear()
+
+    def submit(self, clear: bool = True) -> None:
+        """Runs the recorded commands in order, then forgets them unless `clear` is False."""
+        _execute_commands(self._data)
+        if clear:
+            self._data.clear()
+
+    _pack_clear_background = Struct('=i').pack
+
+    def clear_background(self, color: Color) -> None:
+        data = self._data
+        data += self._pack_clear_background(0)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_begin_mode2_d = Struct('=i').pack
+
+    def begin_mode2_d(self, camera: Camera2D) -> None:
+        data = self._data
+        data += self._pack_begin_mode2_d(1)
+        data += camera if type(camera) is Camera2D else Camera2D(*camera)
+
+    _pack_end_mode2_d = Struct('=i').pack
+
+    def end_mode2_d(self) -> None:
+        data = self._data
+        data += self._pack_end_mode2_d(2)
+
+    _pack_begin_mode3_d = Struct('=i').pack
+
+    def begin_mode3_d(self, camera: Camera3D) -> None:
+        data = self._data
+        data += self._pack_begin_mode3_d(3)
+        data += camera if type(camera) is Camera3D else Camera3D(*camera)
+
+    _pack_end_mode3_d = Struct('=i').pack
+
+    def end_mode3_d(self) -> None:
+        data = self._data
+        data += self._pack_end_mode3_d(4)
+
+    _pack_begin_texture_mode = Struct('=i').pack
+
+    def begin_texture_mode(self, target: RenderTexture2D) -> None:
+        data = self._data
+        data += self._pack_begin_texture_mode(5)
+        data += target if type(target) is RenderTexture2D else RenderTexture2D(*target)
+
+    _pack_end_texture_mode = Struct('=i').pack
+
+    def end_texture_mode(self) -> None:
+        data = self._data
+        data += self._pack_end_texture_mode(6)
+
+    _pack_begin_scissor_mode = Struct('=iiiii').pack
+
+    def begin_scissor_mode(self, x: int, y: int, width: int, height: int) -> None:
+        data = self._data
+        data += self._pack_begin_scissor_mode(7, x, y, width, height)
+
+    _pack_end_scissor_mode = Struct('=i').pack
+
+    def end_scissor_mode(self) -> None:
+        data = self._data
+        data += self._pack_end_scissor_mode(8)
+
+    _pack_draw_pixel = Struct('=iii').pack
+
+    def draw_pixel(self, pos_x: int, pos_y: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_pixel(9, pos_x, pos_y)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_pixel_v = Struct('=i').pack
+
+    def draw_pixel_v(self, position: Vector2, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_pixel_v(10)
+        data += position if type(position) is Vector2 else Vector2(*position)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_line = Struct('=iiiii').pack
+
+    def draw_line(self, start_pos_x: int, start_pos_y: int, end_pos_x: int, end_pos_y: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_line(11, start_pos_x, start_pos_y, end_pos_x, end_pos_y)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_line_v = Struct('=i').pack
+
+    def draw_line_v(self, start_pos: Vector2, end_pos: Vector2, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_line_v(12)
+        data += start_pos if type(start_pos) is Vector2 else Vector2(*start_pos)
+        data += end_pos if type(end_pos) is Vector2 else Vector2(*end_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_line_ex = Struct('=if').pack
+
+    def draw_line_ex(self, start_pos: Vector2, end_pos: Vector2, thick: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_line_ex(13, thick)
+        data += start_pos if type(start_pos) is Vector2 else Vector2(*start_pos)
+        data += end_pos if type(end_pos) is Vector2 else Vector2(*end_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_line_bezier = Struct('=if').pack
+
+    def draw_line_bezier(self, start_pos: Vector2, end_pos: Vector2, thick: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_line_bezier(14, thick)
+        data += start_pos if type(start_pos) is Vector2 else Vector2(*start_pos)
+        data += end_pos if type(end_pos) is Vector2 else Vector2(*end_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_circle = Struct('=iiif').pack
+
+    def draw_circle(self, center_x: int, center_y: int, radius: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle(15, center_x, center_y, radius)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_circle_sector = Struct('=ifiii').pack
+
+    def draw_circle_sector(self, center: Vector2, radius: float, start_angle: int, end_angle: int, segments: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle_sector(16, radius, start_angle, end_angle, segments)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_circle_sector_lines = Struct('=ifiii').pack
+
+    def draw_circle_sector_lines(self, center: Vector2, radius: float, start_angle: int, end_angle: int, segments: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle_sector_lines(17, radius, start_angle, end_angle, segments)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_circle_gradient = Struct('=iiif').pack
+
+    def draw_circle_gradient(self, center_x: int, center_y: int, radius: float, color1: Color, color2: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle_gradient(18, center_x, center_y, radius)
+        data += color1 if type(color1) is Color else Color(*color1)
+        data += color2 if type(color2) is Color else Color(*color2)
+
+    _pack_draw_circle_v = Struct('=if').pack
+
+    def draw_circle_v(self, center: Vector2, radius: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle_v(19, radius)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_circle_lines = Struct('=iiif').pack
+
+    def draw_circle_lines(self, center_x: int, center_y: int, radius: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle_lines(20, center_x, center_y, radius)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_ring = Struct('=iffiii').pack
+
+    def draw_ring(self, center: Vector2, inner_radius: float, outer_radius: float, start_angle: int, end_angle: int, segments: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_ring(21, inner_radius, outer_radius, start_angle, end_angle, segments)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_ring_lines = Struct('=iffiii').pack
+
+    def draw_ring_lines(self, center: Vector2, inner_radius: float, outer_radius: float, start_angle: int, end_angle: int, segments: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_ring_lines(22, inner_radius, outer_radius, start_angle, end_angle, segments)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle = Struct('=iiiii').pack
+
+    def draw_rectangle(self, pos_x: int, pos_y: int, width: int, height: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle(23, pos_x, pos_y, width, height)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_v = Struct('=i').pack
+
+    def draw_rectangle_v(self, position: Vector2, size: Vector2, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_v(24)
+        data += position if type(position) is Vector2 else Vector2(*position)
+        data += size if type(size) is Vector2 else Vector2(*size)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_rec = Struct('=i').pack
+
+    def draw_rectangle_rec(self, rec: Rectangle, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_rec(25)
+        data += rec if type(rec) is Rectangle else Rectangle(*rec)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_pro = Struct('=if').pack
+
+    def draw_rectangle_pro(self, rec: Rectangle, origin: Vector2, rotation: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_pro(26, rotation)
+        data += rec if type(rec) is Rectangle else Rectangle(*rec)
+        data += origin if type(origin) is Vector2 else Vector2(*origin)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_gradient_v = Struct('=iiiii').pack
+
+    def draw_rectangle_gradient_v(self, pos_x: int, pos_y: int, width: int, height: int, color1: Color, color2: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_gradient_v(27, pos_x, pos_y, width, height)
+        data += color1 if type(color1) is Color else Color(*color1)
+        data += color2 if type(color2) is Color else Color(*color2)
+
+    _pack_draw_rectangle_gradient_h = Struct('=iiiii').pack
+
+    def draw_rectangle_gradient_h(self, pos_x: int, pos_y: int, width: int, height: int, color1: Color, color2: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_gradient_h(28, pos_x, pos_y, width, height)
+        data += color1 if type(color1) is Color else Color(*color1)
+        data += color2 if type(color2) is Color else Color(*color2)
+
+    _pack_draw_rectangle_gradient_ex = Struct('=i').pack
+
+    def draw_rectangle_gradient_ex(self, rec: Rectangle, col1: Color, col2: Color, col3: Color, col4: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_gradient_ex(29)
+        data += rec if type(rec) is Rectangle else Rectangle(*rec)
+        data += col1 if type(col1) is Color else Color(*col1)
+        data += col2 if type(col2) is Color else Color(*col2)
+        data += col3 if type(col3) is Color else Color(*col3)
+        data += col4 if type(col4) is Color else Color(*col4)
+
+    _pack_draw_rectangle_lines = Struct('=iiiii').pack
+
+    def draw_rectangle_lines(self, pos_x: int, pos_y: int, width: int, height: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_lines(30, pos_x, pos_y, width, height)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_lines_ex = Struct('=ii').pack
+
+    def draw_rectangle_lines_ex(self, rec: Rectangle, line_thick: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_lines_ex(31, line_thick)
+        data += rec if type(rec) is Rectangle else Rectangle(*rec)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_rounded = Struct('=ifi').pack
+
+    def draw_rectangle_rounded(self, rec: Rectangle, roundness: float, segments: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_rounded(32, roundness, segments)
+        data += rec if type(rec) is Rectangle else Rectangle(*rec)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_rectangle_rounded_lines = Struct('=ifii').pack
+
+    def draw_rectangle_rounded_lines(self, rec: Rectangle, roundness: float, segments: int, line_thick: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_rectangle_rounded_lines(33, roundness, segments, line_thick)
+        data += rec if type(rec) is Rectangle else Rectangle(*rec)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_triangle = Struct('=i').pack
+
+    def draw_triangle(self, v1: Vector2, v2: Vector2, v3: Vector2, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_triangle(34)
+        data += v1 if type(v1) is Vector2 else Vector2(*v1)
+        data += v2 if type(v2) is Vector2 else Vector2(*v2)
+        data += v3 if type(v3) is Vector2 else Vector2(*v3)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_triangle_lines = Struct('=i').pack
+
+    def draw_triangle_lines(self, v1: Vector2, v2: Vector2, v3: Vector2, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_triangle_lines(35)
+        data += v1 if type(v1) is Vector2 else Vector2(*v1)
+        data += v2 if type(v2) is Vector2 else Vector2(*v2)
+        data += v3 if type(v3) is Vector2 else Vector2(*v3)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_poly = Struct('=iiff').pack
+
+    def draw_poly(self, center: Vector2, sides: int, radius: float, rotation: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_poly(36, sides, radius, rotation)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_poly_lines = Struct('=iiff').pack
+
+    def draw_poly_lines(self, center: Vector2, sides: int, radius: float, rotation: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_poly_lines(37, sides, radius, rotation)
+        data += center if type(center) is Vector2 else Vector2(*center)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_texture = Struct('=iii').pack
+
+    def draw_texture(self, texture: Texture2D, pos_x: int, pos_y: int, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture(38, pos_x, pos_y)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_texture_v = Struct('=i').pack
+
+    def draw_texture_v(self, texture: Texture2D, position: Vector2, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture_v(39)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += position if type(position) is Vector2 else Vector2(*position)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_texture_ex = Struct('=iff').pack
+
+    def draw_texture_ex(self, texture: Texture2D, position: Vector2, rotation: float, scale: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture_ex(40, rotation, scale)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += position if type(position) is Vector2 else Vector2(*position)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_texture_rec = Struct('=i').pack
+
+    def draw_texture_rec(self, texture: Texture2D, source_rec: Rectangle, position: Vector2, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture_rec(41)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += source_rec if type(source_rec) is Rectangle else Rectangle(*source_rec)
+        data += position if type(position) is Vector2 else Vector2(*position)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_texture_quad = Struct('=i').pack
+
+    def draw_texture_quad(self, texture: Texture2D, tiling: Vector2, offset: Vector2, quad: Rectangle, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture_quad(42)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += tiling if type(tiling) is Vector2 else Vector2(*tiling)
+        data += offset if type(offset) is Vector2 else Vector2(*offset)
+        data += quad if type(quad) is Rectangle else Rectangle(*quad)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_texture_pro = Struct('=if').pack
+
+    def draw_texture_pro(self, texture: Texture2D, source_rec: Rectangle, dest_rec: Rectangle, origin: Vector2, rotation: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture_pro(43, rotation)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += source_rec if type(source_rec) is Rectangle else Rectangle(*source_rec)
+        data += dest_rec if type(dest_rec) is Rectangle else Rectangle(*dest_rec)
+        data += origin if type(origin) is Vector2 else Vector2(*origin)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_texture_npatch = Struct('=if').pack
+
+    def draw_texture_npatch(self, texture: Texture2D, n_patch_info: NPatchInfo, dest_rec: Rectangle, origin: Vector2, rotation: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_texture_npatch(44, rotation)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += n_patch_info if type(n_patch_info) is NPatchInfo else NPatchInfo(*n_patch_info)
+        data += dest_rec if type(dest_rec) is Rectangle else Rectangle(*dest_rec)
+        data += origin if type(origin) is Vector2 else Vector2(*origin)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_fps = Struct('=iii').pack
+
+    def draw_fps(self, pos_x: int, pos_y: int) -> None:
+        data = self._data
+        data += self._pack_draw_fps(45, pos_x, pos_y)
+
+    _pack_draw_text_codepoint = Struct('=iif').pack
+
+    def draw_text_codepoint(self, font: Font, codepoint: int, position: Vector2, scale: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_text_codepoint(46, codepoint, scale)
+        data += font if type(font) is Font else Font(*font)
+        data += position if type(position) is Vector2 else Vector2(*position)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_line3_d = Struct('=i').pack
+
+    def draw_line3_d(self, start_pos: Vector3, end_pos: Vector3, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_line3_d(47)
+        data += start_pos if type(start_pos) is Vector3 else Vector3(*start_pos)
+        data += end_pos if type(end_pos) is Vector3 else Vector3(*end_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_circle3_d = Struct('=iff').pack
+
+    def draw_circle3_d(self, center: Vector3, radius: float, rotation_axis: Vector3, rotation_angle: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_circle3_d(48, radius, rotation_angle)
+        data += center if type(center) is Vector3 else Vector3(*center)
+        data += rotation_axis if type(rotation_axis) is Vector3 else Vector3(*rotation_axis)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cube = Struct('=ifff').pack
+
+    def draw_cube(self, position: Vector3, width: float, height: float, length: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cube(49, width, height, length)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cube_v = Struct('=i').pack
+
+    def draw_cube_v(self, position: Vector3, size: Vector3, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cube_v(50)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += size if type(size) is Vector3 else Vector3(*size)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cube_wires = Struct('=ifff').pack
+
+    def draw_cube_wires(self, position: Vector3, width: float, height: float, length: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cube_wires(51, width, height, length)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cube_wires_v = Struct('=i').pack
+
+    def draw_cube_wires_v(self, position: Vector3, size: Vector3, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cube_wires_v(52)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += size if type(size) is Vector3 else Vector3(*size)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cube_texture = Struct('=ifff').pack
+
+    def draw_cube_texture(self, texture: Texture2D, position: Vector3, width: float, height: float, length: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cube_texture(53, width, height, length)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_sphere = Struct('=if').pack
+
+    def draw_sphere(self, center_pos: Vector3, radius: float, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_sphere(54, radius)
+        data += center_pos if type(center_pos) is Vector3 else Vector3(*center_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_sphere_ex = Struct('=ifii').pack
+
+    def draw_sphere_ex(self, center_pos: Vector3, radius: float, rings: int, slices: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_sphere_ex(55, radius, rings, slices)
+        data += center_pos if type(center_pos) is Vector3 else Vector3(*center_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_sphere_wires = Struct('=ifii').pack
+
+    def draw_sphere_wires(self, center_pos: Vector3, radius: float, rings: int, slices: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_sphere_wires(56, radius, rings, slices)
+        data += center_pos if type(center_pos) is Vector3 else Vector3(*center_pos)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cylinder = Struct('=ifffi').pack
+
+    def draw_cylinder(self, position: Vector3, radius_top: float, radius_bottom: float, height: float, slices: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cylinder(57, radius_top, radius_bottom, height, slices)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_cylinder_wires = Struct('=ifffi').pack
+
+    def draw_cylinder_wires(self, position: Vector3, radius_top: float, radius_bottom: float, height: float, slices: int, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_cylinder_wires(58, radius_top, radius_bottom, height, slices)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_plane = Struct('=i').pack
+
+    def draw_plane(self, center_pos: Vector3, size: Vector2, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_plane(59)
+        data += center_pos if type(center_pos) is Vector3 else Vector3(*center_pos)
+        data += size if type(size) is Vector2 else Vector2(*size)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_ray = Struct('=i').pack
+
+    def draw_ray(self, ray: Ray, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_ray(60)
+        data += ray if type(ray) is Ray else Ray(*ray)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_grid = Struct('=iif').pack
+
+    def draw_grid(self, slices: int, spacing: float) -> None:
+        data = self._data
+        data += self._pack_draw_grid(61, slices, spacing)
+
+    _pack_draw_gizmo = Struct('=i').pack
+
+    def draw_gizmo(self, position: Vector3) -> None:
+        data = self._data
+        data += self._pack_draw_gizmo(62)
+        data += position if type(position) is Vector3 else Vector3(*position)
+
+    _pack_draw_model = Struct('=if').pack
+
+    def draw_model(self, model: Model, position: Vector3, scale: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_model(63, scale)
+        data += model if type(model) is Model else Model(*model)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_model_ex = Struct('=if').pack
+
+    def draw_model_ex(self, model: Model, position: Vector3, rotation_axis: Vector3, rotation_angle: float, scale: Vector3, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_model_ex(64, rotation_angle)
+        data += model if type(model) is Model else Model(*model)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += rotation_axis if type(rotation_axis) is Vector3 else Vector3(*rotation_axis)
+        data += scale if type(scale) is Vector3 else Vector3(*scale)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_model_wires = Struct('=if').pack
+
+    def draw_model_wires(self, model: Model, position: Vector3, scale: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_model_wires(65, scale)
+        data += model if type(model) is Model else Model(*model)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_model_wires_ex = Struct('=if').pack
+
+    def draw_model_wires_ex(self, model: Model, position: Vector3, rotation_axis: Vector3, rotation_angle: float, scale: Vector3, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_model_wires_ex(66, rotation_angle)
+        data += model if type(model) is Model else Model(*model)
+        data += position if type(position) is Vector3 else Vector3(*position)
+        data += rotation_axis if type(rotation_axis) is Vector3 else Vector3(*rotation_axis)
+        data += scale if type(scale) is Vector3 else Vector3(*scale)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_bounding_box = Struct('=i').pack
+
+    def draw_bounding_box(self, box: BoundingBox, color: Color) -> None:
+        data = self._data
+        data += self._pack_draw_bounding_box(67)
+        data += box if type(box) is BoundingBox else BoundingBox(*box)
+        data += color if type(color) is Color else Color(*color)
+
+    _pack_draw_billboard = Struct('=if').pack
+
+    def draw_billboard(self, camera: Camera, texture: Texture2D, center: Vector3, size: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_billboard(68, size)
+        data += camera if type(camera) is Camera else Camera(*camera)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += center if type(center) is Vector3 else Vector3(*center)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_draw_billboard_rec = Struct('=if').pack
+
+    def draw_billboard_rec(self, camera: Camera, texture: Texture2D, source_rec: Rectangle, center: Vector3, size: float, tint: Color) -> None:
+        data = self._data
+        data += self._pack_draw_billboard_rec(69, size)
+        data += camera if type(camera) is Camera else Camera(*camera)
+        data += texture if type(texture) is Texture2D else Texture2D(*texture)
+        data += source_rec if type(source_rec) is Rectangle else Rectangle(*source_rec)
+        data += center if type(center) is Vector3 else Vector3(*center)
+        data += tint if type(tint) is Color else Color(*tint)
+
+    _pack_begin_shader_mode = Struct('=i').pack
+
+    def begin_shader_mode(self, shader: Shader) -> None:
+        data = self._data
+        data += self._pack_begin_shader_mode(70)
+        data += shader if type(shader) is Shader else Shader(*shader)
+
+    _pack_end_shader_mode = Struct('=i').pack
+
+    def end_shader_mode(self) -> None:
+        data = self._data
+        data += self._pack_end_shader_mode(71)
+
+    _pack_begin_blend_mode = Struct('=ii').pack
+
+    def begin_blend_mode(self, mode: int) -> None:
+        data = self._data
+        data += self._pack_begin_blend_mode(72, mode)
+
+    _pack_end_blend_mode = Struct('=i').pack
+
+    def end_blend_mode(self) -> None:
+        data = self._data
+        data += self._pack_end_blend_mode(73)
+
+    _pack_begin_vr_drawing = Struct('=i').pack
+
+    def begin_vr_drawing(self) -> None:
+        data = self._data
+        data += self._pack_begin_vr_drawing(74)
+
+    _pack_end_vr_drawing = Struct('=i').pack
+
+    def end_vr_drawing(self) -> None:
+        data = self._data
+        data += self._pack_end_vr_drawing(75)
+
+
+_command_names = {
+    'ClearBackground': 'clear_background',
+    'BeginMode2D': 'begin_mode2_d',
+    'EndMode2D': 'end_mode2_d',
+    'BeginMode3D': 'begin_mode3_d',
+    'EndMode3D': 'end_mode3_d',
+    'BeginTextureMode': 'begin_texture_mode',
+    'EndTextureMode': 'end_texture_mode',
+    'BeginScissorMode': 'begin_scissor_mode',
+    'EndScissorMode': 'end_scissor_mode',
+    'DrawPixel': 'draw_pixel',
+    'DrawPixelV': 'draw_pixel_v',
+    'DrawLine': 'draw_line',
+    'DrawLineV': 'draw_line_v',
+    'DrawLineEx': 'draw_line_ex',
+    'DrawLineBezier': 'draw_line_bezier',
+    'DrawCircle': 'draw_circle',
+    'DrawCircleSector': 'draw_circle_sector',
+    'DrawCircleSectorLines': 'draw_circle_sector_lines',
+    'DrawCircleGradient': 'draw_circle_gradient',
+    'DrawCircleV': 'draw_circle_v',
+    'DrawCircleLines': 'draw_circle_lines',
+    'DrawRing': 'draw_ring',
+    'DrawRingLines': 'draw_ring_lines',
+    'DrawRectangle': 'draw_rectangle',
+    'DrawRectangleV': 'draw_rectangle_v',
+    'DrawRectangleRec': 'draw_rectangle_rec',
+    'DrawRectanglePro': 'draw_rectangle_pro',
+    'DrawRectangleGradientV': 'draw_rectangle_gradient_v',
+    'DrawRectangleGradientH': 'draw_rectangle_gradient_h',
+    'DrawRectangleGradientEx': 'draw_rectangle_gradient_ex',
+    'DrawRectangleLines': 'draw_rectangle_lines',
+    'DrawRectangleLinesEx': 'draw_rectangle_lines_ex',
+    'DrawRectangleRounded': 'draw_rectangle_rounded',
+    'DrawRectangleRoundedLines': 'draw_rectangle_rounded_lines',
+    'DrawTriangle': 'draw_triangle',
+    'DrawTriangleLines': 'draw_triangle_lines',
+    'DrawPoly': 'draw_poly',
+    'DrawPolyLines': 'draw_poly_lines',
+    'DrawTexture': 'draw_texture',
+    'DrawTextureV': 'draw_texture_v',
+    'DrawTextureEx': 'draw_texture_ex',
+    'DrawTextureRec': 'draw_texture_rec',
+    'DrawTextureQuad': 'draw_texture_quad',
+    'DrawTexturePro': 'draw_texture_pro',
+    'DrawTextureNPatch': 'draw_texture_npatch',
+    'DrawFPS': 'draw_fps',
+    'DrawTextCodepoint': 'draw_text_codepoint',
+    'DrawLine3D': 'draw_line3_d',
+    'DrawCircle3D': 'draw_circle3_d',
+    'DrawCube': 'draw_cube',
+    'DrawCubeV': 'draw_cube_v',
+    'DrawCubeWires': 'draw_cube_wires',
+    'DrawCubeWiresV': 'draw_cube_wires_v',
+    'DrawCubeTexture': 'draw_cube_texture',
+    'DrawSphere': 'draw_sphere',
+    'DrawSphereEx': 'draw_sphere_ex',
+    'DrawSphereWires': 'draw_sphere_wires',
+    'DrawCylinder': 'draw_cylinder',
+    'DrawCylinderWires': 'draw_cylinder_wires',
+    'DrawPlane': 'draw_plane',
+    'DrawRay': 'draw_ray',
+    'DrawGrid': 'draw_grid',
+    'DrawGizmo': 'draw_gizmo',
+    'DrawModel': 'draw_model',
+    'DrawModelEx': 'draw_model_ex',
+    'DrawModelWires': 'draw_model_wires',
+    'DrawModelWiresEx': 'draw_model_wires_ex',
+    'DrawBoundingBox': 'draw_bounding_box',
+    'DrawBillboard': 'draw_billboard',
+    'DrawBillboardRec': 'draw_billboard_rec',
+    'BeginShaderMode': 'begin_shader_mode',
+    'EndShaderMode': 'end_shader_mode',
+    'BeginBlendMode': 'begin_blend_mode',
+    'EndBlendMode': 'end_blend_mode',
+    'BeginVrDrawing': 'begin_vr_drawing',
+    'EndVrDrawing': 'end_vr_drawing',
+}
+
+# region INPUT SNAPSHOTS
+
+_input_funcs = None
+
+
+class InputSnapshot:
+    """The state of the registered keys and mouse buttons, the mouse and the
+    keys pressed (drained from `get_key_pressed`), captured with one call
+    per key and query by `capture` (a single foreign call with the native
+    loops shim compiled, for up to 64 keys and 64 buttons): the queries of
+    the frame then stay in Python. By default it captures after every
+    `end_drawing`, where raylib polls the input events, until `close`.
+
+    The queries mirror the functions; a key or button that is not
+    registered raises KeyError.
+    """
+    __slots__ = ('_keys', '_buttons', '_key_state', '_button_state', 'mouse_position', 'mouse_wheel_move',
+                 'keys_pressed', '_codes', '_bits', '_wheel', '_pressed', '__weakref__')
+
+    def __init__(self, keys=(), mouse_buttons=(), auto=True):
+        # one bit per registered key (button) in the down, pressed and released bitsets
+        self._keys = {key: 1 << i for i, key in enumerate(dict.fromkeys(keys))}
+        self._buttons = {button: 1 << i for i, button in enumerate(dict.fromkeys(mouse_buttons))}
+        self._key_state = (0, 0, 0)
+        self._button_state = (0, 0, 0)
+        self.mouse_position = Vector2()
+        self.mouse_wheel_move = 0
+        self.keys_pressed = []
+        # the arguments and results of the native capture
+        self._codes = (c_int * (len(self._keys) + len(self._buttons)))(*self._keys, *self._buttons)
+        self._bits = (ctypes.c_ulonglong * 6)()
+        self._wheel = c_int()
+        self._pressed = (c_int * 64)()
+        # typed now: the lazy functions can not be bound by the frame hook
+        for name, py_name in _input_functions.items():
+            _bound(name, py_name)
+        if auto:
+            _frame_hooks.append(self.capture)
+
+    def close(self):
+        """Stops capturing after each `end_drawing`."""
+        if self.capture in _frame_hooks:
+            _frame_hooks.remove(self.capture)
+
+    @staticmethod
+    def _capture(codes, is_down, is_pressed, is_released):
+        down = pressed = released = 0
+        for code, bit in codes.items():
+            if is_down(code):
+                down |= bit
+            if is_pressed(code):
+                pressed |= bit
+            if is_released(code):
+                released |= bit
+        return down, pressed, released
+
+    def capture(self):
+        """Captures the input state the queries answer from."""
+        global _input_funcs
+        funcs = tuple(map(getattr, repeat(_rl), _input_functions))
+        # the functions are checked again only when they change (e.g. a stand-in is set or removed)
+        if ((_input_funcs is None or funcs != _input_funcs[0]) and _native is not None
+                and hasattr(_native, 'CaptureInput') and all(isinstance(func, ctypes._CFuncPtr) for func in funcs)):
+            _input_funcs = funcs, (c_void_p * len(funcs))(*(ctypes.cast(func, c_void_p).value for func in funcs))
+        if (_input_funcs is not None and funcs == _input_funcs[0] and _native is not None
+                and len(self._keys) <= 64 and len(self._buttons) <= 64):
+            mouse_position = Vector2()
+            count = _native.CaptureInput(_input_funcs[1], self._codes, len(self._keys), len(self._buttons),
+                                         self._bits, byref(mouse_position), byref(self._wheel), self._pressed)
+            bits = self._bits[:]
+            self._key_state = tuple(bits[:3])
+            self._button_state = tuple(bits[3:])
+            self.mouse_position = mouse_position
+            self.mouse_wheel_move = self._wheel.value
+            self.keys_pressed = self._pressed[:count]
+            return
+        # a stand-in (e.g. while logging calls) or no shim: one call per key and query
+        self._key_state = self._capture(self._keys, _rl.IsKeyDown, _rl.IsKeyPressed, _rl.IsKeyReleased)
+        self._button_state = self._capture(self._buttons, _rl.IsMouseButtonDown, _rl.IsMouseButtonPressed,
+                                           _rl.IsMouseButtonReleased)
+        self.mouse_position = _rl.GetMousePosition()
+        self.mouse_wheel_move = _rl.GetMouseWheelMove()
+        keys_pressed = []
+        get_key_pressed = _rl.GetKeyPressed
+        # the queue holds at most a few keys per frame, bounded against a misbehaving library
+        for _ in range(64):
+            key = get_key_pressed()
+            if key <= 0:
+                break
+            keys_pressed.append(key)
+        self.keys_pressed = keys_pressed
+
+    def is_key_down(self, key) -> bool:
+        return self._key_state[0] & self._keys[key] != 0
+
+    def is_key_pressed(self, key) -> bool:
+        return self._key_state[1] & self._keys[key] != 0
+
+    def is_key_released(self, key) -> bool:
+        return self._key_state[2] & self._keys[key] != 0
+
+    def is_key_up(self, key) -> bool:
+        return self._key_state[0] & self._keys[key] == 0
+
+    def is_mouse_button_down(self, button) -> bool:
+        return self._button_state[0] & self._buttons[button] != 0
+
+    def is_mouse_button_pressed(self, button) -> bool:
+        return self._button_state[1] & self._buttons[button] != 0
+
+    def is_mouse_button_released(self, button) -> bool:
+        return self._button_state[2] & self._buttons[button] != 0
+
+    def is_mouse_button_up(self, button) -> bool:
+        return self._button_state[0] & self._buttons[button] == 0
+
+    def get_mouse_position(self):
+        return self.mouse_position
+
+    def get_mouse_wheel_move(self) -> int:
+        return self.mouse_wheel_move
+
+# endregion (input snapshots)
+
+_input_functions = {
+    'IsKeyDown': 'is_key_down',
+    'IsKeyPressed': 'is_key_pressed',
+    'IsKeyReleased': 'is_key_released',
+    'IsMouseButtonDown': 'is_mouse_button_down',
+    'IsMouseButtonPressed': 'is_mouse_button_pressed',
+    'IsMouseButtonReleased': 'is_mouse_button_released',
+    'GetMousePosition': 'get_mouse_position',
+    'GetMouseWheelMove': 'get_mouse_wheel_move',
+    'GetKeyPressed': 'get_key_pressed',
+}
+
+# region GAMEPAD SNAPSHOTS
+
+_gamepad_funcs = None
+
+
+class GamepadSnapshot:
+    """The state of every button and axis of `pads` gamepads, captured by
+    `capture` into NumPy arrays (numpy is imported by the constructor), by
+    default after every `end_drawing` until `close`. With the native loops
+    shim compiled, a capture is a single foreign call.
+
+    `available` (pads), `down`, `pressed`, `released` (pads x buttons) and
+    `axes` (pads x axes, float32) are indexed by the gamepad number and the
+    `GamepadButton` and `GamepadAxis` values. The edges compare two
+    consecutive captures, as raylib compares two consecutive input polls.
+    The methods answer like the functions from the arrays.
+    """
+
+    def __init__(self, pads=len(GamepadNumber), auto=True):
+        import numpy
+        self._numpy = numpy
+        buttons = max(GamepadButton) + 1
+        self.available = numpy.zeros(pads, numpy.bool_)
+        self.down = numpy.zeros((pads, buttons), numpy.bool_)
+        self.pressed = numpy.zeros((pads, buttons), numpy.bool_)
+        self.released = numpy.zeros((pads, buttons), numpy.bool_)
+        self.axes = numpy.zeros((pads, max(GamepadAxis) + 1), numpy.float32)
+        self._previous = numpy.zeros((pads, buttons), numpy.bool_)
+        for name, py_name in _gamepad_functions.items():
+            _bound(name, py_name)
+        if auto:
+            _frame_hooks.append(self.capture)
+
+    def close(self):
+        """Stops capturing after each `end_drawing`."""
+        if self.capture in _frame_hooks:
+            _frame_hooks.remove(self.capture)
+
+    def capture(self):
+        """Captures the state of the gamepads and the edges since the previous capture."""
+        global _gamepad_funcs
+        numpy = self._numpy
+        self._previous, self.down = self.down, self._previous
+        funcs = [getattr(_rl, name) for name in _gamepad_functions]
+        native = _native is not None and hasattr(_native, 'CaptureGamepads')
+        if native and all(isinstance(func, ctypes._CFuncPtr) for func in funcs):
+            if _gamepad_funcs is None:
+                _native.CaptureGamepads.argtypes = [POINTER(c_void_p), c_int, c_int, c_int, c_void_p, c_void_p, c_void_p]
+                _native.CaptureGamepads.restype = None
+                _gamepad_funcs = (c_void_p * len(funcs))(*(ctypes.cast(func, c_void_p).value for func in funcs))
+            _native.CaptureGamepads(_gamepad_funcs, *self.down.shape, self.axes.shape[1],
+                                    self.available.ctypes.data, self.down.ctypes.data, self.axes.ctypes.data)
+        else:
+            # a stand-in (e.g. while logging calls) or no shim: one call per button and axis
+            is_available, is_down, movement = funcs
+            for pad in range(len(self.available)):
+                available = self.available[pad] = is_available(pad)
+                self.down[pad] = [available and is_down(pad, button) for button in range(self.down.shape[1])]
+                self.axes[pad] = [movement(pad, axis) if available else 0.0 for axis in range(self.axes.shape[1])]
+        numpy.greater(self.down, self._previous, out=self.pressed)
+        numpy.less(self.down, self._previous, out=self.released)
+
+    def is_gamepad_available(self, gamepad) -> bool:
+        return bool(self.available[gamepad])
+
+    def is_gamepad_button_down(self, gamepad, button) -> bool:
+        return bool(self.down[gamepad, button])
+
+    def is_gamepad_button_pressed(self, gamepad, button) -> bool:
+        return bool(self.pressed[gamepad, button])
+
+    def is_gamepad_button_released(self, gamepad, button) -> bool:
+        return bool(self.released[gamepad, button])
+
+    def is_gamepad_button_up(self, gamepad, button) -> bool:
+        return not self.down[gamepad, button]
+
+    def get_gamepad_axis_movement(self, gamepad, axis) -> float:
+        return float(self.axes[gamepad, axis])
+
+# endregion (gamepad snapshots)
+
+_gamepad_functions = {
+    'IsGamepadAvailable': 'is_gamepad_available',
+    'IsGamepadButtonDown': 'is_gamepad_button_down',
+    'GetGamepadAxisMovement': 'get_gamepad_axis_movement',
+}
+
+_recorded_names = frozenset({
+    'ClearBackground',
+    'BeginMode2D',
+    'EndMode2D',
+    'BeginMode3D',
+    'EndMode3D',
+    'BeginTextureMode',
+    'EndTextureMode',
+    'BeginScissorMode',
+    'EndScissorMode',
+    'DrawPixel',
+    'DrawPixelV',
+    'DrawLine',
+    'DrawLineV',
+    'DrawLineEx',
+    'DrawLineBezier',
+    'DrawLineStrip',
+    'DrawCircle',
+    'DrawCircleSector',
+    'DrawCircleSectorLines',
+    'DrawCircleGradient',
+    'DrawCircleV',
+    'DrawCircleLines',
+    'DrawRing',
+    'DrawRingLines',
+    'DrawRectangle',
+    'DrawRectangleV',
+    'DrawRectangleRec',
+    'DrawRectanglePro',
+    'DrawRectangleGradientV',
+    'DrawRectangleGradientH',
+    'DrawRectangleGradientEx',
+    'DrawRectangleLines',
+    'DrawRectangleLinesEx',
+    'DrawRectangleRounded',
+    'DrawRectangleRoundedLines',
+    'DrawTriangle',
+    'DrawTriangleLines',
+    'DrawTriangleFan',
+    'DrawTriangleStrip',
+    'DrawPoly',
+    'DrawPolyLines',
+    'DrawTexture',
+    'DrawTextureV',
+    'DrawTextureEx',
+    'DrawTextureRec',
+    'DrawTextureQuad',
+    'DrawTexturePro',
+    'DrawTextureNPatch',
+    'DrawFPS',
+    'DrawText',
+    'DrawTextEx',
+    'DrawTextRec',
+    'DrawTextCodepoint',
+    'DrawLine3D',
+    'DrawCircle3D',
+    'DrawCube',
+    'DrawCubeV',
+    'DrawCubeWires',
+    'DrawCubeWiresV',
+    'DrawCubeTexture',
+    'DrawSphere',
+    'DrawSphereEx',
+    'DrawSphereWires',
+    'DrawCylinder',
+    'DrawCylinderWires',
+    'DrawPlane',
+    'DrawRay',
+    'DrawGrid',
+    'DrawGizmo',
+    'DrawModel',
+    'DrawModelEx',
+    'DrawModelWires',
+    'DrawModelWiresEx',
+    'DrawBoundingBox',
+    'DrawBillboard',
+    'DrawBillboardRec',
+    'BeginShaderMode',
+    'EndShaderMode',
+    'BeginBlendMode',
+    'EndBlendMode',
+    'BeginVrDrawing',
+    'EndVrDrawing',
+})
+
+_logged_names = {
+    'InitWindow': 'init_window',
+    'WindowShouldClose': 'window_should_close',
+    'CloseWindow': 'close_window',
+    'IsWindowReady': 'is_window_ready',
+    'IsWindowMinimized': 'is_window_minimized',
+    'IsWindowResized': 'is_window_resized',
+    'IsWindowHidden': 'is_window_hidden',
+    'ToggleFullscreen': 'toggle_fullscreen',
+    'UnhideWindow': 'unhide_window',
+    'HideWindow': 'hide_window',
+    'SetWindowIcon': 'set_window_icon',
+    'SetWindowTitle': 'set_window_title',
+    'SetWindowPosition': 'set_window_position',
+    'SetWindowMonitor': 'set_window_monitor',
+    'SetWindowMinSize': 'set_window_min_size',
+    'SetWindowSize': 'set_window_size',
+    'GetWindowHandle': 'get_window_handle',
+    'GetScreenWidth': 'get_screen_width',
+    'GetScreenHeight': 'get_screen_height',
+    'GetMonitorCount': 'get_monitor_count',
+    'GetMonitorWidth': 'get_monitor_width',
+    'GetMonitorHeight': 'get_monitor_height',
+    'GetMonitorPhysicalWidth': 'get_monitor_physical_width',
+    'GetMonitorPhysicalHeight': 'get_monitor_physical_height',
+    'GetWindowPosition': 'get_window_position',
+    'GetMonitorName': 'get_monitor_name',
+    'GetClipboardText': 'get_clipboard_text',
+    'SetClipboardText': 'set_clipboard_text',
+    'ShowCursor': 'show_cursor',
+    'HideCursor': 'hide_cursor',
+    'IsCursorHidden': 'is_cursor_hidden',
+    'EnableCursor': 'enable_cursor',
+    'DisableCursor': 'disable_cursor',
+    'ClearBackground': 'clear_background',
+    'BeginDrawing': 'begin_drawing',
+    'EndDrawing': 'end_drawing',
+    'BeginMode2D': 'begin_mode2_d',
+    'EndMode2D': 'end_mode2_d',
+    'BeginMode3D': 'begin_mode3_d',
+    'EndMode3D': 'end_mode3_d',
+    'BeginTextureMode': 'begin_texture_mode',
+    'EndTextureMode': 'end_texture_mode',
+    'BeginScissorMode': 'begin_scissor_mode',
+    'EndScissorMode': 'end_scissor_mode',
+    'GetMouseRay': 'get_mouse_ray',
+    'GetCameraMatrix': 'get_camera_matrix',
+    'GetCameraMatrix2D': 'get_camera_matrix2_d',
+    'GetWorldToScreen': 'get_world_to_screen',
+    'GetWorldToScreen2D': 'get_world_to_screen2_d',
+    'GetScreenToWorld2D': 'get_screen_to_world2_d',
+    'SetTargetFPS': 'set_target_fps',
+    'GetFPS': 'get_fps',
+    'GetFrameTime': 'get_frame_time',
+    'GetTime': 'get_time',
+    'ColorToInt': 'color_to_int',
+    'ColorNormalize': 'color_normalize',
+    'ColorFromNormalized': 'color_from_normalized',
+    'ColorToHSV': 'color_to_hsv',
+    'ColorFromHSV': 'color_from_hsv',
+    'GetColor': 'get_color',
+    'Fade': 'fade',
+    'SetConfigFlags': 'set_config_flags',
+    'SetTraceLogLevel': 'set_trace_log_level',
+    'SetTraceLogExit': 'set_trace_log_exit',
+    'SetTraceLogCallback': 'set_trace_log_callback',
+    'TraceLog': 'trace_log',
+    'TakeScreenshot': 'take_screenshot',
+    'GetRandomValue': 'get_random_value',
+    'FileExists': 'file_exists',
+    'IsFileExtension': 'is_file_extension',
+    'DirectoryExists': 'directory_exists',
+    'GetExtension': 'get_extension',
+    'GetFileName': 'get_file_name',
+    'GetFileNameWithoutExt': 'get_file_name_without_ext',
+    'GetDirectoryPath': 'get_directory_path',
+    'GetPrevDirectoryPath': 'get_prev_directory_path',
+    'GetWorkingDirectory': 'get_working_directory',
+    'GetDirectoryFiles': 'get_directory_files',
+    'ClearDirectoryFiles': 'clear_directory_files',
+    'ChangeDirectory': 'change_directory',
+    'IsFileDropped': 'is_file_dropped',
+    'GetDroppedFiles': 'get_dropped_files',
+    'ClearDroppedFiles': 'clear_dropped_files',
+    'GetFileModTime': 'get_file_mod_time',
+    'CompressData': 'compress_data',
+    'DecompressData': 'decompress_data',
+    'StorageSaveValue': 'storage_save_value',
+    'StorageLoadValue': 'storage_load_value',
+    'OpenURL': 'open_url',
+    'IsKeyPressed': 'is_key_pressed',
+    'IsKeyDown': 'is_key_down',
+    'IsKeyReleased': 'is_key_released',
+    'IsKeyUp': 'is_key_up',
+    'SetExitKey': 'set_exit_key',
+    'GetKeyPressed': 'get_key_pressed',
+    'IsGamepadAvailable': 'is_gamepad_available',
+    'IsGamepadName': 'is_gamepad_name',
+    'GetGamepadName': 'get_gamepad_name',
+    'IsGamepadButtonPressed': 'is_gamepad_button_pressed',
+    'IsGamepadButtonDown': 'is_gamepad_button_down',
+    'IsGamepadButtonReleased': 'is_gamepad_button_released',
+    'IsGamepadButtonUp': 'is_gamepad_button_up',
+    'GetGamepadButtonPressed': 'get_gamepad_button_pressed',
+    'GetGamepadAxisCount': 'get_gamepad_axis_count',
+    'GetGamepadAxisMovement': 'get_gamepad_axis_movement',
+    'IsMouseButtonPressed': 'is_mouse_button_pressed',
+    'IsMouseButtonDown': 'is_mouse_button_down',
+    'IsMouseButtonReleased': 'is_mouse_button_released',
+    'IsMouseButtonUp': 'is_mouse_button_up',
+    'GetMouseX': 'get_mouse_x',
+    'GetMouseY': 'get_mouse_y',
+    'GetMousePosition': 'get_mouse_position',
+    'SetMousePosition': 'set_mouse_position',
+    'SetMouseOffset': 'set_mouse_offset',
+    'SetMouseScale': 'set_mouse_scale',
+    'GetMouseWheelMove': 'get_mouse_wheel_move',
+    'GetTouchX': 'get_touch_x',
+    'GetTouchY': 'get_touch_y',
+    'GetTouchPosition': 'get_touch_position',
+    'SetGesturesEnabled': 'set_gestures_enabled',
+    'IsGestureDetected': 'is_gesture_detected',
+    'GetGestureDetected': 'get_gesture_detected',
+    'GetTouchPointsCount': 'get_touch_points_count',
+    'GetGestureHoldDuration': 'get_gesture_hold_duration',
+    'GetGestureDragVector': 'get_gesture_drag_vector',
+    'GetGestureDragAngle': 'get_gesture_drag_angle',
+    'GetGesturePinchVector': 'get_gesture_pinch_vector',
+    'GetGesturePinchAngle': 'get_gesture_pinch_angle',
+    'SetCameraMode': 'set_camera_mode',
+    'UpdateCamera': 'update_camera',
+    'SetCameraPanControl': 'set_camera_pan_control',
+    'SetCameraAltControl': 'set_camera_alt_control',
+    'SetCameraSmoothZoomControl': 'set_camera_smooth_zoom_control',
+    'SetCameraMoveControls': 'set_camera_move_controls',
+    'DrawPixel': 'draw_pixel',
+    'DrawPixelV': 'draw_pixel_v',
+    'DrawLine': 'draw_line',
+    'DrawLineV': 'draw_line_v',
+    'DrawLineEx': 'draw_line_ex',
+    'DrawLineBezier': 'draw_line_bezier',
+    'DrawLineStrip': 'draw_line_strip',
+    'DrawCircle': 'draw_circle',
+    'DrawCircleSector': 'draw_circle_sector',
+    'DrawCircleSectorLines': 'draw_circle_sector_lines',
+    'DrawCircleGradient': 'draw_circle_gradient',
+    'DrawCircleV': 'draw_circle_v',
+    'DrawCircleLines': 'draw_circle_lines',
+    'DrawRing': 'draw_ring',
+    'DrawRingLines': 'draw_ring_lines',
+    'DrawRectangle': 'draw_rectangle',
+    'DrawRectangleV': 'draw_rectangle_v',
+    'DrawRectangleRec': 'draw_rectangle_rec',
+    'DrawRectanglePro': 'draw_rectangle_pro',
+    'DrawRectangleGradientV': 'draw_rectangle_gradient_v',
+    'DrawRectangleGradientH': 'draw_rectangle_gradient_h',
+    'DrawRectangleGradientEx': 'draw_rectangle_gradient_ex',
+    'DrawRectangleLines': 'draw_rectangle_lines',
+    'DrawRectangleLinesEx': 'draw_rectangle_lines_ex',
+    'DrawRectangleRounded': 'draw_rectangle_rounded',
+    'DrawRectangleRoundedLines': 'draw_rectangle_rounded_lines',
+    'DrawTriangle': 'draw_triangle',
+    'DrawTriangleLines': 'draw_triangle_lines',
+    'DrawTriangleFan': 'draw_triangle_fan',
+    'DrawTriangleStrip': 'draw_triangle_strip',
+    'DrawPoly': 'draw_poly',
+    'DrawPolyLines': 'draw_poly_lines',
+    'SetShapesTexture': 'set_shapes_texture',
+    'CheckCollisionRecs': 'check_collision_recs',
+    'CheckCollisionCircles': 'check_collision_circles',
+    'CheckCollisionCircleRec': 'check_collision_circle_rec',
+    'GetCollisionRec': 'get_collision_rec',
+    'CheckCollisionPointRec': 'check_collision_point_rec',
+    'CheckCollisionPointCircle': 'check_collision_point_circle',
+    'CheckCollisionPointTriangle': 'check_collision_point_triangle',
+    'LoadImage': 'load_image',
+    'LoadImageEx': 'load_image_ex',
+    'LoadImagePro': 'load_image_pro',
+    'LoadImageRaw': 'load_image_raw',
+    'ExportImage': 'export_image',
+    'ExportImageAsCode': 'export_image_as_code',
+    'LoadTexture': 'load_texture',
+    'LoadTextureFromImage': 'load_texture_from_image',
+    'LoadTextureCubemap': 'load_texture_cubemap',
+    'LoadRenderTexture': 'load_render_texture',
+    'UnloadImage': 'unload_image',
+    'UnloadTexture': 'unload_texture',
+    'UnloadRenderTexture': 'unload_render_texture',
+    'GetImageData': 'get_image_data',
+    'GetImageDataNormalized': 'get_image_data_normalized',
+    'GetImageAlphaBorder': 'get_image_alpha_border',
+    'GetPixelDataSize': 'get_pixel_data_size',
+    'GetTextureData': 'get_texture_data',
+    'GetScreenData': 'get_screen_data',
+    'UpdateTexture': 'update_texture',
+    'ImageCopy': 'image_copy',
+    'ImageFromImage': 'image_from_image',
+    'ImageToPOT': 'image_to_pot',
+    'ImageFormat': 'image_format',
+    'ImageAlphaMask': 'image_alpha_mask',
+    'ImageAlphaClear': 'image_alpha_clear',
+    'ImageAlphaCrop': 'image_alpha_crop',
+    'ImageAlphaPremultiply': 'image_alpha_premultiply',
+    'ImageCrop': 'image_crop',
+    'ImageResize': 'image_resize',
+    'ImageResizeNN': 'image_resize_nn',
+    'ImageResizeCanvas': 'image_resize_canvas',
+    'ImageMipmaps': 'image_mipmaps',
+    'ImageDither': 'image_dither',
+    'ImageExtractPalette': 'image_extract_palette',
+    'ImageText': 'image_text',
+    'ImageTextEx': 'image_text_ex',
+    'ImageDraw': 'image_draw',
+    'ImageDrawRectangle': 'image_draw_rectangle',
+    'ImageDrawRectangleLines': 'image_draw_rectangle_lines',
+    'ImageDrawText': 'image_draw_text',
+    'ImageDrawTextEx': 'image_draw_text_ex',
+    'ImageFlipVertical': 'image_flip_vertical',
+    'ImageFlipHorizontal': 'image_flip_horizontal',
+    'ImageRotateCW': 'image_rotate_cw',
+    'ImageRotateCCW': 'image_rotate_ccw',
+    'ImageColorTint': 'image_color_tint',
+    'ImageColorInvert': 'image_color_invert',
+    'ImageColorGrayscale': 'image_color_grayscale',
+    'ImageColorContrast': 'image_color_contrast',
+    'ImageColorBrightness': 'image_color_brightness',
+    'ImageColorReplace': 'image_color_replace',
+    'GenImageColor': 'gen_image_color',
+    'GenImageGradientV': 'gen_image_gradient_v',
+    'GenImageGradientH': 'gen_image_gradient_h',
+    'GenImageGradientRadial': 'gen_image_gradient_radial',
+    'GenImageChecked': 'gen_image_checked',
+    'GenImageWhiteNoise': 'gen_image_white_noise',
+    'GenImagePerlinNoise': 'gen_image_perlin_noise',
+    'GenImageCellular': 'gen_image_cellular',
+    'GenTextureMipmaps': 'gen_texture_mipmaps',
+    'SetTextureFilter': 'set_texture_filter',
+    'SetTextureWrap': 'set_texture_wrap',
+    'DrawTexture': 'draw_texture',
+    'DrawTextureV': 'draw_texture_v',
+    'DrawTextureEx': 'draw_texture_ex',
+    'DrawTextureRec': 'draw_texture_rec',
+    'DrawTextureQuad': 'draw_texture_quad',
+    'DrawTexturePro': 'draw_texture_pro',
+    'DrawTextureNPatch': 'draw_texture_npatch',
+    'GetFontDefault': 'get_font_default',
+    'LoadFont': 'load_font',
+    'LoadFontEx': 'load_font_ex',
+    'LoadFontFromImage': 'load_font_from_image',
+    'LoadFontData': 'load_font_data',
+    'GenImageFontAtlas': 'gen_image_font_atlas',
+    'UnloadFont': 'unload_font',
+    'DrawFPS': 'draw_fps',
+    'DrawText': 'draw_text',
+    'DrawTextEx': 'draw_text_ex',
+    'DrawTextRec': 'draw_text_rec',
+    'DrawTextCodepoint': 'draw_text_codepoint',
+    'MeasureText': 'measure_text',
+    'MeasureTextEx': 'measure_text_ex',
+    'GetGlyphIndex': 'get_glyph_index',
+    'TextIsEqual': 'text_is_equal',
+    'TextLength': 'text_length',
+    'TextFormat': 'text_format',
+    'TextSubtext': 'text_subtext',
+    'TextReplace': 'text_replace',
+    'TextInsert': 'text_insert',
+    'TextJoin': 'text_join',
+    'TextSplit': 'text_split',
+    'TextAppend': 'text_append',
+    'TextFindIndex': 'text_find_index',
+    'TextToUpper': 'text_to_upper',
+    'TextToLower': 'text_to_lower',
+    'TextToPascal': 'text_to_pascal',
+    'TextToInteger': 'text_to_integer',
+    'TextToUtf8': 'text_to_utf8',
+    'GetCodepoints': 'get_codepoints',
+    'GetCodepointsCount': 'get_codepoints_count',
+    'GetNextCodepoint': 'get_next_codepoint',
+    'CodepointToUtf8': 'codepoint_to_utf8',
+    'DrawLine3D': 'draw_line3_d',
+    'DrawCircle3D': 'draw_circle3_d',
+    'DrawCube': 'draw_cube',
+    'DrawCubeV': 'draw_cube_v',
+    'DrawCubeWires': 'draw_cube_wires',
+    'DrawCubeWiresV': 'draw_cube_wires_v',
+    'DrawCubeTexture': 'draw_cube_texture',
+    'DrawSphere': 'draw_sphere',
+    'DrawSphereEx': 'draw_sphere_ex',
+    'DrawSphereWires': 'draw_sphere_wires',
+    'DrawCylinder': 'draw_cylinder',
+    'DrawCylinderWires': 'draw_cylinder_wires',
+    'DrawPlane': 'draw_plane',
+    'DrawRay': 'draw_ray',
+    'DrawGrid': 'draw_grid',
+    'DrawGizmo': 'draw_gizmo',
+    'LoadModel': 'load_model',
+    'LoadModelFromMesh': 'load_model_from_mesh',
+    'UnloadModel': 'unload_model',
+    'LoadMeshes': 'load_meshes',
+    'ExportMesh': 'export_mesh',
+    'UnloadMesh': 'unload_mesh',
+    'LoadMaterials': 'load_materials',
+    'LoadMaterialDefault': 'load_material_default',
+    'UnloadMaterial': 'unload_material',
+    'SetMaterialTexture': 'set_material_texture',
+    'SetModelMeshMaterial': 'set_model_mesh_material',
+    'LoadModelAnimations': 'load_model_animations',
+    'UpdateModelAnimation': 'update_model_animation',
+    'UnloadModelAnimation': 'unload_model_animation',
+    'IsModelAnimationValid': 'is_model_animation_valid',
+    'GenMeshPoly': 'gen_mesh_poly',
+    'GenMeshPlane': 'gen_mesh_plane',
+    'GenMeshCube': 'gen_mesh_cube',
+    'GenMeshSphere': 'gen_mesh_sphere',
+    'GenMeshHemiSphere': 'gen_mesh_hemi_sphere',
+    'GenMeshCylinder': 'gen_mesh_cylinder',
+    'GenMeshTorus': 'gen_mesh_torus',
+    'GenMeshKnot': 'gen_mesh_knot',
+    'GenMeshHeightmap': 'gen_mesh_heightmap',
+    'GenMeshCubicmap': 'gen_mesh_cubicmap',
+    'MeshBoundingBox': 'mesh_bounding_box',
+    'MeshTangents': 'mesh_tangents',
+    'MeshBinormals': 'mesh_binormals',
+    'DrawModel': 'draw_model',
+    'DrawModelEx': 'draw_model_ex',
+    'DrawModelWires': 'draw_model_wires',
+    'DrawModelWiresEx': 'draw_model_wires_ex',
+    'DrawBoundingBox': 'draw_bounding_box',
+    'DrawBillboard': 'draw_billboard',
+    'DrawBillboardRec': 'draw_billboard_rec',
+    'CheckCollisionSpheres': 'check_collision_spheres',
+    'CheckCollisionBoxes': 'check_collision_boxes',
+    'CheckCollisionBoxSphere': 'check_collision_box_sphere',
+    'CheckCollisionRaySphere': 'check_collision_ray_sphere',
+    'CheckCollisionRaySphereEx': 'check_collision_ray_sphere_ex',
+    'CheckCollisionRayBox': 'check_collision_ray_box',
+    'GetCollisionRayModel': 'get_collision_ray_model',
+    'GetCollisionRayTriangle': 'get_collision_ray_triangle',
+    'GetCollisionRayGround': 'get_collision_ray_ground',
+    'LoadText': 'load_text',
+    'LoadShader': 'load_shader',
+    'LoadShaderCode': 'load_shader_code',
+    'UnloadShader': 'unload_shader',
+    'GetShaderDefault': 'get_shader_default',
+    'GetTextureDefault': 'get_texture_default',
+    'GetShaderLocation': 'get_shader_location',
+    'SetShaderValue': 'set_shader_value',
+    'SetShaderValueV': 'set_shader_value_v',
+    'SetShaderValueMatrix': 'set_shader_value_matrix',
+    'SetShaderValueTexture': 'set_shader_value_texture',
+    'SetMatrixProjection': 'set_matrix_projection',
+    'SetMatrixModelview': 'set_matrix_modelview',
+    'GetMatrixModelview': 'get_matrix_modelview',
+    'GetMatrixProjection': 'get_matrix_projection',
+    'GenTextureCubemap': 'gen_texture_cubemap',
+    'GenTextureIrradiance': 'gen_texture_irradiance',
+    'GenTexturePrefilter': 'gen_texture_prefilter',
+    'GenTextureBRDF': 'gen_texture_brdf',
+    'BeginShaderMode': 'begin_shader_mode',
+    'EndShaderMode': 'end_shader_mode',
+    'BeginBlendMode': 'begin_blend_mode',
+    'EndBlendMode': 'end_blend_mode',
+    'InitVrSimulator': 'init_vr_simulator',
+    'CloseVrSimulator': 'close_vr_simulator',
+    'UpdateVrTracking': 'update_vr_tracking',
+    'SetVrConfiguration': 'set_vr_configuration',
+    'IsVrSimulatorReady': 'is_vr_simulator_ready',
+    'ToggleVrMode': 'toggle_vr_mode',
+    'BeginVrDrawing': 'begin_vr_drawing',
+    'EndVrDrawing': 'end_vr_drawing',
+    'InitAudioDevice': 'init_audio_device',
+    'CloseAudioDevice': 'close_audio_device',
+    'IsAudioDeviceReady': 'is_audio_device_ready',
+    'SetMasterVolume': 'set_master_volume',
+    'LoadWave': 'load_wave',
+    'LoadSound': 'load_sound',
+    'LoadSoundFromWave': 'load_sound_from_wave',
+    'UpdateSound': 'update_sound',
+    'UnloadWave': 'unload_wave',
+    'UnloadSound': 'unload_sound',
+    'ExportWave': 'export_wave',
+    'ExportWaveAsCode': 'export_wave_as_code',
+    'PlaySound': 'play_sound',
+    'StopSound': 'stop_sound',
+    'PauseSound': 'pause_sound',
+    'ResumeSound': 'resume_sound',
+    'PlaySoundMulti': 'play_sound_multi',
+    'StopSoundMulti': 'stop_sound_multi',
+    'GetSoundsPlaying': 'get_sounds_playing',
+    'IsSoundPlaying': 'is_sound_playing',
+    'SetSoundVolume': 'set_sound_volume',
+    'SetSoundPitch': 'set_sound_pitch',
+    'WaveFormat': 'wave_format',
+    'WaveCopy': 'wave_copy',
+    'WaveCrop': 'wave_crop',
+    'GetWaveData': 'get_wave_data',
+    'LoadMusicStream': 'load_music_stream',
+    'UnloadMusicStream': 'unload_music_stream',
+    'PlayMusicStream': 'play_music_stream',
+    'UpdateMusicStream': 'update_music_stream',
+    'StopMusicStream': 'stop_music_stream',
+    'PauseMusicStream': 'pause_music_stream',
+    'ResumeMusicStream': 'resume_music_stream',
+    'IsMusicPlaying': 'is_music_playing',
+    'SetMusicVolume': 'set_music_volume',
+    'SetMusicPitch': 'set_music_pitch',
+    'SetMusicLoopCount': 'set_music_loop_count',
+    'GetMusicTimeLength': 'get_music_time_length',
+    'GetMusicTimePlayed': 'get_music_time_played',
+    'InitAudioStream': 'init_audio_stream',
+    'UpdateAudioStream': 'update_audio_stream',
+    'CloseAudioStream': 'close_audio_stream',
+    'IsAudioStreamProcessed': 'is_audio_stream_processed',
+    'PlayAudioStream': 'play_audio_stream',
+    'PauseAudioStream': 'pause_audio_stream',
+    'ResumeAudioStream': 'resume_audio_stream',
+    'IsAudioStreamPlaying': 'is_audio_stream_playing',
+    'StopAudioStream': 'stop_audio_stream',
+    'SetAudioStreamVolume': 'set_audio_stream_volume',
+    'SetAudioStreamPitch': 'set_audio_stream_pitch',
+}
+
+_functions_module = __name__
+
+
 _rl.InitWindow.argtypes = [c_int, c_int, c_char_p]
 _rl.InitWindow.restype = None
-def init_window(width: int, height: int, title: bytes) -> None:
+def init_window(width: int, height: int, title: Union[str, bytes]) -> None:
+    if title.__class__ is str:
+        title = _encoded(title)
     _rl.InitWindow(width, height, title)
 
 
@@ -2012,7 +4640,9 @@ def set_window_icon(image: Image) -> None:
 
 _rl.SetWindowTitle.argtypes = [c_char_p]
 _rl.SetWindowTitle.restype = None
-def set_window_title(title: bytes) -> None:
+def set_window_title(title: Union[str, bytes]) -> None:
+    if title.__class__ is str:
+        title = _encoded(title)
     _rl.SetWindowTitle(title)
 
 
@@ -2108,7 +4738,9 @@ def get_clipboard_text() -> bytes:
 
 _rl.SetClipboardText.argtypes = [c_char_p]
 _rl.SetClipboardText.restype = None
-def set_clipboard_text(text: bytes) -> None:
+def set_clipboard_text(text: Union[str, bytes]) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.SetClipboardText(text)
 
 
@@ -2157,7 +4789,11 @@ def begin_drawing() -> None:
 _rl.EndDrawing.argtypes = []
 _rl.EndDrawing.restype = None
 def end_drawing() -> None:
+    for hook in _swap_hooks:
+        hook()
     _rl.EndDrawing()
+    for hook in _frame_hooks:
+        hook()
 
 
 _rl.BeginMode2D.argtypes = [Camera2D]
@@ -2274,12 +4910,26 @@ def color_to_int(color: Color) -> int:
     return _rl.ColorToInt(color)
 
 
+_color_to_int_cached = _memoized('color_to_int_cached', lambda color: _rl.ColorToInt(Color.from_buffer_copy(color)))
+
+
+def color_to_int_cached(color: Color) -> int:
+    return _color_to_int_cached(bytes(color))
+
+
 _rl.ColorNormalize.argtypes = [Color]
 _rl.ColorNormalize.restype = Vector4
 def color_normalize(color: Color) -> Vector4:
     return _rl.ColorNormalize(color)
 
 
+_color_normalize_cached = _memoized('color_normalize_cached', lambda color: bytes(_rl.ColorNormalize(Color.from_buffer_copy(color))))
+
+
+def color_normalize_cached(color: Color) -> Vector4:
+    return Vector4.from_buffer_copy(_color_normalize_cached(bytes(color)))
+
+
 _rl.ColorFromNormalized.argtypes = [Vector4]
 _rl.ColorFromNormalized.restype = Color
 def color_from_normalized(normalized: Vector4) -> Color:
@@ -2292,24 +4942,52 @@ def color_to_hsv(color: Color) -> Vector3:
     return _rl.ColorToHSV(color)
 
 
+_color_to_hsv_cached = _memoized('color_to_hsv_cached', lambda color: bytes(_rl.ColorToHSV(Color.from_buffer_copy(color))))
+
+
+def color_to_hsv_cached(color: Color) -> Vector3:
+    return Vector3.from_buffer_copy(_color_to_hsv_cached(bytes(color)))
+
+
 _rl.ColorFromHSV.argtypes = [Vector3]
 _rl.ColorFromHSV.restype = Color
 def color_from_hsv(hsv: Vector3) -> Color:
     return _rl.ColorFromHSV(hsv)
 
 
+_color_from_hsv_cached = _memoized('color_from_hsv_cached', lambda hsv: bytes(_rl.ColorFromHSV(Vector3.from_buffer_copy(hsv))))
+
+
+def color_from_hsv_cached(hsv: Vector3) -> Color:
+    return Color.from_buffer_copy(_color_from_hsv_cached(bytes(hsv)))
+
+
 _rl.GetColor.argtypes = [c_int]
 _rl.GetColor.restype = Color
 def get_color(hex_value: int) -> Color:
     return _rl.GetColor(hex_value)
 
 
+_get_color_cached = _memoized('get_color_cached', lambda hex_value: bytes(_rl.GetColor(hex_value)))
+
+
+def get_color_cached(hex_value: int) -> Color:
+    return Color.from_buffer_copy(_get_color_cached(hex_value))
+
+
 _rl.Fade.argtypes = [Color, c_float]
 _rl.Fade.restype = Color
 def fade(color: Color, alpha: float) -> Color:
     return _rl.Fade(color, alpha)
 
 
+_fade_cached = _memoized('fade_cached', lambda color, alpha: bytes(_rl.Fade(Color.from_buffer_copy(color), alpha)))
+
+
+def fade_cached(color: Color, alpha: float) -> Color:
+    return Color.from_buffer_copy(_fade_cached(bytes(color), alpha))
+
+
 _rl.SetConfigFlags.argtypes = [c_uint]
 _rl.SetConfigFlags.restype = None
 def set_config_flags(flags: int) -> None:
@@ -2336,13 +5014,17 @@ def set_trace_log_callback(callback: TraceLogCallback) -> None:
 
 _rl.TraceLog.argtypes = [c_int, c_char_p]
 _rl.TraceLog.restype = None
-def trace_log(log_type: int, text: bytes, *args) -> None:
+def trace_log(log_type: int, text: Union[str, bytes], *args) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.TraceLog(log_type, text)
 
 
 _rl.TakeScreenshot.argtypes = [c_char_p]
 _rl.TakeScreenshot.restype = None
-def take_screenshot(file_name: bytes) -> None:
+def take_screenshot(file_name: Union[str, bytes]) -> None:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     _rl.TakeScreenshot(file_name)
 
 
@@ -2354,49 +5036,67 @@ def get_random_value(min: int, max: int) -> int:
 
 _rl.FileExists.argtypes = [c_char_p]
 _rl.FileExists.restype = c_bool
-def file_exists(file_name: bytes) -> bool:
+def file_exists(file_name: Union[str, bytes]) -> bool:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.FileExists(file_name)
 
 
 _rl.IsFileExtension.argtypes = [c_char_p, c_char_p]
 _rl.IsFileExtension.restype = c_bool
-def is_file_extension(file_name: bytes, ext: bytes) -> bool:
+def is_file_extension(file_name: Union[str, bytes], ext: Union[str, bytes]) -> bool:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
+    if ext.__class__ is str:
+        ext = _encoded(ext)
     return _rl.IsFileExtension(file_name, ext)
 
 
 _rl.DirectoryExists.argtypes = [c_char_p]
 _rl.DirectoryExists.restype = c_bool
-def directory_exists(dir_path: bytes) -> bool:
+def directory_exists(dir_path: Union[str, bytes]) -> bool:
+    if dir_path.__class__ is str:
+        dir_path = _encoded(dir_path)
     return _rl.DirectoryExists(dir_path)
 
 
 _rl.GetExtension.argtypes = [c_char_p]
 _rl.GetExtension.restype = c_char_p
-def get_extension(file_name: bytes) -> bytes:
+def get_extension(file_name: Union[str, bytes]) -> bytes:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.GetExtension(file_name)
 
 
 _rl.GetFileName.argtypes = [c_char_p]
 _rl.GetFileName.restype = c_char_p
-def get_file_name(file_path: bytes) -> bytes:
+def get_file_name(file_path: Union[str, bytes]) -> bytes:
+    if file_path.__class__ is str:
+        file_path = _encoded(file_path)
     return _rl.GetFileName(file_path)
 
 
 _rl.GetFileNameWithoutExt.argtypes = [c_char_p]
 _rl.GetFileNameWithoutExt.restype = c_char_p
-def get_file_name_without_ext(file_path: bytes) -> bytes:
+def get_file_name_without_ext(file_path: Union[str, bytes]) -> bytes:
+    if file_path.__class__ is str:
+        file_path = _encoded(file_path)
     return _rl.GetFileNameWithoutExt(file_path)
 
 
 _rl.GetDirectoryPath.argtypes = [c_char_p]
 _rl.GetDirectoryPath.restype = c_char_p
-def get_directory_path(file_path: bytes) -> bytes:
+def get_directory_path(file_path: Union[str, bytes]) -> bytes:
+    if file_path.__class__ is str:
+        file_path = _encoded(file_path)
     return _rl.GetDirectoryPath(file_path)
 
 
 _rl.GetPrevDirectoryPath.argtypes = [c_char_p]
 _rl.GetPrevDirectoryPath.restype = c_char_p
-def get_prev_directory_path(dir_path: bytes) -> bytes:
+def get_prev_directory_path(dir_path: Union[str, bytes]) -> bytes:
+    if dir_path.__class__ is str:
+        dir_path = _encoded(dir_path)
     return _rl.GetPrevDirectoryPath(dir_path)
 
 
@@ -2408,7 +5108,9 @@ def get_working_directory() -> bytes:
 
 _rl.GetDirectoryFiles.argtypes = [c_char_p, POINTER(c_int)]
 _rl.GetDirectoryFiles.restype = POINTER(c_char_p)
-def get_directory_files(dir_path: bytes, count: POINTER(c_int)) -> POINTER(c_char_p):
+def get_directory_files(dir_path: Union[str, bytes], count: POINTER(c_int)) -> POINTER(c_char_p):
+    if dir_path.__class__ is str:
+        dir_path = _encoded(dir_path)
     return _rl.GetDirectoryFiles(dir_path, count)
 
 
@@ -2420,7 +5122,9 @@ def clear_directory_files() -> None:
 
 _rl.ChangeDirectory.argtypes = [c_char_p]
 _rl.ChangeDirectory.restype = c_bool
-def change_directory(dir: bytes) -> bool:
+def change_directory(dir: Union[str, bytes]) -> bool:
+    if dir.__class__ is str:
+        dir = _encoded(dir)
     return _rl.ChangeDirectory(dir)
 
 
@@ -2444,7 +5148,9 @@ def clear_dropped_files() -> None:
 
 _rl.GetFileModTime.argtypes = [c_char_p]
 _rl.GetFileModTime.restype = c_long
-def get_file_mod_time(file_name: bytes) -> int:
+def get_file_mod_time(file_name: Union[str, bytes]) -> int:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.GetFileModTime(file_name)
 
 
@@ -2474,7 +5180,9 @@ def storage_load_value(position: int) -> int:
 
 _rl.OpenURL.argtypes = [c_char_p]
 _rl.OpenURL.restype = None
-def open_url(url: bytes) -> None:
+def open_url(url: Union[str, bytes]) -> None:
+    if url.__class__ is str:
+        url = _encoded(url)
     _rl.OpenURL(url)
 
 
@@ -2522,7 +5230,9 @@ def is_gamepad_available(gamepad: int) -> bool:
 
 _rl.IsGamepadName.argtypes = [c_int, c_char_p]
 _rl.IsGamepadName.restype = c_bool
-def is_gamepad_name(gamepad: int, name: bytes) -> bool:
+def is_gamepad_name(gamepad: int, name: Union[str, bytes]) -> bool:
+    if name.__class__ is str:
+        name = _encoded(name)
     return _rl.IsGamepadName(gamepad, name)
 
 
@@ -2787,7 +5497,7 @@ def draw_line_bezier(start_pos: Vector2, end_pos: Vector2, thick: float, color:
 _rl.DrawLineStrip.argtypes = [POINTER(Vector2), c_int, Color]
 _rl.DrawLineStrip.restype = None
 def draw_line_strip(points: POINTER(Vector2), num_points: int, color: Color) -> None:
-    _rl.DrawLineStrip(points, num_points, color)
+    _rl.DrawLineStrip(_struct_array(points, Vector2, num_points), num_points, color)
 
 
 _rl.DrawCircle.argtypes = [c_int, c_int, c_float, Color]
@@ -2919,13 +5629,13 @@ def draw_triangle_lines(v1: Vector2, v2: Vector2, v3: Vector2, color: Color) ->
 _rl.DrawTriangleFan.argtypes = [POINTER(Vector2), c_int, Color]
 _rl.DrawTriangleFan.restype = None
 def draw_triangle_fan(points: POINTER(Vector2), num_points: int, color: Color) -> None:
-    _rl.DrawTriangleFan(points, num_points, color)
+    _rl.DrawTriangleFan(_struct_array(points, Vector2, num_points), num_points, color)
 
 
 _rl.DrawTriangleStrip.argtypes = [POINTER(Vector2), c_int, Color]
 _rl.DrawTriangleStrip.restype = None
 def draw_triangle_strip(points: POINTER(Vector2), points_count: int, color: Color) -> None:
-    _rl.DrawTriangleStrip(points, points_count, color)
+    _rl.DrawTriangleStrip(_struct_array(points, Vector2, points_count), points_count, color)
 
 
 _rl.DrawPoly.argtypes = [Vector2, c_int, c_float, c_float, Color]
@@ -2952,6 +5662,13 @@ def check_collision_recs(rec1: Rectangle, rec2: Rectangle) -> bool:
     return _rl.CheckCollisionRecs(rec1, rec2)
 
 
+_check_collision_recs_cached = _memoized('check_collision_recs_cached', lambda rec1, rec2: _rl.CheckCollisionRecs(Rectangle.from_buffer_copy(rec1), Rectangle.from_buffer_copy(rec2)))
+
+
+def check_collision_recs_cached(rec1: Rectangle, rec2: Rectangle) -> bool:
+    return _check_collision_recs_cached(bytes(rec1), bytes(rec2))
+
+
 _rl.CheckCollisionCircles.argtypes = [Vector2, c_float, Vector2, c_float]
 _rl.CheckCollisionCircles.restype = c_bool
 def check_collision_circles(center1: Vector2, radius1: float, center2: Vector2, radius2: float) -> bool:
@@ -2970,6 +5687,13 @@ def get_collision_rec(rec1: Rectangle, rec2: Rectangle) -> Rectangle:
     return _rl.GetCollisionRec(rec1, rec2)
 
 
+_get_collision_rec_cached = _memoized('get_collision_rec_cached', lambda rec1, rec2: bytes(_rl.GetCollisionRec(Rectangle.from_buffer_copy(rec1), Rectangle.from_buffer_copy(rec2))))
+
+
+def get_collision_rec_cached(rec1: Rectangle, rec2: Rectangle) -> Rectangle:
+    return Rectangle.from_buffer_copy(_get_collision_rec_cached(bytes(rec1), bytes(rec2)))
+
+
 _rl.CheckCollisionPointRec.argtypes = [Vector2, Rectangle]
 _rl.CheckCollisionPointRec.restype = c_bool
 def check_collision_point_rec(point: Vector2, rec: Rectangle) -> bool:
@@ -2990,7 +5714,9 @@ def check_collision_point_triangle(point: Vector2, p1: Vector2, p2: Vector2, p3:
 
 _rl.LoadImage.argtypes = [c_char_p]
 _rl.LoadImage.restype = Image
-def load_image(file_name: bytes) -> Image:
+def load_image(file_name: Union[str, bytes]) -> Image:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadImage(file_name)
 
 
@@ -3008,25 +5734,33 @@ def load_image_pro(data: int, width: int, height: int, format: int) -> Image:
 
 _rl.LoadImageRaw.argtypes = [c_char_p, c_int, c_int, c_int, c_int]
 _rl.LoadImageRaw.restype = Image
-def load_image_raw(file_name: bytes, width: int, height: int, format: int, header_size: int) -> Image:
+def load_image_raw(file_name: Union[str, bytes], width: int, height: int, format: int, header_size: int) -> Image:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadImageRaw(file_name, width, height, format, header_size)
 
 
 _rl.ExportImage.argtypes = [Image, c_char_p]
 _rl.ExportImage.restype = None
-def export_image(image: Image, file_name: bytes) -> None:
+def export_image(image: Image, file_name: Union[str, bytes]) -> None:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     _rl.ExportImage(image, file_name)
 
 
 _rl.ExportImageAsCode.argtypes = [Image, c_char_p]
 _rl.ExportImageAsCode.restype = None
-def export_image_as_code(image: Image, file_name: bytes) -> None:
+def export_image_as_code(image: Image, file_name: Union[str, bytes]) -> None:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     _rl.ExportImageAsCode(image, file_name)
 
 
 _rl.LoadTexture.argtypes = [c_char_p]
 _rl.LoadTexture.restype = Texture2D
-def load_texture(file_name: bytes) -> Texture2D:
+def load_texture(file_name: Union[str, bytes]) -> Texture2D:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadTexture(file_name)
 
 
@@ -3168,10 +5902,10 @@ def image_resize(image: POINTER(Image), new_width: int, new_height: int) -> None
     _rl.ImageResize(image, new_width, new_height)
 
 
-_rl.ImageResizeNN.argtypes = [POINTER(Image), c_int]
+_rl.ImageResizeNN.argtypes = [POINTER(Image), c_int, c_int]
 _rl.ImageResizeNN.restype = None
-def image_resize_nn(image: POINTER(Image), new_width: int) -> None:
-    _rl.ImageResizeNN(image, new_width)
+def image_resize_nn(image: POINTER(Image), new_width: int, new_height: int) -> None:
+    _rl.ImageResizeNN(image, new_width, new_height)
 
 
 _rl.ImageResizeCanvas.argtypes = [POINTER(Image), c_int, c_int, c_int, c_int, Color]
@@ -3200,13 +5934,17 @@ def image_extract_palette(image: Image, max_palette_size: int, extract_count: PO
 
 _rl.ImageText.argtypes = [c_char_p, c_int, Color]
 _rl.ImageText.restype = Image
-def image_text(text: bytes, font_size: int, color: Color) -> Image:
+def image_text(text: Union[str, bytes], font_size: int, color: Color) -> Image:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.ImageText(text, font_size, color)
 
 
 _rl.ImageTextEx.argtypes = [Font, c_char_p, c_float, c_float, Color]
 _rl.ImageTextEx.restype = Image
-def image_text_ex(font: Font, text: bytes, font_size: float, spacing: float, tint: Color) -> Image:
+def image_text_ex(font: Font, text: Union[str, bytes], font_size: float, spacing: float, tint: Color) -> Image:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.ImageTextEx(font, text, font_size, spacing, tint)
 
 
@@ -3230,13 +5968,17 @@ def image_draw_rectangle_lines(dst: POINTER(Image), rec: Rectangle, thick: int,
 
 _rl.ImageDrawText.argtypes = [POINTER(Image), Vector2, c_char_p, c_int, Color]
 _rl.ImageDrawText.restype = None
-def image_draw_text(dst: POINTER(Image), position: Vector2, text: bytes, font_size: int, color: Color) -> None:
+def image_draw_text(dst: POINTER(Image), position: Vector2, text: Union[str, bytes], font_size: int, color: Color) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.ImageDrawText(dst, position, text, font_size, color)
 
 
 _rl.ImageDrawTextEx.argtypes = [POINTER(Image), Vector2, Font, c_char_p, c_float, c_float, Color]
 _rl.ImageDrawTextEx.restype = None
-def image_draw_text_ex(dst: POINTER(Image), position: Vector2, font: Font, text: bytes, font_size: float, spacing: float, color: Color) -> None:
+def image_draw_text_ex(dst: POINTER(Image), position: Vector2, font: Font, text: Union[str, bytes], font_size: float, spacing: float, color: Color) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.ImageDrawTextEx(dst, position, font, text, font_size, spacing, color)
 
 
@@ -3416,13 +6158,17 @@ def get_font_default() -> Font:
 
 _rl.LoadFont.argtypes = [c_char_p]
 _rl.LoadFont.restype = Font
-def load_font(file_name: bytes) -> Font:
+def load_font(file_name: Union[str, bytes]) -> Font:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadFont(file_name)
 
 
 _rl.LoadFontEx.argtypes = [c_char_p, c_int, POINTER(c_int), c_int]
 _rl.LoadFontEx.restype = Font
-def load_font_ex(file_name: bytes, font_size: int, font_chars: POINTER(c_int), chars_count: int) -> Font:
+def load_font_ex(file_name: Union[str, bytes], font_size: int, font_chars: POINTER(c_int), chars_count: int) -> Font:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadFontEx(file_name, font_size, font_chars, chars_count)
 
 
@@ -3434,7 +6180,9 @@ def load_font_from_image(image: Image, key: Color, first_char: int) -> Font:
 
 _rl.LoadFontData.argtypes = [c_char_p, c_int, POINTER(c_int), c_int, c_int]
 _rl.LoadFontData.restype = POINTER(CharInfo)
-def load_font_data(file_name: bytes, font_size: int, font_chars: POINTER(c_int), chars_count: int, type: int) -> POINTER(CharInfo):
+def load_font_data(file_name: Union[str, bytes], font_size: int, font_chars: POINTER(c_int), chars_count: int, type: int) -> POINTER(CharInfo):
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadFontData(file_name, font_size, font_chars, chars_count, type)
 
 
@@ -3458,19 +6206,25 @@ def draw_fps(pos_x: int, pos_y: int) -> None:
 
 _rl.DrawText.argtypes = [c_char_p, c_int, c_int, c_int, Color]
 _rl.DrawText.restype = None
-def draw_text(text: bytes, pos_x: int, pos_y: int, font_size: int, color: Color) -> None:
+def draw_text(text: Union[str, bytes], pos_x: int, pos_y: int, font_size: int, color: Color) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.DrawText(text, pos_x, pos_y, font_size, color)
 
 
 _rl.DrawTextEx.argtypes = [Font, c_char_p, Vector2, c_float, c_float, Color]
 _rl.DrawTextEx.restype = None
-def draw_text_ex(font: Font, text: bytes, position: Vector2, font_size: float, spacing: float, tint: Color) -> None:
+def draw_text_ex(font: Font, text: Union[str, bytes], position: Vector2, font_size: float, spacing: float, tint: Color) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.DrawTextEx(font, text, position, font_size, spacing, tint)
 
 
 _rl.DrawTextRec.argtypes = [Font, c_char_p, Rectangle, c_float, c_float, c_bool, Color]
 _rl.DrawTextRec.restype = None
-def draw_text_rec(font: Font, text: bytes, rec: Rectangle, font_size: float, spacing: float, word_wrap: bool, tint: Color) -> None:
+def draw_text_rec(font: Font, text: Union[str, bytes], rec: Rectangle, font_size: float, spacing: float, word_wrap: bool, tint: Color) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
     _rl.DrawTextRec(font, text, rec, font_size, spacing, word_wrap, tint)
 
 
@@ -3482,13 +6236,20 @@ def draw_text_codepoint(font: Font, codepoint: int, position: Vector2, scale: fl
 
 _rl.MeasureText.argtypes = [c_char_p, c_int]
 _rl.MeasureText.restype = c_int
-def measure_text(text: bytes, font_size: int) -> int:
+def measure_text(text: Union[str, bytes], font_size: int) -> int:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.MeasureText(text, font_size)
 
 
+measure_text_cached = _memoized('measure_text_cached', lambda text, font_size: _rl.MeasureText(_encode(text), font_size))
+
+
 _rl.MeasureTextEx.argtypes = [Font, c_char_p, c_float, c_float]
 _rl.MeasureTextEx.restype = Vector2
-def measure_text_ex(font: Font, text: bytes, font_size: float, spacing: float) -> Vector2:
+def measure_text_ex(font: Font, text: Union[str, bytes], font_size: float, spacing: float) -> Vector2:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.MeasureTextEx(font, text, font_size, spacing)
 
 
@@ -3500,85 +6261,125 @@ def get_glyph_index(font: Font, codepoint: int) -> int:
 
 _rl.TextIsEqual.argtypes = [c_char_p, c_char_p]
 _rl.TextIsEqual.restype = c_bool
-def text_is_equal(text1: bytes, text2: bytes) -> bool:
+def text_is_equal(text1: Union[str, bytes], text2: Union[str, bytes]) -> bool:
+    if text1.__class__ is str:
+        text1 = _encoded(text1)
+    if text2.__class__ is str:
+        text2 = _encoded(text2)
     return _rl.TextIsEqual(text1, text2)
 
 
 _rl.TextLength.argtypes = [c_char_p]
 _rl.TextLength.restype = c_uint
-def text_length(text: bytes) -> int:
+def text_length(text: Union[str, bytes]) -> int:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextLength(text)
 
 
 _rl.TextFormat.argtypes = [c_char_p]
 _rl.TextFormat.restype = c_char_p
-def text_format(text: bytes, *args) -> bytes:
+def text_format(text: Union[str, bytes], *args) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextFormat(text)
 
 
 _rl.TextSubtext.argtypes = [c_char_p, c_int, c_int]
 _rl.TextSubtext.restype = c_char_p
-def text_subtext(text: bytes, position: int, length: int) -> bytes:
+def text_subtext(text: Union[str, bytes], position: int, length: int) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextSubtext(text, position, length)
 
 
 _rl.TextReplace.argtypes = [c_char_p, c_char_p, c_char_p]
 _rl.TextReplace.restype = c_char_p
-def text_replace(text: bytes, replace: bytes, by: bytes) -> bytes:
+def text_replace(text: Union[str, bytes], replace: Union[str, bytes], by: Union[str, bytes]) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
+    if replace.__class__ is str:
+        replace = _encoded(replace)
+    if by.__class__ is str:
+        by = _encoded(by)
     return _rl.TextReplace(text, replace, by)
 
 
 _rl.TextInsert.argtypes = [c_char_p, c_char_p, c_int]
 _rl.TextInsert.restype = c_char_p
-def text_insert(text: bytes, insert: bytes, position: int) -> bytes:
+def text_insert(text: Union[str, bytes], insert: Union[str, bytes], position: int) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
+    if insert.__class__ is str:
+        insert = _encoded(insert)
     return _rl.TextInsert(text, insert, position)
 
 
 _rl.TextJoin.argtypes = [POINTER(c_char_p), c_int, c_char_p]
 _rl.TextJoin.restype = c_char_p
-def text_join(text_list: POINTER(c_char_p), count: int, delimiter: bytes) -> bytes:
+def text_join(text_list: POINTER(c_char_p), count: int, delimiter: Union[str, bytes]) -> bytes:
+    if delimiter.__class__ is str:
+        delimiter = _encoded(delimiter)
     return _rl.TextJoin(text_list, count, delimiter)
 
 
 _rl.TextSplit.argtypes = [c_char_p, c_char, POINTER(c_int)]
 _rl.TextSplit.restype = POINTER(c_char_p)
-def text_split(text: bytes, delimiter: bytes, count: POINTER(c_int)) -> POINTER(c_char_p):
+def text_split(text: Union[str, bytes], delimiter: bytes, count: POINTER(c_int)) -> POINTER(c_char_p):
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextSplit(text, delimiter, count)
 
 
 _rl.TextAppend.argtypes = [c_char_p, c_char_p, POINTER(c_int)]
 _rl.TextAppend.restype = None
-def text_append(text: bytes, append: bytes, position: POINTER(c_int)) -> None:
+def text_append(text: Union[str, bytes], append: Union[str, bytes], position: POINTER(c_int)) -> None:
+    if text.__class__ is str:
+        text = _encoded(text)
+    if append.__class__ is str:
+        append = _encoded(append)
     _rl.TextAppend(text, append, position)
 
 
 _rl.TextFindIndex.argtypes = [c_char_p, c_char_p]
 _rl.TextFindIndex.restype = c_int
-def text_find_index(text: bytes, find: bytes) -> int:
+def text_find_index(text: Union[str, bytes], find: Union[str, bytes]) -> int:
+    if text.__class__ is str:
+        text = _encoded(text)
+    if find.__class__ is str:
+        find = _encoded(find)
     return _rl.TextFindIndex(text, find)
 
 
 _rl.TextToUpper.argtypes = [c_char_p]
 _rl.TextToUpper.restype = c_char_p
-def text_to_upper(text: bytes) -> bytes:
+def text_to_upper(text: Union[str, bytes]) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextToUpper(text)
 
 
 _rl.TextToLower.argtypes = [c_char_p]
 _rl.TextToLower.restype = c_char_p
-def text_to_lower(text: bytes) -> bytes:
+def text_to_lower(text: Union[str, bytes]) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextToLower(text)
 
 
 _rl.TextToPascal.argtypes = [c_char_p]
 _rl.TextToPascal.restype = c_char_p
-def text_to_pascal(text: bytes) -> bytes:
+def text_to_pascal(text: Union[str, bytes]) -> bytes:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextToPascal(text)
 
 
 _rl.TextToInteger.argtypes = [c_char_p]
 _rl.TextToInteger.restype = c_int
-def text_to_integer(text: bytes) -> int:
+def text_to_integer(text: Union[str, bytes]) -> int:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.TextToInteger(text)
 
 
@@ -3590,19 +6391,25 @@ def text_to_utf8(codepoints: POINTER(c_int), length: int) -> bytes:
 
 _rl.GetCodepoints.argtypes = [c_char_p, POINTER(c_int)]
 _rl.GetCodepoints.restype = POINTER(c_int)
-def get_codepoints(text: bytes, count: POINTER(c_int)) -> POINTER(c_int):
+def get_codepoints(text: Union[str, bytes], count: POINTER(c_int)) -> POINTER(c_int):
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.GetCodepoints(text, count)
 
 
 _rl.GetCodepointsCount.argtypes = [c_char_p]
 _rl.GetCodepointsCount.restype = c_int
-def get_codepoints_count(text: bytes) -> int:
+def get_codepoints_count(text: Union[str, bytes]) -> int:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.GetCodepointsCount(text)
 
 
 _rl.GetNextCodepoint.argtypes = [c_char_p, POINTER(c_int)]
 _rl.GetNextCodepoint.restype = c_int
-def get_next_codepoint(text: bytes, bytes_processed: POINTER(c_int)) -> int:
+def get_next_codepoint(text: Union[str, bytes], bytes_processed: POINTER(c_int)) -> int:
+    if text.__class__ is str:
+        text = _encoded(text)
     return _rl.GetNextCodepoint(text, bytes_processed)
 
 
@@ -3710,7 +6517,9 @@ def draw_gizmo(position: Vector3) -> None:
 
 _rl.LoadModel.argtypes = [c_char_p]
 _rl.LoadModel.restype = Model
-def load_model(file_name: bytes) -> Model:
+def load_model(file_name: Union[str, bytes]) -> Model:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadModel(file_name)
 
 
@@ -3728,13 +6537,17 @@ def unload_model(model: Model) -> None:
 
 _rl.LoadMeshes.argtypes = [c_char_p, POINTER(c_int)]
 _rl.LoadMeshes.restype = POINTER(Mesh)
-def load_meshes(file_name: bytes, mesh_count: POINTER(c_int)) -> POINTER(Mesh):
+def load_meshes(file_name: Union[str, bytes], mesh_count: POINTER(c_int)) -> POINTER(Mesh):
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadMeshes(file_name, mesh_count)
 
 
 _rl.ExportMesh.argtypes = [Mesh, c_char_p]
 _rl.ExportMesh.restype = None
-def export_mesh(mesh: Mesh, file_name: bytes) -> None:
+def export_mesh(mesh: Mesh, file_name: Union[str, bytes]) -> None:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     _rl.ExportMesh(mesh, file_name)
 
 
@@ -3746,7 +6559,9 @@ def unload_mesh(mesh: Mesh) -> None:
 
 _rl.LoadMaterials.argtypes = [c_char_p, POINTER(c_int)]
 _rl.LoadMaterials.restype = POINTER(Material)
-def load_materials(file_name: bytes, material_count: POINTER(c_int)) -> POINTER(Material):
+def load_materials(file_name: Union[str, bytes], material_count: POINTER(c_int)) -> POINTER(Material):
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadMaterials(file_name, material_count)
 
 
@@ -3776,7 +6591,9 @@ def set_model_mesh_material(model: POINTER(Model), mesh_id: int, material_id: in
 
 _rl.LoadModelAnimations.argtypes = [c_char_p, POINTER(c_int)]
 _rl.LoadModelAnimations.restype = POINTER(ModelAnimation)
-def load_model_animations(file_name: bytes, anims_count: POINTER(c_int)) -> POINTER(ModelAnimation):
+def load_model_animations(file_name: Union[str, bytes], anims_count: POINTER(c_int)) -> POINTER(ModelAnimation):
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadModelAnimations(file_name, anims_count)
 
 
@@ -3974,19 +6791,29 @@ def get_collision_ray_ground(ray: Ray, ground_height: float) -> RayHitInfo:
 
 _rl.LoadText.argtypes = [c_char_p]
 _rl.LoadText.restype = c_char_p
-def load_text(file_name: bytes) -> bytes:
+def load_text(file_name: Union[str, bytes]) -> bytes:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadText(file_name)
 
 
 _rl.LoadShader.argtypes = [c_char_p, c_char_p]
 _rl.LoadShader.restype = Shader
-def load_shader(vs_file_name: bytes, fs_file_name: bytes) -> Shader:
+def load_shader(vs_file_name: Union[str, bytes], fs_file_name: Union[str, bytes]) -> Shader:
+    if vs_file_name.__class__ is str:
+        vs_file_name = _encoded(vs_file_name)
+    if fs_file_name.__class__ is str:
+        fs_file_name = _encoded(fs_file_name)
     return _rl.LoadShader(vs_file_name, fs_file_name)
 
 
 _rl.LoadShaderCode.argtypes = [c_char_p, c_char_p]
 _rl.LoadShaderCode.restype = Shader
-def load_shader_code(vs_code: bytes, fs_code: bytes) -> Shader:
+def load_shader_code(vs_code: Union[str, bytes], fs_code: Union[str, bytes]) -> Shader:
+    if vs_code.__class__ is str:
+        vs_code = _encoded(vs_code)
+    if fs_code.__class__ is str:
+        fs_code = _encoded(fs_code)
     return _rl.LoadShaderCode(vs_code, fs_code)
 
 
@@ -4010,7 +6837,9 @@ def get_texture_default() -> Texture2D:
 
 _rl.GetShaderLocation.argtypes = [Shader, c_char_p]
 _rl.GetShaderLocation.restype = c_int
-def get_shader_location(shader: Shader, uniform_name: bytes) -> int:
+def get_shader_location(shader: Shader, uniform_name: Union[str, bytes]) -> int:
+    if uniform_name.__class__ is str:
+        uniform_name = _encoded(uniform_name)
     return _rl.GetShaderLocation(shader, uniform_name)
 
 
@@ -4184,13 +7013,17 @@ def set_master_volume(volume: float) -> None:
 
 _rl.LoadWave.argtypes = [c_char_p]
 _rl.LoadWave.restype = Wave
-def load_wave(file_name: bytes) -> Wave:
+def load_wave(file_name: Union[str, bytes]) -> Wave:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadWave(file_name)
 
 
 _rl.LoadSound.argtypes = [c_char_p]
 _rl.LoadSound.restype = Sound
-def load_sound(file_name: bytes) -> Sound:
+def load_sound(file_name: Union[str, bytes]) -> Sound:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadSound(file_name)
 
 
@@ -4220,13 +7053,17 @@ def unload_sound(sound: Sound) -> None:
 
 _rl.ExportWave.argtypes = [Wave, c_char_p]
 _rl.ExportWave.restype = None
-def export_wave(wave: Wave, file_name: bytes) -> None:
+def export_wave(wave: Wave, file_name: Union[str, bytes]) -> None:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     _rl.ExportWave(wave, file_name)
 
 
 _rl.ExportWaveAsCode.argtypes = [Wave, c_char_p]
 _rl.ExportWaveAsCode.restype = None
-def export_wave_as_code(wave: Wave, file_name: bytes) -> None:
+def export_wave_as_code(wave: Wave, file_name: Union[str, bytes]) -> None:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     _rl.ExportWaveAsCode(wave, file_name)
 
 
@@ -4316,7 +7153,9 @@ def get_wave_data(wave: Wave) -> POINTER(c_float):
 
 _rl.LoadMusicStream.argtypes = [c_char_p]
 _rl.LoadMusicStream.restype = Music
-def load_music_stream(file_name: bytes) -> Music:
+def load_music_stream(file_name: Union[str, bytes]) -> Music:
+    if file_name.__class__ is str:
+        file_name = _encoded(file_name)
     return _rl.LoadMusicStream(file_name)
 
 
@@ -4457,3 +7296,31 @@ _rl.SetAudioStreamPitch.restype = None
 def set_audio_stream_pitch(stream: AudioStream, pitch: float) -> None:
     _rl.SetAudioStreamPitch(stream, pitch)
 
+
+_rl.DrawRectangleRec.argtypes = [Rectangle, Color]
+_rl.DrawRectangleRec.restype = None
+def draw_rectangles(recs, colors) -> None:
+    """Calls `draw_rectangle_rec` once per item: each argument is one value or an array of values."""
+    _draw_batch(_rl.DrawRectangleRec, [Rectangle, Color], [recs, colors], 'DrawRectangles')
+
+
+_rl.DrawCircleV.argtypes = [Vector2, c_float, Color]
+_rl.DrawCircleV.restype = None
+def draw_circles(centers, radii, colors) -> None:
+    """Calls `draw_circle_v` once per item: each argument is one value or an array of values."""
+    _draw_batch(_rl.DrawCircleV, [Vector2, c_float, Color], [centers, radii, colors], 'DrawCircles')
+
+
+_rl.DrawLineV.argtypes = [Vector2, Vector2, Color]
+_rl.DrawLineV.restype = None
+def draw_lines(starts, ends, colors) -> None:
+    """Calls `draw_line_v` once per item: each argument is one value or an array of values."""
+    _draw_batch(_rl.DrawLineV, [Vector2, Vector2, Color], [starts, ends, colors], 'DrawLines')
+
+
+_rl.DrawTexturePro.argtypes = [Texture2D, Rectangle, Rectangle, Vector2, c_float, Color]
+_rl.DrawTexturePro.restype = None
+def draw_textures_pro(texture, src, dst, origins, rotations, tints) -> None:
+    """Calls `draw_texture_pro` once per item: each argument is one value or an array of values."""
+    _draw_batch(_rl.DrawTexturePro, [Texture2D, Rectangle, Rectangle, Vector2, c_float, Color], [texture, src, dst, origins, rotations, tints], 'DrawTexturesPro')
+
@@ -0,0 +1,58 @@
+"""Fixtures shared by the tests: the stand-in raylib binary the generated
+bindings load (see `rlctbg.build_stub`) and fresh packages to generate them in."""
+import importlib
+import os
+import re
+import sys
+
+import pytest
+
+import rlctbg
+
+HEADER = os.path.join(os.path.dirname(os.path.abspath(rlctbg.__file__)), "raylib.h")
+EXTENSION = {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+
+
+@pytest.fixture(scope='session')
+def stub_library(tmp_path_factory):
+    """Builds the stand-in library once and points `RLCTBG_LIBRARY` at it."""
+    folder = tmp_path_factory.mktemp("stub")
+    try:
+        library = rlctbg.build_stub(path_to_library=str(folder / f"libraylib_stub{EXTENSION}"))
+    except Exception as error:
+        pytest.skip(f"unable to build the stand-in library ({error})")
+    previous = os.environ.get('RLCTBG_LIBRARY')
+    os.environ['RLCTBG_LIBRARY'] = library
+    yield library
+    if previous is None:
+        os.environ.pop('RLCTBG_LIBRARY', None)
+    else:
+        os.environ['RLCTBG_LIBRARY'] = previous
+
+
+@pytest.fixture
+def package(tmp_path, request):
+    """An empty importable package, unique to the test: yields its folder and name."""
+    name = "pkg_" + re.sub(r"\W", "_", request.node.name)
+    folder = tmp_path / name
+    folder.mkdir()
+    (folder / "__init__.py").write_text("")
+    sys.path.insert(0, str(tmp_path))
+    yield folder, name
+    sys.path.remove(str(tmp_path))
+    for module in [module for module in sys.modules if module == name or module.startswith(name + ".")]:
+        del sys.modules[module]
+
+
+@pytest.fixture
+def binding(stub_library, package):
+    """Generates a binding module from raylib.h with the given `wrap_header`
+    options in the package and imports it."""
+    folder, name = package
+
+    def generate(module='raylib', **options):
+        output = folder / module if options.get('split') else folder / f"{module}.py"
+        rlctbg.wrap_header(path_to_output=str(output), force=True, **options)
+        return importlib.import_module(f"{name}.{module}")
+
+    return generate
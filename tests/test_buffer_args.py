@@ -0,0 +1,86 @@
+"""The structure array parameters take buffers, checked against the structure."""
+import array
+import ctypes
+import sys
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def rl(binding):
+    return binding()
+
+
+def test_buffers_are_passed_without_copying(rl):
+    points = numpy.arange(10, dtype=numpy.float32).reshape(5, 2)
+    passed = rl._struct_array(points, rl.Vector2)
+    assert len(passed) == 5
+    assert ctypes.addressof(passed) == points.ctypes.data
+    assert (passed[4].x, passed[4].y) == (8.0, 9.0)
+
+
+@pytest.mark.parametrize('data, struct_type, count', [
+    (numpy.zeros(6, numpy.float32), 'Vector2', 3),
+    (array.array('f', [0.0] * 6), 'Vector2', 3),
+    (numpy.zeros((3, 4, 4), numpy.float32), 'Matrix', 3),
+    (numpy.zeros((3, 16), numpy.float32), 'Matrix', 3),
+    (numpy.zeros((2, 6), numpy.float32), 'Camera2D', 2),
+    (bytearray(8), 'Color', 2),
+    (numpy.zeros((2, 2), numpy.float32), 'c_float', 4),
+])
+def test_buffers_of_the_field_type(rl, data, struct_type, count):
+    struct_type = getattr(rl, struct_type, None) or getattr(ctypes, struct_type)
+    assert len(rl._struct_array(data, struct_type)) == count
+
+
+@pytest.mark.parametrize('shape', [(5, 3), (9,), (2, 2, 3)])
+def test_shapes_must_hold_whole_structures(rl, shape):
+    with pytest.raises(ValueError):
+        rl._struct_array(numpy.zeros(shape, numpy.float32), rl.Vector2)
+    with pytest.raises(ValueError):
+        rl._struct_array(numpy.zeros(shape, numpy.float32), rl.Vector2, 2)
+
+
+def test_structured_buffers_are_compared_field_by_field(rl):
+    for struct_type in (rl.Vector2, rl.Camera2D, rl.Mesh, rl.BoneInfo):
+        data = numpy.zeros(3, rl.struct_dtype(struct_type))
+        assert len(rl._struct_array(data, struct_type)) == 3
+    assert len(rl._struct_array(memoryview((rl.Mesh * 2)()), rl.Mesh)) == 2
+    same_size = numpy.zeros(3, [('a', numpy.int32), ('b', numpy.int32)])
+    with pytest.raises(TypeError):
+        rl._struct_array(same_size, rl.Vector2)
+    with pytest.raises(TypeError):
+        rl._struct_array(numpy.zeros(3, rl.struct_dtype(rl.Vector2)), rl.Vector3)
+
+
+def test_byte_orders(rl):
+    native, swapped = ('<', '>') if sys.byteorder == 'little' else ('>', '<')
+    assert len(rl._struct_array(numpy.zeros((2, 2), native + 'f4'), rl.Vector2)) == 2
+    with pytest.raises(TypeError):
+        rl._struct_array(numpy.zeros((2, 2), swapped + 'f4'), rl.Vector2)
+    with pytest.raises(TypeError):
+        rl._struct_array(numpy.zeros(2, rl.struct_dtype(rl.Vector2).newbyteorder()), rl.Vector2)
+
+
+def test_other_types_are_rejected(rl):
+    with pytest.raises(TypeError):
+        rl._struct_array(numpy.zeros((2, 2), numpy.float64), rl.Vector2)
+    with pytest.raises(TypeError):
+        rl._struct_array(numpy.zeros(4, numpy.int32), ctypes.c_float)
+
+
+def test_short_and_strided_buffers(rl):
+    with pytest.raises(ValueError):
+        rl._struct_array(numpy.zeros((2, 2), numpy.float32), rl.Vector2, 3)
+    with pytest.raises(ValueError):
+        rl._struct_array(numpy.zeros((4, 2), numpy.float32)[::2], rl.Vector2)
+
+
+def test_read_only_buffers_are_copied(rl):
+    data = bytes(range(8))
+    passed = rl._struct_array(data, rl.Color)
+    assert (passed[1].r, passed[1].a) == (4, 7)
+    passed[1].r = 0
+    assert data[4] == 4
@@ -0,0 +1,102 @@
+"""`log_calls` writes the library calls to a binary log, read back by `CallLog`."""
+import pytest
+
+from test_strings import foreign
+
+
+@pytest.fixture
+def rl(binding):
+    return binding()
+
+
+@pytest.fixture
+def logged(rl, tmp_path):
+    """Logs one frame: returns the path of the log."""
+    path = str(tmp_path / "frame.log")
+    with rl.log_calls(path):
+        rl.begin_drawing()
+        rl.draw_rectangle_rec(rl.Rectangle(1, 2, 3, 4), rl.RED)
+        rl.draw_text('hi', 5, 6, 10, rl.RED)
+        rl.fade(rl.RED, 0.5)
+        rl.is_key_down(rl.KEY_A)
+        rl.end_drawing()
+    return path
+
+
+def test_round_trip(rl, logged):
+    log = rl.CallLog(logged)
+    assert len(log) == 6
+    assert [name for name, _, _ in log.calls] == [
+        'BeginDrawing', 'DrawRectangleRec', 'DrawText', 'Fade', 'IsKeyDown', 'EndDrawing']
+    red = bytes(rl.RED)
+    assert log.calls[0] == ('BeginDrawing', (), None)
+    assert log.calls[1] == ('DrawRectangleRec', (bytes(rl.Rectangle(1, 2, 3, 4)), red), None)
+    assert log.calls[2] == ('DrawText', (b'hi', 5, 6, 10, red), None)
+    # the stand-in library echoes the color
+    assert log.calls[3] == ('Fade', (red, 0.5), red)
+    assert log.calls[4] == ('IsKeyDown', (rl.KEY_A,), False)
+
+
+def test_functions_are_restored(rl, logged):
+    assert type(foreign(rl).DrawRectangleRec).__name__ != '_LoggedFunction'
+    rl.draw_rectangle_rec(rl.Rectangle(1, 2, 3, 4), rl.RED)
+    assert len(rl.CallLog(logged)) == 6
+
+
+def test_replay(rl, logged):
+    log = rl.CallLog(logged)
+    assert len(log.replay()) == 1
+    # the logged bytes are passed as the parameter types again
+    func, (rect, color) = log._prepare()[1]
+    assert func is foreign(rl).DrawRectangleRec
+    assert (rect.x, rect.y, rect.width, rect.height) == (1, 2, 3, 4)
+    assert (color.r, color.g, color.b, color.a) == (230, 41, 55, 255)
+    assert len(log.replay()) == 1
+
+
+def test_frames_are_split_at_end_drawing(rl, tmp_path):
+    path = str(tmp_path / "frames.log")
+    with rl.log_calls(path):
+        for _ in range(3):
+            rl.begin_drawing()
+            rl.end_drawing()
+        rl.is_key_down(rl.KEY_A)
+    assert len(rl.CallLog(path).replay()) == 4
+
+
+def test_truncated_logs_keep_the_complete_calls(rl, logged):
+    with open(logged, 'rb') as src:
+        data = src.read()
+    with open(logged, 'wb') as dst:
+        dst.write(data[:-1])
+    log = rl.CallLog(logged)
+    assert [name for name, _, _ in log.calls] == [
+        'BeginDrawing', 'DrawRectangleRec', 'DrawText', 'Fade', 'IsKeyDown']
+
+
+def test_corrupted_logs(rl, logged):
+    with open(logged, 'ab') as dst:
+        dst.write(b'\xff\x7f\x00\x00')
+    with pytest.raises(ValueError, match="corrupted"):
+        rl.CallLog(logged)
+
+
+def test_other_files(rl, tmp_path):
+    path = tmp_path / "other.log"
+    path.write_bytes(b'not a call log')
+    with pytest.raises(ValueError, match="not a call log"):
+        rl.CallLog(str(path))
+
+
+def test_logs_do_not_nest(rl, tmp_path):
+    with rl.log_calls(str(tmp_path / "outer.log")):
+        with pytest.raises(RuntimeError):
+            with rl.log_calls(str(tmp_path / "inner.log")):
+                pass
+
+
+def test_direct_bindings_can_not_log(binding, tmp_path):
+    rl = binding(direct=True)
+    with pytest.raises(RuntimeError):
+        with rl.log_calls(str(tmp_path / "frame.log")):
+            pass
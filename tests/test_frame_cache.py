@@ -0,0 +1,23 @@
+"""The frame cache is opt-in: only `frame_cache=True` bindings cache the frame-stable queries."""
+from test_strings import Recorder
+
+
+def test_off_by_default(binding):
+    rl = binding()
+    assert not hasattr(rl, 'clear_frame_cache')
+    rl._rl.GetScreenWidth = get_screen_width = Recorder(800)
+    assert rl.get_screen_width() == rl.get_screen_width() == 800
+    assert len(get_screen_width.calls) == 2
+
+
+def test_cached_until_the_end_of_the_frame(binding):
+    rl = binding(frame_cache=True)
+    rl._rl.GetScreenWidth = get_screen_width = Recorder(800)
+    assert rl.get_screen_width() == rl.get_screen_width() == 800
+    assert len(get_screen_width.calls) == 1
+    rl.end_drawing()
+    rl.get_screen_width()
+    assert len(get_screen_width.calls) == 2
+    rl.clear_frame_cache()
+    rl.get_screen_width()
+    assert len(get_screen_width.calls) == 3
@@ -0,0 +1,93 @@
+"""`wrap_header` regenerates the binding only when its manifest is stale."""
+import json
+import os
+import shutil
+
+import pytest
+
+import rlctbg
+from conftest import HEADER
+
+# the manifest options of a `wrap_header` call with the default options
+DEFAULTS = {'lazy': False, 'direct': False, 'split': False, 'used_names': None}
+
+
+@pytest.fixture
+def generated(tmp_path):
+    """A binding generated from a copy of raylib.h: returns the header and output paths."""
+    header = str(tmp_path / "raylib.h")
+    shutil.copyfile(HEADER, header)
+    output = str(tmp_path / "raylib.py")
+    rlctbg.wrap_header(header, output)
+    return header, output
+
+
+def touch(location):
+    """Moves the mtime of a file forward without changing its contents."""
+    st = os.stat(location)
+    os.utime(location, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def test_up_to_date(generated):
+    header, output = generated
+    assert rlctbg.is_up_to_date(header, output, DEFAULTS)
+
+
+def test_a_hit_does_not_regenerate(generated, monkeypatch):
+    header, output = generated
+
+    def generate(*args, **kwargs):
+        raise AssertionError("regenerated an up to date output")
+
+    monkeypatch.setattr(rlctbg, 'generate', generate)
+    rlctbg.wrap_header(header, output)
+
+
+@pytest.mark.parametrize('options', [{'lazy': True}, {'direct': True}, {'memo_size': 8}])
+def test_other_options_are_stale(generated, options):
+    header, output = generated
+    assert not rlctbg.is_up_to_date(header, output, dict(DEFAULTS, **options))
+    rlctbg.wrap_header(header, output, **options)
+    assert rlctbg.is_up_to_date(header, output, dict(DEFAULTS, **options))
+    assert not rlctbg.is_up_to_date(header, output, DEFAULTS)
+
+
+def test_edited_header_is_stale(generated):
+    header, output = generated
+    with open(header, 'a') as src:
+        src.write("\n// edited\n")
+    assert not rlctbg.is_up_to_date(header, output, DEFAULTS)
+
+
+def test_edited_output_is_stale(generated):
+    header, output = generated
+    with open(output, 'a') as src:
+        src.write("\n# edited\n")
+    assert not rlctbg.is_up_to_date(header, output, DEFAULTS)
+    rlctbg.wrap_header(header, output)
+    assert rlctbg.is_up_to_date(header, output, DEFAULTS)
+
+
+def test_touched_files_are_hashed_once(generated, monkeypatch):
+    header, output = generated
+    touch(header)
+    touch(output)
+    assert rlctbg.is_up_to_date(header, output, DEFAULTS)
+    with open(rlctbg.manifest_path(output), 'r') as src:
+        manifest = json.load(src)
+    assert manifest['header']['mtime_ns'] == os.stat(header).st_mtime_ns
+    assert manifest['outputs'][output]['mtime_ns'] == os.stat(output).st_mtime_ns
+
+    def file_digest(location):
+        raise AssertionError(f"hashed {location} again")
+
+    monkeypatch.setattr(rlctbg, 'file_digest', file_digest)
+    assert rlctbg.is_up_to_date(header, output, DEFAULTS)
+
+
+@pytest.mark.parametrize('content', ["", "{", json.dumps({'version': -1})])
+def test_unreadable_or_old_manifests_are_stale(generated, content):
+    header, output = generated
+    with open(rlctbg.manifest_path(output), 'w') as src:
+        src.write(content)
+    assert not rlctbg.is_up_to_date(header, output, DEFAULTS)
@@ -0,0 +1,84 @@
+"""`wrap_headers`: the modules of several headers share their types."""
+import importlib
+import shutil
+
+import pytest
+
+import rlctbg
+
+from conftest import HEADER, EXTENSION
+
+# an rlgl style header declaring nothing, only using the raylib types
+RLGL_HEADER = """\
+// @functions_begin
+//------------------------------------------------------------------------------------
+// Matrix operations (Module: core)
+//------------------------------------------------------------------------------------
+RLAPI Matrix rlGetMatrix(void);                         // Get the current matrix
+RLAPI void rlVertex3v(Vector3 v, Color color);          // Define a vertex
+// @functions_end
+"""
+
+
+@pytest.fixture
+def headers(package, monkeypatch):
+    """raylib.h and the rlgl style header in the package, with a stand-in
+    library exporting the functions of both."""
+    folder, name = package
+    shutil.copy(HEADER, folder / "raylib.h")
+    (folder / "rlgl.h").write_text(RLGL_HEADER)
+    header = rlctbg.load_header(str(folder / "raylib.h"))
+    header.functions += rlctbg.parse_header(str(folder / "rlgl.h")).functions
+    try:
+        source = rlctbg.write_stub(header, str(folder / "libstub.c"))
+        library = rlctbg.compile_library(source, str(folder / f"libstub{EXTENSION}"))
+    except Exception as error:
+        pytest.skip(f"unable to build the stand-in library ({error})")
+    monkeypatch.setenv('RLCTBG_LIBRARY', library)
+    return folder, name
+
+
+@pytest.mark.parametrize('split', [False, True])
+def test_used_types_are_imported(headers, split):
+    folder, name = headers
+    rlctbg.wrap_headers([str(folder / "raylib.h"), str(folder / "rlgl.h")], workers=1, split=split)
+    raylib = importlib.import_module(f"{name}.raylib")
+    rlgl = importlib.import_module(f"{name}.rlgl")
+    assert rlgl.Matrix is raylib.Matrix
+    assert rlgl.Vector3 is raylib.Vector3
+    assert isinstance(rlgl.rl_get_matrix(), raylib.Matrix)
+    rlgl.rl_vertex3v(raylib.Vector3(1, 2, 3), raylib.RED)
+
+
+def test_redeclared_types_are_shared(headers):
+    folder, name = headers
+    shutil.copy(HEADER, folder / "other.h")
+    rlctbg.wrap_headers([str(folder / "raylib.h"), str(folder / "other.h")], workers=1)
+    raylib = importlib.import_module(f"{name}.raylib")
+    other = importlib.import_module(f"{name}.other")
+    assert other.Vector2 is raylib.Vector2
+    assert other.RED is raylib.RED
+    assert isinstance(other.get_mouse_position(), raylib.Vector2)
+
+
+def test_shared_structures_have_a_dtype(headers):
+    pytest.importorskip('numpy')
+    folder, name = headers
+    rlctbg.wrap_headers([str(folder / "raylib.h"), str(folder / "rlgl.h")], workers=1)
+    raylib = importlib.import_module(f"{name}.raylib")
+    rlgl = importlib.import_module(f"{name}.rlgl")
+    assert rlgl.struct_dtype(rlgl.Matrix) == raylib.struct_dtype(raylib.Matrix)
+
+
+def test_parallel_parsing_matches_serial(tmp_path, monkeypatch):
+    paths = []
+    for i in range(3):
+        (tmp_path / str(i)).mkdir()
+        paths.append(shutil.copy(HEADER, str(tmp_path / str(i) / "raylib.h")))
+    expected = rlctbg.parse_header(HEADER).to_dict()
+    monkeypatch.setattr(rlctbg, 'usable_cpus', lambda: 2)
+    monkeypatch.setattr(rlctbg, 'PARALLEL_PARSE_SIZE', 0)
+    headers = rlctbg.parse_headers(paths, workers=2)
+    assert [header.to_dict() for header in headers] == [expected] * 3
+    # the caches written from the workers' results are valid
+    assert all(rlctbg.load_cached_header(path).to_dict() == expected for path in paths)
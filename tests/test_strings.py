@@ -0,0 +1,77 @@
+"""`char *` parameters accept str, and `decode_strings` returns str."""
+import ctypes
+import sys
+
+import pytest
+
+
+class Recorder:
+    """Stands for a foreign function: keeps the arguments of its calls."""
+
+    def __init__(self, result=None):
+        self.calls = []
+        self.result = result
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        return self.result
+
+
+def foreign(rl):
+    """The library of a binding (in `common` for a split one)."""
+    return sys.modules.get(f"{rl.__name__}.common", rl)._rl
+
+
+@pytest.mark.parametrize('options', [{}, {'lazy': True}, {'profile': True}, {'split': True}])
+def test_str_arguments_are_encoded(binding, options):
+    rl = binding(**options)
+    rl.draw_text(b'', 0, 0, 10, rl.RED)  # binds the lazy function
+    foreign(rl).DrawText = draw_text = Recorder()
+    data = b'bytes'
+    rl.draw_text(data, 1, 2, 20, rl.RED)
+    rl.draw_text('h\xe9llo', 1, 2, 20, rl.RED)
+    assert draw_text.calls[0][0] is data
+    assert draw_text.calls[1][0] == 'h\xe9llo'.encode()
+
+
+def test_str_encodings_are_cached(binding):
+    rl = binding()
+    text = 'cached'
+    assert rl._encoded(text) is rl._encoded(text)
+
+
+def test_results_stay_bytes_by_default(binding):
+    rl = binding()
+    rl._rl.TextToUpper = Recorder(b'ABC')
+    assert rl.text_to_upper('abc') == b'ABC'
+
+
+def test_decode_strings(binding):
+    rl = binding(decode_strings=True)
+    rl._rl.TextToUpper = Recorder(b'ABC')
+    assert rl.text_to_upper('abc') == 'ABC'
+    rl._rl.TextToUpper = Recorder(None)
+    assert rl.text_to_upper(b'abc') is None
+
+
+def test_memoized_variants_take_str(binding):
+    rl = binding()
+    rl._rl.MeasureText = measure_text = Recorder(42)
+    assert rl.measure_text_cached('abc', 10) == 42
+    assert rl.measure_text_cached('abc', 10) == 42
+    assert measure_text.calls == [(b'abc', 10)]
+
+
+def test_direct_functions_take_bytes(binding):
+    rl = binding(direct=True)
+    assert isinstance(rl.draw_text, ctypes._CFuncPtr)
+    with pytest.raises(ctypes.ArgumentError):
+        rl.draw_text('text', 0, 0, 10, rl.RED)
+
+
+def test_direct_decode_strings_keeps_string_wrappers(binding):
+    rl = binding(direct=True, decode_strings=True)
+    assert isinstance(rl.draw_rectangle, ctypes._CFuncPtr)
+    rl._rl.DrawText = draw_text = Recorder()
+    rl.draw_text('text', 0, 0, 10, rl.RED)
+    assert draw_text.calls[0][0] == b'text'
@@ -0,0 +1,75 @@
+"""`used_by` trims the binding to what the application references."""
+import pytest
+
+import rlctbg
+
+APP = """
+import rlctbg.raylib as rl
+
+font = rl.get_font_default()
+rl.draw_text_ex(font, b"hello", rl.Vector2(0, 0), 10.0, 1.0, rl.RED)
+"""
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Writes an application source and returns its path."""
+    def write(source, name="app.py"):
+        location = tmp_path / name
+        location.write_text(source)
+        return str(location)
+
+    return write
+
+
+def test_attribute_accesses(app):
+    assert rlctbg.find_used_names([app(APP)]) == ['RED', 'Vector2', 'draw_text_ex', 'get_font_default']
+
+
+@pytest.mark.parametrize('source', [
+    "from rlctbg import raylib as r\nr.init_window(1, 2, b'')\n",
+    "import rlctbg.raylib\nrlctbg.raylib.init_window(1, 2, b'')\n",
+    "from rlctbg.raylib import init_window\n",
+])
+def test_import_forms(app, source):
+    assert rlctbg.find_used_names([app(source)]) == ['init_window']
+
+
+def test_other_modules_are_ignored(app):
+    assert rlctbg.find_used_names([app("import os\nos.path.join('a')\n")]) == []
+
+
+def test_star_imports_keep_everything(app):
+    assert rlctbg.find_used_names([app("from rlctbg.raylib import *\n")]) is None
+
+
+def test_folders_are_scanned(app, tmp_path):
+    (tmp_path / "game").mkdir()
+    app("import rlctbg.raylib as rl\nrl.close_window()\n", "game/main.py")
+    app("not python", "game/notes.txt")
+    assert rlctbg.find_used_names([str(tmp_path / "game")]) == ['close_window']
+
+
+def test_trimmed_binding(binding, app):
+    rl = binding(used_by=[app(APP)])
+    assert {'draw_text_ex', 'get_font_default'} <= set(rl.__all__)
+    assert (rl.RED.r, rl.RED.g, rl.RED.b, rl.RED.a) == (230, 41, 55, 255)
+    # reached through the parameter and field types of draw_text_ex
+    assert {'Font', 'CharInfo', 'Texture2D', 'Image', 'Rectangle', 'Color'} <= set(rl.__all__)
+    assert not {'draw_circle', 'BLUE', 'Camera3D', 'Shader'} & set(dir(rl))
+    assert not {'CommandBuffer', 'record', 'log_calls', 'InputSnapshot'} & set(dir(rl))
+
+
+def test_referenced_runtime_features_are_kept(binding, app):
+    rl = binding(used_by=[app("import rlctbg.raylib as rl\nrl.CommandBuffer().draw_pixel(1, 2, rl.RED)\n")])
+    assert hasattr(rl, 'CommandBuffer')
+    # its methods are kept, although they are not `rl.<name>` accesses
+    assert hasattr(rl.CommandBuffer, 'draw_pixel') and hasattr(rl, 'draw_pixel')
+    assert not hasattr(rl, 'InputSnapshot')
+
+
+def test_trimmed_split_binding(binding, app):
+    rl = binding(split=True, used_by=[app(APP)])
+    assert rl.draw_text_ex is not None
+    with pytest.raises(AttributeError):
+        rl.draw_circle